@@ -0,0 +1,186 @@
+"""Measure the combine stage of a game from 4 sources.
+
+This compares the per field and schema driven merges, and the copying and
+appending grouping of the players of each team, before combining whole games.
+
+python -m benchmarks.combine_game --league NFL --games 20 --repeat 5
+"""
+
+import argparse
+import datetime
+import random
+import time
+from typing import Any
+
+import requests
+from pydantic import BaseModel
+
+from sportsball.data.combined.combined_game_model import create_combined_game_model
+from sportsball.data.combined.identity_table import IdentityTable
+from sportsball.data.combined.merge_fields import merge_fields
+from sportsball.data.combined.most_interesting import more_interesting
+from sportsball.data.game_model import GameModel
+from sportsball.data.league import League
+from sportsball.data.player_model import PlayerModel
+from sportsball.data.species import Species
+from sportsball.data.team_model import TeamModel
+
+_SOURCES = 4
+_TEAMS = 2
+_ROSTERS = {"NBA": 13, "NFL": 53}
+_FILL = 0.3
+
+
+def _model(
+    rng: random.Random, model_class: type[BaseModel], **kwargs: Any
+) -> BaseModel:
+    values: dict[str, Any] = {}
+    for name, field in model_class.model_fields.items():
+        if field.default_factory is not None:
+            continue
+        annotation = str(field.annotation)
+        value: Any = None
+        if annotation.startswith("list"):
+            value = []
+        elif rng.random() < _FILL:
+            if annotation == "int | None":
+                value = rng.randint(0, 40)
+            elif annotation == "float | None":
+                value = rng.choice([0.0, rng.random() * 40.0])
+        values[name] = value
+    values.update(kwargs)
+    return model_class.model_construct(**values)
+
+
+def _game(rng: random.Random, league: str, source: int) -> GameModel:
+    teams = []
+    for team in range(_TEAMS):
+        players = [
+            _model(
+                rng,
+                PlayerModel,
+                identifier=f"{team}-{player}",
+                name=f"Player {team} {player}",
+                species=str(Species.HUMAN),
+                version=str(source),
+            )
+            for player in range(_ROSTERS[league])
+        ]
+        teams.append(
+            _model(
+                rng,
+                TeamModel,
+                identifier=str(team),
+                name=f"Team {team}",
+                players=players,
+                version=str(source),
+            )
+        )
+    return _model(  # type: ignore
+        rng,
+        GameModel,
+        dt=datetime.datetime(2024, 1, 1, 19, 30),
+        league=str(League[league]),
+        teams=teams,
+        version=str(source),
+    )
+
+
+def _per_field(models: list[BaseModel], model_class: type[BaseModel]) -> None:
+    # One more_interesting call per field and source, as the combined models did.
+    for name, field in model_class.model_fields.items():
+        if field.default_factory is not None:
+            continue
+        value = None
+        for model in models:
+            value = more_interesting(value, getattr(model, name))
+
+
+def _schema_driven(models: list[BaseModel], model_class: type[BaseModel]) -> None:
+    merge_fields(models, model_class)
+
+
+def _merge_game(game_models: list[GameModel], merge: Any) -> None:
+    merge(game_models, GameModel)
+    for team in range(_TEAMS):
+        team_models = [x.teams[team] for x in game_models]
+        merge(team_models, TeamModel)
+        for player_models in zip(*[x.players for x in team_models]):
+            merge(list(player_models), PlayerModel)
+
+
+def _copying_groups(game_models: list[GameModel]) -> None:
+    # Each append copied the group, as the combined models did.
+    for team in range(_TEAMS):
+        players: dict[str, list[PlayerModel]] = {}
+        for game_model in game_models:
+            for player_model in game_model.teams[team].players:
+                players[player_model.identifier] = players.get(
+                    player_model.identifier, []
+                ) + [player_model]
+
+
+def _appending_groups(game_models: list[GameModel]) -> None:
+    for team in range(_TEAMS):
+        players: dict[str, list[PlayerModel]] = {}
+        for game_model in game_models:
+            for player_model in game_model.teams[team].players:
+                players.setdefault(player_model.identifier, []).append(player_model)
+
+
+def _combine_game(game_models: list[GameModel], session: requests.Session) -> None:
+    create_combined_game_model(
+        game_models=game_models,
+        venue_identities=IdentityTable("venue", {}),
+        team_identities=IdentityTable("team", {"0": "0", "1": "1"}),
+        player_identities=IdentityTable("player", {}),
+        session=session,
+        names={},
+        coach_names={},
+        last_game_number=None,
+        player_ffill={},
+        team_ffill={},
+        coach_ffill={},
+        umpire_ffill={},
+        team_players_ffill={},
+        venue_ffill={},
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--league", choices=sorted(_ROSTERS), default="NBA")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    session = requests.Session()
+
+    games = [
+        [_game(rng, args.league, x) for x in range(_SOURCES)] for _ in range(args.games)
+    ]
+    timings = {}
+    for name, func in [
+        ("per field merge", lambda x: _merge_game(x, _per_field)),
+        ("schema driven merge", lambda x: _merge_game(x, _schema_driven)),
+        ("copying groups", _copying_groups),
+        ("appending groups", _appending_groups),
+        ("combine game", lambda x: _combine_game(x, session)),
+    ]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for game_models in games:
+                func(game_models)
+        timings[name] = (time.perf_counter() - start) * 1e3 / (args.repeat * len(games))
+    print(
+        f"{args.league} game ({_SOURCES} sources, "
+        f"{_TEAMS}x{_ROSTERS[args.league]} players): "
+        + ", ".join(f"{k} {v:.2f}ms" for k, v in timings.items())
+        + " per game"
+    )
+
+
+if __name__ == "__main__":
+    main()
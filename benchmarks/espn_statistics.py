@@ -0,0 +1,77 @@
+"""Compare the if chain and table driven decoding of ESPN statistics.
+
+The if chain is reproduced by comparing each statistic name against the
+table's names in order until one matches, as the elif chains did.
+
+python -m benchmarks.espn_statistics --repeat 200
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+from typing import Any
+
+from sportsball.data.combined.most_interesting import more_interesting
+from sportsball.data.espn import espn_player_model, espn_team_model
+from sportsball.data.espn.espn_statistics import StatisticsTable
+
+_FIXTURES = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "data", "espn", "*_statistics*.json"
+)
+
+
+def _if_chain(
+    table: StatisticsTable, values: dict[str, Any], categories: list[dict[str, Any]]
+) -> None:
+    entries = list(table._statistics.items())  # pylint: disable=protected-access
+    for category in categories:
+        for stat in category["stats"]:
+            for name, entry in entries:
+                if stat["name"] == name:
+                    if entry is not None:
+                        field, reducer = entry
+                        values[field] = more_interesting(values[field], reducer(stat))
+                    break
+            else:
+                raise ValueError(f"Failed to account for statistic: {stat['name']}")
+
+
+def _table(
+    table: StatisticsTable, values: dict[str, Any], categories: list[dict[str, Any]]
+) -> None:
+    table.decode(values, categories, "benchmark")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    documents = []
+    stats = 0
+    for path in sorted(glob.glob(_FIXTURES)):
+        with open(path, encoding="utf8") as handle:
+            statistics_dict = json.load(handle)
+        module = espn_player_model if "athlete" in statistics_dict else espn_team_model
+        table = module._STATISTICS  # pylint: disable=protected-access
+        categories = statistics_dict["splits"]["categories"]
+        documents.append((table, categories))
+        stats += sum(len(x["stats"]) for x in categories)
+
+    print(f"{len(documents)} documents, {stats} statistics")
+    for name, func in [("if chain", _if_chain), ("table", _table)]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for table, categories in documents:
+                func(table, table.empty(), categories)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<10}{stats * args.repeat / elapsed:>12,.0f} statistics per second"
+        )
+
+
+if __name__ == "__main__":
+    main()
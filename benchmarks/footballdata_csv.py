@@ -0,0 +1,126 @@
+"""Compare the per row and columnar normalisation of FootballData CSVs.
+
+The repository has no fixture CSVs, so seasons are generated in the
+football-data.co.uk layout for each of the five English divisions the EPL
+model downloads, of which only the top flight passes the division filter,
+and each is normalised into the arguments of create_footballdata_game_model.
+
+python -m benchmarks.footballdata_csv --seasons 25 --repeat 3
+"""
+
+import argparse
+import csv
+import datetime
+import io
+import random
+import time
+from typing import Any
+
+from dateutil.parser import parse
+
+from sportsball.data.epl.footballdata import epl_footballdata_league_model
+
+_DIVISIONS = {"E0": 20, "E1": 24, "E2": 24, "E3": 24, "EC": 24}
+_ODDS_COLUMNS = 80
+_OPTIONAL = {
+    "Referee": "referee",
+    "HS": "home_shots",
+    "AS": "away_shots",
+    "HST": "home_shots_on_target",
+    "AST": "away_shots_on_target",
+    "HF": "home_fouls",
+    "AF": "away_fouls",
+    "HY": "home_yellow_cards",
+    "AY": "away_yellow_cards",
+    "HR": "home_red_cards",
+    "AR": "away_red_cards",
+    "B365H": "home_odds",
+    "B365A": "away_odds",
+    "B365D": "draw_odds",
+}
+
+
+def _season(rng: random.Random, year: int, division: str, teams: int) -> str:
+    header = ["Div", "Date", "Time", "HomeTeam", "AwayTeam", "FTHG", "FTAG"]
+    header += list(_OPTIONAL) + [f"Odds{x}" for x in range(_ODDS_COLUMNS)]
+    handle = io.StringIO()
+    writer = csv.writer(handle)
+    writer.writerow(header)
+    start = datetime.date(year, 8, 10)
+    for game in range(teams * (teams - 1)):
+        date = start + datetime.timedelta(days=game // 10 * 3)
+        writer.writerow(
+            [division, date.strftime("%d/%m/%Y"), f"{rng.choice([12, 15, 17])}:00"]
+            + [f"Team {rng.randrange(teams)}", f"Team {rng.randrange(teams)}"]
+            + [str(rng.randint(0, 4)), str(rng.randint(0, 4)), "M Oliver"]
+            + [str(rng.randint(0, 20)) if rng.random() > 0.1 else "" for _ in range(10)]
+            + [f"{rng.uniform(1.0, 10.0):.2f}" for _ in range(3 + _ODDS_COLUMNS)]
+        )
+    return handle.getvalue()
+
+
+def _optional(value: str | None) -> str | None:
+    if value is not None and not value:
+        return None
+    return value
+
+
+def _per_row(text: str) -> list[dict[str, Any]]:
+    # The previous normalisation, with the date parsed per row as the game model did.
+    games = []
+    for row in csv.DictReader(io.StringIO(text)):
+        div_headers = [x for x in row.keys() if x is not None and x.endswith("Div")]
+        if not div_headers or row.get(div_headers[0]) not in {"E0", "D1", "SP1"}:
+            continue
+        date = str(row["Date"]).strip()
+        if not date:
+            continue
+        game = {
+            "dt": parse(
+                " ".join([date, str(row.get("Time", "")).strip()]), dayfirst=False
+            ),
+            "home_team": str(row["HomeTeam"]).strip(),
+            "away_team": str(row["AwayTeam"]).strip(),
+            "full_time_home_goals": str(row["FTHG"]).strip(),
+            "full_time_away_goals": str(row["FTAG"]).strip(),
+            "referee": row.get("Referee"),
+        }
+        for column, name in _OPTIONAL.items():
+            if column != "Referee":
+                game[name] = _optional(row.get(column))
+        games.append(game)
+    return games
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    league_model = epl_footballdata_league_model.EPLFootballDataLeagueModel.__new__(
+        epl_footballdata_league_model.EPLFootballDataLeagueModel
+    )
+
+    texts = [
+        _season(rng, 2000 + x, division, teams)
+        for x in range(args.seasons)
+        for division, teams in _DIVISIONS.items()
+    ]
+    print(f"{args.seasons} seasons, {len(texts)} CSVs")
+    for name, func in [
+        ("per row", _per_row),
+        ("columnar", lambda x: league_model._games_frame(x).to_dict("records")),  # pylint: disable=protected-access
+    ]:
+        elapsed = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            games = sum(len(func(x)) for x in texts)
+            elapsed.append(time.perf_counter() - start)
+        print(f"{name:<10}{min(elapsed) * 1e3:>8.0f}ms {games} games")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Compare the per row and columnar ingestion of NBA API games.
+
+The repository has no LeagueGameFinder fixtures, so a frame of team game
+rows is generated for each season, with a regular season and play offs, and
+ingested a yearly window at a time, newest first, as the league model
+fetches it, up to the arguments of create_nba_nba_game_model.
+
+python -m benchmarks.nba_games --seasons 10 --repeat 3
+"""
+
+import argparse
+import datetime
+import random
+import time
+from typing import Any
+
+import pandas as pd
+from dateutil.parser import parse
+
+from sportsball.data.nba.nba import nba_nba_league_model
+
+_TEAMS = 30
+_STATS = [
+    "PTS",
+    "FGM",
+    "FGA",
+    "FG_PCT",
+    "FG3M",
+    "FG3A",
+    "FG3_PCT",
+    "FTM",
+    "FTA",
+    "FT_PCT",
+    "OREB",
+    "DREB",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PLUS_MINUS",
+]
+
+
+def _season(rng: random.Random, year: int) -> list[dict[str, Any]]:
+    rows = []
+    for season_type, start, games in [
+        ("2", datetime.date(year, 10, 22), _TEAMS * 41),
+        ("4", datetime.date(year + 1, 4, 19), 80),
+    ]:
+        for game in range(games):
+            date = start + datetime.timedelta(days=game * 170 // games)
+            teams = rng.sample(range(_TEAMS), 2)
+            for team, other, matchup, wl in [
+                (teams[0], teams[1], "vs.", "W"),
+                (teams[1], teams[0], "@", "L"),
+            ]:
+                row = {
+                    "SEASON_ID": f"{season_type}{year}",
+                    "TEAM_ID": 1610612700 + team,
+                    "TEAM_ABBREVIATION": f"T{team:02d}",
+                    "TEAM_NAME": f"Team {team}",
+                    "GAME_ID": f"00{season_type}{year % 100:02d}{game:05d}",
+                    "GAME_DATE": date.isoformat(),
+                    "MATCHUP": f"T{team:02d} {matchup} T{other:02d}",
+                    "WL": wl,
+                    "MIN": 240,
+                }
+                row.update({x: float(rng.randint(0, 120)) for x in _STATS})
+                rows.append(row)
+    return rows
+
+
+def _windows(df: pd.DataFrame) -> list[pd.DataFrame]:
+    dates = pd.to_datetime(df["GAME_DATE"])
+    to_date = dates.max()
+    windows = []
+    while to_date >= dates.min():
+        next_date = to_date - pd.DateOffset(years=1)
+        windows.append(df[(dates > next_date) & (dates <= to_date)])
+        to_date = next_date
+    return windows
+
+
+def _per_row(
+    window: pd.DataFrame, seasons: dict[str, Any]
+) -> list[tuple[Any, datetime.datetime, int, int]]:
+    # The previous ingestion, a self join of the whole window and a row at a time.
+    joined = pd.merge(
+        window, window, suffixes=["_A", "_B"], on=["SEASON_ID", "GAME_ID", "GAME_DATE"]
+    )
+    result = joined[joined.TEAM_ID_A != joined.TEAM_ID_B]
+    result = result[result.MATCHUP_A.str.contains(" vs. ")]
+    result = result.sort_values(by="GAME_DATE", ascending=True, kind="stable")
+    games = []
+    for _, row in result.iterrows():
+        season_id = row["SEASON_ID"]
+        dt = parse(row["GAME_DATE"])
+        season_info = seasons.get(season_id, {"start": dt, "games": 0})
+        week = int((dt - season_info["start"]).days / 7)
+        games.append((row, dt, week, season_info["games"]))
+        season_info["games"] += 1
+        seasons[season_id] = season_info
+    return games
+
+
+def _columnar(
+    window: pd.DataFrame, seasons: dict[str, Any]
+) -> list[tuple[Any, datetime.datetime, int, int]]:
+    # pylint: disable=protected-access
+    result = nba_nba_league_model._combine_team_games(window)
+    result = result.sort_values(by="GAME_DATE", ascending=True, kind="stable")
+    return list(nba_nba_league_model._game_records(result, seasons))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    df = pd.DataFrame(
+        [x for year in range(2000, 2000 + args.seasons) for x in _season(rng, year)]
+    )
+    windows = _windows(df)
+    print(f"{args.seasons} seasons, {len(df)} team rows, {len(windows)} windows")
+    results = {}
+    for name, func in [("per row", _per_row), ("columnar", _columnar)]:
+        elapsed = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            seasons: dict[str, Any] = {}
+            results[name] = [x for window in windows for x in func(window, seasons)]
+            elapsed.append(time.perf_counter() - start)
+        print(f"{name:<10}{min(elapsed) * 1e3:>8.0f}ms {len(results[name])} games")
+    if [x[1:] for x in results["per row"]] != [x[1:] for x in results["columnar"]]:
+        raise ValueError("The columnar games differ from the per row games.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare the row-wise and vectorised timezone normalisation.
+
+python -m benchmarks.normalize_tz --rows 50000 --columns 5000
+"""
+
+import argparse
+import datetime
+import time
+
+import numpy as np
+import pandas as pd
+import tqdm
+
+from sportsball.data.address_model import ADDRESS_TIMEZONE_COLUMN
+from sportsball.data.delimiter import DELIMITER
+from sportsball.data.game_model import GAME_DT_COLUMN, VENUE_COLUMN_PREFIX
+from sportsball.data.league_model import _normalize_tz
+from sportsball.data.venue_model import VENUE_ADDRESS_COLUMN
+
+_TZ_COLUMN = DELIMITER.join(
+    [VENUE_COLUMN_PREFIX, VENUE_ADDRESS_COLUMN, ADDRESS_TIMEZONE_COLUMN]
+)
+_TIMEZONES = [
+    "America/New_York",
+    "America/Chicago",
+    "America/Los_Angeles",
+    "Australia/Sydney",
+    "Europe/London",
+]
+
+
+def _old_normalize_tz(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.dropna(subset=_TZ_COLUMN)
+    tqdm.tqdm.pandas(desc="Timezone Conversions")
+
+    def apply_tz(row: pd.Series) -> pd.Series:
+        tz = row[_TZ_COLUMN]
+        if pd.isnull(tz):
+            return row
+        datetime_cols = {
+            col for col, val in row.items() if isinstance(val, pd.Timestamp)
+        }
+        datetime_cols.add(GAME_DT_COLUMN)
+        for col in datetime_cols:
+            dt = row[col]
+            if isinstance(dt, (datetime.date, datetime.datetime)):
+                dt = pd.to_datetime(dt)
+            if dt.tz is None:
+                row[col] = dt.tz_localize(
+                    tz, ambiguous=True, nonexistent="shift_forward"
+                )
+            elif str(dt.tz) != str(tz):
+                row[col] = dt.tz_convert(tz)
+        return row
+
+    return df.progress_apply(apply_tz, axis=1)  # type: ignore
+
+
+def _frame(rows: int, columns: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2020-01-01", tz="UTC")
+    data = {
+        GAME_DT_COLUMN: start
+        + pd.to_timedelta(rng.integers(0, 4 * 365 * 24, rows), unit="h"),
+        "teams/0/birth_date": start
+        - pd.to_timedelta(rng.integers(0, 20 * 365, rows), unit="D"),
+        _TZ_COLUMN: rng.choice(_TIMEZONES, rows),
+    }
+    for i in range(columns - len(data)):
+        data[f"teams/0/players/{i // 50}/stat_{i % 50}"] = rng.random(rows, dtype=np.float32)
+    return pd.DataFrame(data)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--columns", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--skip-old", action="store_true", help="Only time the vectorised path."
+    )
+    args = parser.parse_args()
+    df = _frame(args.rows, args.columns, args.seed)
+
+    start = time.perf_counter()
+    new_df = _normalize_tz(df)
+    print(f"vectorised: {time.perf_counter() - start:.2f}s")
+    if args.skip_old:
+        return
+
+    start = time.perf_counter()
+    old_df = _old_normalize_tz(df)
+    print(f"row-wise: {time.perf_counter() - start:.2f}s")
+    for col in [GAME_DT_COLUMN, "teams/0/birth_date"]:
+        if old_df[col].tolist() != new_df[col].tolist():
+            raise ValueError(f"{col} differs between the two paths.")
+
+
+if __name__ == "__main__":
+    main()
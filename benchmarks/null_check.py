@@ -0,0 +1,69 @@
+"""Compare the exception driven and type dispatched null checks.
+
+python -m benchmarks.null_check --number 200000
+"""
+
+import argparse
+import datetime
+import timeit
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from sportsball.data.combined.most_interesting import more_interesting
+from sportsball.data.combined.null_check import is_null
+from sportsball.data.venue_model import VERSION, VenueModel
+
+
+def _old_is_null(obj: Any) -> bool:
+    # The previous implementation, which raised and caught for most types.
+    if obj is None:
+        return True
+    try:
+        if np.isnan(obj):
+            return True
+    except (TypeError, ValueError):
+        pass
+    try:
+        if np.isnat(obj):
+            return True
+    except TypeError:
+        pass
+    return False
+
+
+_VALUES = {
+    "None": None,
+    "int": 42,
+    "float": 4.2,
+    "NaN": float("nan"),
+    "str": "Melbourne Cricket Ground",
+    "datetime": datetime.datetime(2024, 1, 1, 19, 30),
+    "NaT": pd.NaT,
+    "datetime64 NaT": np.datetime64("NaT"),
+    "model": VenueModel.model_construct(identifier="mcg", version=VERSION),
+}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"{'value':<16}{'old':>10}{'new':>10}{'speedup':>10}  (ns per call)")
+    for name, value in _VALUES.items():
+        old = timeit.timeit(lambda: _old_is_null(value), number=args.number)  # pylint: disable=cell-var-from-loop
+        new = timeit.timeit(lambda: is_null(value), number=args.number)  # pylint: disable=cell-var-from-loop
+        print(
+            f"{name:<16}{old * 1e9 / args.number:>10.0f}"
+            f"{new * 1e9 / args.number:>10.0f}{old / new:>9.1f}x"
+        )
+    pair = (4.2, 0.0)
+    merge = timeit.timeit(lambda: more_interesting(*pair), number=args.number)
+    print(f"more_interesting(float, float): {merge * 1e9 / args.number:.0f}ns per call")
+
+
+if __name__ == "__main__":
+    main()
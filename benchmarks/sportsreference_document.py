@@ -0,0 +1,82 @@
+"""Compare parsing Sports Reference pages per model and once per page.
+
+Each game parses its box score and the season pages of both of its teams,
+which every other game of those teams' seasons parses again.
+
+python -m benchmarks.sportsreference_document --games 10
+"""
+
+import argparse
+import io
+import os
+import time
+
+import extruct  # type: ignore
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from sportsball.data.sportsreference import sportsreference_document
+
+_FIXTURES = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "data", "sportsreference"
+)
+_BOX_SCORE = (
+    "https://www.basketball-reference.com/boxscores/202501230ATL.html",
+    "202501230ATL.html",
+)
+_TEAMS = [
+    ("https://www.basketball-reference.com/teams/ATL/2025.html", "ATL_2025.html"),
+    ("https://www.basketball-reference.com/teams/TOR/2025.html", "TOR_2025.html"),
+]
+
+
+def _response(url: str, filename: str, game: int | None = None) -> requests.Response:
+    response = requests.Response()
+    with open(os.path.join(_FIXTURES, filename), "rb") as handle:
+        content = handle.read()
+    if game is not None:
+        # A different box score for every game.
+        content += f"<!-- {game} -->".encode()
+    response._content = content  # pylint: disable=protected-access
+    response.url = url
+    response.encoding = "utf8"
+    response.status_code = 200
+    return response
+
+
+def _per_model(box_score: requests.Response, teams: list[requests.Response]) -> None:
+    BeautifulSoup(box_score.text, "lxml")
+    pd.read_html(io.StringIO(box_score.text))
+    for team in teams:
+        BeautifulSoup(team.text, "lxml")
+        extruct.extract(team.text, base_url=team.url)
+
+
+def _per_page(box_score: requests.Response, teams: list[requests.Response]) -> None:
+    document = sportsreference_document.parse_sportsreference_document(box_score)
+    _ = document.soup
+    _ = document.tables
+    for team in teams:
+        document = sportsreference_document.parse_sportsreference_document(team)
+        _ = document.soup
+        document.structured_data(team.url)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=10)
+    args = parser.parse_args()
+
+    teams = [_response(*x) for x in _TEAMS]
+    for name, func in [("per model", _per_model), ("per page", _per_page)]:
+        start = time.perf_counter()
+        for game in range(args.games):
+            func(_response(*_BOX_SCORE, game), teams)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<10}{elapsed * 1e3 / args.games:>8.0f}ms per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Compare loading a results workbook in full and streaming it read only.
+
+The repository has no fixture workbooks, so a yearly tennis-data.co.uk style
+workbook of matches is generated, with a date format and fonts on its cells.
+
+python -m benchmarks.spreadsheet --rows 3000 --repeat 3
+"""
+
+import argparse
+import datetime
+import random
+import time
+import tracemalloc
+from io import BytesIO
+from typing import Any, Callable, Iterator
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from sportsball.data.spreadsheet import iter_spreadsheet_rows
+
+_HEADER = [
+    "ATP",
+    "Location",
+    "Tournament",
+    "Date",
+    "Series",
+    "Court",
+    "Surface",
+    "Round",
+    "Best of",
+    "Winner",
+    "Loser",
+    "WRank",
+    "LRank",
+    "WPts",
+    "LPts",
+    "W1",
+    "L1",
+    "W2",
+    "L2",
+    "W3",
+    "L3",
+    "W4",
+    "L4",
+    "W5",
+    "L5",
+    "Wsets",
+    "Lsets",
+    "Comment",
+    "B365W",
+    "B365L",
+    "PSW",
+    "PSL",
+    "MaxW",
+    "MaxL",
+    "AvgW",
+    "AvgL",
+]
+
+
+def _workbook(rng: random.Random, rows: int) -> bytes:
+    workbook = Workbook()
+    ws = workbook.active
+    ws.append(_HEADER)
+    font = Font(name="Arial", size=10)
+    for row in range(rows):
+        ws.append(
+            [
+                row // 30 + 1,
+                "Melbourne",
+                "Australian Open",
+                datetime.datetime(2024, 1, 1) + datetime.timedelta(days=row // 30),
+                "Grand Slam",
+                "Outdoor",
+                "Hard",
+                "1st Round",
+                5,
+                f"Player {rng.randint(0, 500)}",
+                f"Player {rng.randint(0, 500)}",
+                rng.randint(1, 500),
+                rng.randint(1, 500),
+                rng.randint(0, 10000),
+                rng.randint(0, 10000),
+            ]
+            + [rng.randint(0, 7) for _ in range(10)]
+            + [3, rng.randint(0, 2), "Completed"]
+            + [round(rng.uniform(1.01, 10.0), 2) for _ in range(8)]
+        )
+    for cells in ws.iter_rows(min_row=2):
+        cells[3].number_format = "dd/mm/yyyy"
+        for cell in cells:
+            cell.font = font
+    handle = BytesIO()
+    workbook.save(handle)
+    return handle.getvalue()
+
+
+def _full(content: bytes) -> Iterator[tuple[Any, ...]]:
+    # The previous ingestion, loading every cell and its style up front.
+    ws = load_workbook(filename=BytesIO(content)).active
+    for row in ws.iter_rows():  # type: ignore
+        yield tuple(x.value for x in row)
+
+
+def _measure(
+    func: Callable[[bytes], Iterator[tuple[Any, ...]]], content: bytes, repeat: int
+) -> tuple[float, float]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _ in func(content):
+            pass
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    for _ in func(content):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    content = _workbook(random.Random(args.seed), args.rows)
+    print(f"{args.rows} rows, {len(content) / 1e6:.1f}MB workbook")
+    for name, func in [("full", _full), ("read only", iter_spreadsheet_rows)]:
+        elapsed, peak = _measure(func, content, args.repeat)
+        print(f"{name:<10}{elapsed * 1e3:>8.0f}ms {peak / 1e6:>8.1f}MB peak")
+
+
+if __name__ == "__main__":
+    main()
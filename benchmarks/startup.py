@@ -0,0 +1,90 @@
+"""Measure the imports the CLI needs before it starts crawling a league.
+
+python -m benchmarks.startup --league nfl
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+from sportsball.data.league import League
+
+_HEAVY_PACKAGES = [
+    "dateparser",
+    "gender_guesser",
+    "nba_api",
+    "openpyxl",
+    "playwright",
+    "timezonefinder",
+    "tweepy",
+    "wikipediaapi",
+]
+
+
+def _import_times(code: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return elapsed, modules
+
+
+def _report(label: str, code: str, top: int) -> None:
+    elapsed, modules = _import_times(code)
+    total = sum(x[0] for x in modules.values()) / 1e6
+    print(
+        f"{label}: {elapsed:.2f}s wall, {total:.2f}s importing {len(modules)} modules"
+    )
+    heavy = [x for x in _HEAVY_PACKAGES if x in modules]
+    print(f"  heavy packages: {', '.join(heavy) if heavy else 'none'}")
+    for name, (self_us, _) in sorted(
+        modules.items(), key=lambda x: x[1][0], reverse=True
+    )[:top]:
+        print(f"  {self_us / 1e3:8.1f}ms {name}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--league", default=str(League.NFL))
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Also time importing every league, as the CLI used to.",
+    )
+    args = parser.parse_args()
+
+    _report(
+        args.league,
+        "import sportsball.__main__\n"
+        "from sportsball.data.league import League\n"
+        "from sportsball.sportsball import league_model_class\n"
+        f"league_model_class(League({args.league!r}))",
+        args.top,
+    )
+    if args.all:
+        _report(
+            "all leagues",
+            "import sportsball.__main__\n"
+            "from sportsball.data.league import League\n"
+            "from sportsball.sportsball import league_model_class\n"
+            "for league in League:\n"
+            "    league_model_class(league)",
+            args.top,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compare the per stat and single pass roster aggregation of a team.
+
+python -m benchmarks.team_roster_aggregation --rosters 100 --repeat 20
+"""
+
+import argparse
+import operator
+import random
+import time
+from typing import Any, Callable
+
+from sportsball.data.player_model import PlayerModel
+from sportsball.data.team_model import _ROSTER_STATS, VERSION, TeamModel, sum_roster
+
+_ROSTERS = {"NBA": 13, "NFL": 46}
+
+
+def _old_sum_roster(players: list[PlayerModel]) -> dict[str, Any]:
+    # One walk of the roster per stat, as each default factory used to do.
+    totals: dict[str, Any] = {}
+    for stat in _ROSTER_STATS:
+        total = 0
+        found = False
+        getter = operator.attrgetter(stat)
+        for player in players:
+            value = getter(player)
+            if value is None:
+                continue
+            found = True
+            total += value
+        totals[stat] = total if found else None
+    return totals
+
+
+def _player(rng: random.Random, i: int) -> PlayerModel:
+    values: dict[str, Any] = dict.fromkeys(PlayerModel.model_fields)
+    values.update({"identifier": str(i), "name": f"Player {i}", "species": "human"})
+    for stat in _ROSTER_STATS:
+        if rng.random() < 0.7:
+            values[stat] = rng.randint(0, 10)
+    return PlayerModel.model_construct(**values)
+
+
+def _team(players: list[PlayerModel]) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for name, field in TeamModel.model_fields.items():
+        if not field.is_required():
+            continue
+        key = field.alias or name
+        data[key] = [] if "list" in str(field.annotation) else None
+    data.update(
+        {"identifier": "A", "name": "A", "players": players, "version": VERSION}
+    )
+    return data
+
+
+def _time(func: Callable[[Any], Any], values: list[Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in values:
+            func(value)
+    return (time.perf_counter() - start) * 1e6 / (repeat * len(values))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rosters", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    for league, size in _ROSTERS.items():
+        rosters = [[_player(rng, i) for i in range(size)] for _ in range(args.rosters)]
+        if [_old_sum_roster(x) for x in rosters] != [sum_roster(x) for x in rosters]:
+            raise ValueError(f"{league} totals differ between the two paths.")
+        teams = [_team(x) for x in rosters]
+        timings = {
+            "per stat": _time(_old_sum_roster, rosters, args.repeat),
+            "single pass": _time(sum_roster, rosters, args.repeat),
+            "team construction": _time(TeamModel.model_validate, teams, args.repeat),
+        }
+        print(
+            f"{league} ({size} players): "
+            + ", ".join(f"{k} {v:.1f}us" for k, v in timings.items())
+            + " per team"
+        )
+
+
+if __name__ == "__main__":
+    main()
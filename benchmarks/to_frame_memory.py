@@ -0,0 +1,79 @@
+"""Compare the peak memory of building a league frame from rows.
+
+The old path held every flattened game in a list and then probed every column
+for every row, the new path streams rows into a FrameBuilder.
+
+    python -m benchmarks.to_frame_memory --games 20000 --columns 2000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator
+
+import pandas as pd
+
+from sportsball.data.frame_builder import FrameBuilder
+
+
+def _games(games: int, columns: int, seed: int) -> Iterator[dict[str, Any]]:
+    rng = random.Random(seed)
+    for i in range(games):
+        row: dict[str, Any] = {"dt": i, "venue/name": f"venue-{i % 50}"}
+        # Later games have columns the early games never saw.
+        width = columns * (i + 1) // games
+        for col in rng.sample(range(max(width, 1)), k=min(width, 200)):
+            row[f"teams/0/players/{col // 20}/stat_{col % 20}"] = rng.random()
+        yield row
+
+
+def _old_path(rows: Iterator[dict[str, Any]]) -> pd.DataFrame:
+    jsonl: list[dict[str, Any]] = []
+    cols: set[str] = set()
+    for row in rows:
+        jsonl.append(row)
+        cols |= set(row.keys())
+    data: dict[str, Any] = {x: [] for x in cols}
+    for json_dict in jsonl:
+        for col in cols:
+            data[col].append(json_dict.get(col))
+    return pd.DataFrame(data)
+
+
+def _new_path(rows: Iterator[dict[str, Any]]) -> pd.DataFrame:
+    builder = FrameBuilder()
+    for row in rows:
+        builder.append(row)
+    return pd.DataFrame(builder.build())
+
+
+def _measure(
+    name: str, func: Callable[[Iterator[dict[str, Any]]], pd.DataFrame], args
+) -> pd.DataFrame:
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = func(_games(args.games, args.columns, args.seed))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name}: peak {peak / 1024**2:.1f}MB in {elapsed:.2f}s, shape {df.shape}")
+    return df
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    old_df = _measure("old", _old_path, args)
+    new_df = _measure("new", _new_path, args)
+    pd.testing.assert_frame_equal(
+        old_df[sorted(old_df.columns)], new_df[sorted(new_df.columns)]
+    )
+
+
+if __name__ == "__main__":
+    main()
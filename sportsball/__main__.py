@@ -1,16 +1,20 @@
 """The CLI for executing the data harvesting."""
 
 import datetime
-import io
 import logging
 import sys
 from contextlib import redirect_stdout
 
-from . import __VERSION__
+from . import __VERSION__, prefetch
 from .args import parse_args
+from .cache import log_keyed_cache_stats
 from .data import league_model
 from .data.league import league_from_str
+from .incremental import (changed_partitions, merge_frames, read_previous,
+                          since_date)
 from .logger import setup_logger
+from .parquet_writer import write_dataset, write_parquet
+from .playwright import log_browser_pool_stats
 from .sportsball import SportsBall
 
 _STDOUT_FILE = "-"
@@ -21,6 +25,8 @@ def main() -> None:
     with redirect_stdout(sys.stderr):
         args = parse_args()
         setup_logger()
+        if args.dataset and args.file == _STDOUT_FILE:
+            raise ValueError("A dataset can't be written to stdout.")
 
         logging.info("--- sportsball %s ---", __VERSION__)
 
@@ -29,17 +35,51 @@ def main() -> None:
                 seconds=args.timeout
             )
 
+        prefetch.MAX_IN_FLIGHT = args.maxinflight
+        prefetch.REQUESTS_PER_SECOND = args.requestspersecond
+
+        previous = None
+        since = None
+        clear_partitions = None
+        if args.incremental and args.file != _STDOUT_FILE:
+            previous = read_previous(args.file)
+            if previous is not None:
+                since = since_date(previous, args.lookback)
+            if since is not None:
+                logging.info("Crawling games from %s onwards.", since)
+                # Games on the day before may still fall on the since date in UTC.
+                league_model.SINCE_DATE = since - datetime.timedelta(days=1)
+
         ball = SportsBall()
         league = ball.league(league_from_str(args.league), args.leaguemodel)
         df = league.to_frame()
-        handle = io.BytesIO()
-        df.to_parquet(handle, compression="gzip")
-        handle.seek(0)
+        log_keyed_cache_stats()
+        log_browser_pool_stats()
+        if previous is not None and since is not None:
+            merged = merge_frames(previous, df, since)
+            if args.dataset:
+                # Only the partitions holding games since the cut are rewritten.
+                df, clear_partitions = changed_partitions(
+                    merged, previous, df, since, args.partition
+                )
+            else:
+                df = merged
+            del merged
+        del previous
+
+        if args.dataset:
+            write_dataset(
+                df,
+                args.file,
+                partition_cols=args.partition,
+                row_group_size=args.rowgroupsize,
+                clear_partitions=clear_partitions,
+            )
+            return
     if args.file == _STDOUT_FILE:
-        sys.stdout.buffer.write(handle.getbuffer())
+        write_parquet(df, sys.stdout.buffer, row_group_size=args.rowgroupsize)
     else:
-        with open(args.file, "wb") as fhandle:
-            fhandle.write(handle.getbuffer())
+        write_parquet(df, args.file, row_group_size=args.rowgroupsize)
 
 
 if __name__ == "__main__":
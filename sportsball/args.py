@@ -3,7 +3,10 @@
 import argparse
 
 from .data.league import League
+from .incremental import DEFAULT_LOOKBACK_DAYS
 from .loglevel import LogLevel
+from .parquet_writer import DEFAULT_PARTITION_COLS, DEFAULT_ROW_GROUP_SIZE
+from .prefetch import DEFAULT_MAX_IN_FLIGHT, DEFAULT_REQUESTS_PER_SECOND
 
 STDOUT_FILE = "-"
 
@@ -34,6 +37,46 @@ def parse_args() -> argparse.Namespace:
         help="The timeout to use (in seconds).",
         type=int,
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only crawl games newer than those already in the output file.",
+    )
+    parser.add_argument(
+        "--lookback",
+        default=DEFAULT_LOOKBACK_DAYS,
+        help="The days before the newest exported game to crawl again when incremental.",
+        type=int,
+    )
+    parser.add_argument(
+        "--dataset",
+        action="store_true",
+        help="Write a Hive partitioned parquet dataset directory instead of a single file.",
+    )
+    parser.add_argument(
+        "--partition",
+        nargs="*",
+        default=DEFAULT_PARTITION_COLS,
+        help="The columns to partition a dataset by.",
+    )
+    parser.add_argument(
+        "--rowgroupsize",
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help="The number of games in each parquet row group.",
+        type=int,
+    )
+    parser.add_argument(
+        "--maxinflight",
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help="The most requests a league model prefetches at once.",
+        type=int,
+    )
+    parser.add_argument(
+        "--requestspersecond",
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help="The most requests a league model makes to one host a second (0 for no limit).",
+        type=float,
+    )
     parser.add_argument(
         "file",
         default=STDOUT_FILE,
@@ -1,5 +1,118 @@
 """Caching utilities."""
 
+import functools
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+import joblib  # type: ignore
 from joblib import Memory  # type: ignore
 
 MEMORY = Memory(".sportsball_cache", verbose=0, compress=True)
+_SAMPLE_EVERY = 100
+_UNHASHED_ARGS = {"session"}
+_STATS_LOCK = threading.Lock()
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class KeyedCacheStats:
+    """Statistics on how much hashing a keyed cache has skipped."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.sampled_calls = 0
+        self.sampled_seconds = 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """An estimate of the hashing time saved by ignoring the bulky arguments."""
+        if not self.sampled_calls:
+            return 0.0
+        return self.sampled_seconds / self.sampled_calls * self.calls
+
+
+_STATS: dict[str, KeyedCacheStats] = {}
+
+
+def _sample_ignored_hash(
+    stats: KeyedCacheStats, ignored: list[str], args: tuple, kwargs: dict, sig: Any
+) -> None:
+    bound = sig.bind_partial(*args, **kwargs)
+    payload = {
+        k: v
+        for k, v in bound.arguments.items()
+        if k in ignored and k not in _UNHASHED_ARGS
+    }
+    start = time.perf_counter()
+    try:
+        joblib.hash(payload)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return
+    elapsed = time.perf_counter() - start
+    with _STATS_LOCK:
+        stats.sampled_calls += 1
+        stats.sampled_seconds += elapsed
+
+
+def keyed_cache(*key: str) -> Callable[[_F], _F]:
+    """Cache a function in MEMORY on only the declared key arguments.
+
+    Every other argument is left out of the joblib hash, so the key must
+    determine the result entirely, usually through a URL, identifier, dt and
+    version.
+    """
+
+    def decorator(func: _F) -> _F:
+        sig = inspect.signature(func)
+        missing = set(key) - set(sig.parameters)
+        if missing:
+            raise ValueError(
+                f"Cache key {sorted(missing)} not in arguments of {func.__name__}"
+            )
+        ignored = [x for x in sig.parameters if x not in key]
+        memorized = MEMORY.cache(func, ignore=ignored)
+        stats = KeyedCacheStats()
+        _STATS[f"{func.__module__}.{func.__qualname__}"] = stats
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _STATS_LOCK:
+                stats.calls += 1
+                sample = stats.calls % _SAMPLE_EVERY == 1
+            if sample:
+                _sample_ignored_hash(stats, ignored, args, kwargs, sig)
+            return memorized(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def cache_key(url: str | None, payload: Any) -> str:
+    """The URL a payload was fetched from, or a hash of it if there isn't one."""
+    if url:
+        return url
+    return joblib.hash(payload)
+
+
+def keyed_cache_stats() -> dict[str, KeyedCacheStats]:
+    """The statistics of every keyed cache, by function name."""
+    return dict(_STATS)
+
+
+def log_keyed_cache_stats() -> None:
+    """Log the hashing time each keyed cache has saved."""
+    for name, stats in sorted(_STATS.items()):
+        if not stats.calls:
+            continue
+        logging.info(
+            "%s: %d calls, ~%.3fs of argument hashing skipped.",
+            name,
+            stats.calls,
+            stats.saved_seconds,
+        )
@@ -6,10 +6,9 @@ import re
 
 import pytest_is_running
 from bs4 import BeautifulSoup, Tag
-from playwright.sync_api import Playwright
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
-from ....playwright import ensure_install
+from ....playwright import BROWSER_POOL
 from ...game_model import GameModel
 from ...league import League
 from ...team_model import VERSION
@@ -123,22 +122,19 @@ def create_afl_afl_game_model(
     session: ScrapeSession,
     ladder: list[str],
     url: str | None,
-    playwright: Playwright,
     version: str,
     umpires: list[str],
 ) -> GameModel:
     """Create a game model from AFL Tables."""
     odds: list[float] = []
     if url is not None and not pytest_is_running.is_running():
-        ensure_install()
-        browser = playwright.chromium.launch()
-        context = browser.new_context()
-        page = context.new_page()
-        try:
-            page.goto(url + "#line-ups", wait_until="networkidle")
-        except:  # noqa: E722
-            pass
-        odds, dt, players = _parse(page.content(), players, url)
+        with BROWSER_POOL.page() as page:
+            try:
+                page.goto(url + "#line-ups", wait_until="networkidle")
+            except:  # noqa: E722
+                pass
+            html = page.content()
+        odds, dt, players = _parse(html, players, url)
     if dt is None:
         raise ValueError("dt is null")
 
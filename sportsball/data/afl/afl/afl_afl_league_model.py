@@ -9,10 +9,9 @@ from typing import Iterator
 
 from bs4 import BeautifulSoup, Tag
 from dateutil.parser import parse
-from playwright.sync_api import Playwright, sync_playwright
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
-from ....playwright import ensure_install
+from ....playwright import BROWSER_POOL
 from ...game_model import VERSION, GameModel
 from ...league import League
 from ...league_model import SHUTDOWN_FLAG, LeagueModel, needs_shutdown
@@ -25,7 +24,6 @@ def _parse_v1(
     session: ScrapeSession,
     ladder: list[str],
     html_url: str,
-    playwright: Playwright,
 ) -> Iterator[GameModel]:
     for div in soup.find_all("div", {"class": re.compile(".*js-match-list-item.*")}):
         if needs_shutdown():
@@ -68,7 +66,6 @@ def _parse_v1(
             session=session,
             ladder=ladder,
             url=url,
-            playwright=playwright,
             version=VERSION,
             umpires=[],
         )
@@ -161,7 +158,6 @@ def _parse_v2(
     session: ScrapeSession,
     ladder: list[str],
     html_url: str,
-    playwright: Playwright,
 ) -> Iterator[GameModel]:
     for team_names, team_players, venue_name, url, umpires in _parse_v2_soup(
         soup, html_url
@@ -174,7 +170,6 @@ def _parse_v2(
             session=session,
             ladder=ladder,
             url=url,
-            playwright=playwright,
             version=VERSION,
             umpires=umpires,
         )
@@ -185,15 +180,14 @@ def _parse_game_info(
     session: ScrapeSession,
     ladder: list[str],
     html_url: str,
-    playwright: Playwright,
 ) -> Iterator[GameModel]:
     soup = BeautifulSoup(html, "lxml")
     found = False
-    for game_model in _parse_v1(soup, session, ladder, html_url, playwright):
+    for game_model in _parse_v1(soup, session, ladder, html_url):
         found = True
         yield game_model
     if not found:
-        yield from _parse_v2(soup, session, ladder, html_url, playwright)
+        yield from _parse_v2(soup, session, ladder, html_url)
 
 
 class AFLAFLLeagueModel(LeagueModel):
@@ -209,11 +203,7 @@ class AFLAFLLeagueModel(LeagueModel):
     @property
     def _ladder(self) -> list[str]:
         ladder = []
-        ensure_install()
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            context = browser.new_context()
-            page = context.new_page()
+        with BROWSER_POOL.page() as page:
             try:
                 page.goto(
                     "https://www.afl.com.au/ladder",
@@ -223,30 +213,25 @@ class AFLAFLLeagueModel(LeagueModel):
             except:  # noqa: E722
                 pass
             soup = BeautifulSoup(page.content(), "lxml")
-            for span in soup.find_all(
-                "span", {"class": re.compile(".*stats-table__club-name.*")}
-            ):
-                team_name = span.get_text().strip()
-                if team_name in ladder:
-                    continue
-                ladder.append(team_name)
-            logging.info("Found ladder: %s", ",".join(ladder))
+        for span in soup.find_all(
+            "span", {"class": re.compile(".*stats-table__club-name.*")}
+        ):
+            team_name = span.get_text().strip()
+            if team_name in ladder:
+                continue
+            ladder.append(team_name)
+        logging.info("Found ladder: %s", ",".join(ladder))
         return ladder
 
     @property
     def games(self) -> Iterator[GameModel]:
         try:
             ladder = self._ladder
-            ensure_install()
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                context = browser.new_context()
-                page = context.new_page()
-                url = "https://www.afl.com.au/matches/team-lineups"
+            url = "https://www.afl.com.au/matches/team-lineups"
+            with BROWSER_POOL.page() as page:
                 page.goto(url, wait_until="load")
-                yield from _parse_game_info(
-                    page.content(), self.session, ladder, url, p
-                )
+                html = page.content()
+            yield from _parse_game_info(html, self.session, ladder, url)
         except Exception as exc:
             SHUTDOWN_FLAG.set()
             raise exc
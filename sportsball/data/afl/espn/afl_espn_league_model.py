@@ -13,8 +13,21 @@ _SEASON_URL = "https://sports.core.api.espn.com/v2/sports/australian-football/le
 class AFLESPNLeagueModel(ESPNLeagueModel):
     """AFL ESPN implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(_SEASON_URL, League.AFL, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        max_in_flight: int | None = None,
+        requests_per_second: float | None = None,
+    ) -> None:
+        super().__init__(
+            _SEASON_URL,
+            League.AFL,
+            session,
+            position=position,
+            max_in_flight=max_in_flight,
+            requests_per_second=requests_per_second,
+        )
 
     @classmethod
     def name(cls) -> str:
@@ -1,5 +1,7 @@
 """ATP ESPN league model."""
 
+import datetime
+
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...espn.espn_league_model import ESPNLeagueModel
@@ -13,8 +15,21 @@ _SEASON_URL = (
 class ATPESPNLeagueModel(ESPNLeagueModel):
     """ATP ESPN implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(_SEASON_URL, League.ATP, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        max_in_flight: int | None = None,
+        requests_per_second: float | None = None,
+    ) -> None:
+        super().__init__(
+            _SEASON_URL,
+            League.ATP,
+            session,
+            position=position,
+            max_in_flight=max_in_flight,
+            requests_per_second=requests_per_second,
+        )
 
     @classmethod
     def name(cls) -> str:
@@ -23,3 +38,8 @@ class ATPESPNLeagueModel(ESPNLeagueModel):
     @classmethod
     def position_validator(cls) -> dict[str, str]:
         return {}
+
+    @classmethod
+    def date_disorder(cls) -> datetime.timedelta | None:
+        # A tournament's matches run across its two weeks.
+        return datetime.timedelta(days=14)
@@ -1,17 +1,16 @@
 """Aussportsbetting league model."""
 
 # pylint: disable=line-too-long
-from io import BytesIO
 from typing import Any, Iterator
 
 import tqdm
 from dateutil.parser import parse
-from openpyxl import load_workbook
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ..game_model import GameModel
 from ..league import League
 from ..league_model import SHUTDOWN_FLAG, LeagueModel, needs_shutdown
+from ..spreadsheet import iter_spreadsheet_rows
 from .aussportsbetting_game_model import create_aussportsbetting_game_model
 
 
@@ -44,44 +43,44 @@ class AusSportsBettingLeagueModel(LeagueModel):
     def name(cls) -> str:
         return "aussportsbetting-league-model"
 
-    def _row_to_game(self, row: Any) -> GameModel | None:
+    def _row_to_game(self, row: tuple[Any, ...]) -> GameModel | None:
         current_cell_idx = 0
-        date_cell = str(row[0].value)
+        date_cell = str(row[0])
         if date_cell in {"Date", "None"}:
             return None
         current_cell_idx += 1
         if self.league == League.AFL:
-            time_cell = str(row[current_cell_idx].value)
+            time_cell = str(row[current_cell_idx])
             dt = parse(" ".join([date_cell, time_cell]))
             current_cell_idx += 1
         else:
             dt = parse(date_cell)
-        home_team = str(row[current_cell_idx].value).strip()
+        home_team = str(row[current_cell_idx]).strip()
         current_cell_idx += 1
-        away_team = str(row[current_cell_idx].value).strip()
+        away_team = str(row[current_cell_idx]).strip()
         current_cell_idx += 1
         venue = None
         if self.league == League.AFL:
-            venue = str(row[current_cell_idx].value).strip()
+            venue = str(row[current_cell_idx]).strip()
             current_cell_idx += 1
-        home_points = float(row[current_cell_idx].value)  # type: ignore
+        home_points = float(row[current_cell_idx])  # type: ignore
         current_cell_idx += 1
-        away_points = float(row[current_cell_idx].value)  # type: ignore
+        away_points = float(row[current_cell_idx])  # type: ignore
         current_cell_idx += 1
 
         if self.league == League.NFL:
             current_cell_idx += 1
-        play_off = row[current_cell_idx].value == "Y"
+        play_off = row[current_cell_idx] == "Y"
 
         if self.league == League.NFL:
             current_cell_idx += 2
         else:
             current_cell_idx += 5
-        home_odds = float(row[current_cell_idx].value)  # type: ignore
+        home_odds = float(row[current_cell_idx])  # type: ignore
         current_cell_idx += 1
         if self.league == League.NFL:
             current_cell_idx += 3
-        away_odds = float(row[current_cell_idx].value)  # type: ignore
+        away_odds = float(row[current_cell_idx])  # type: ignore
         current_cell_idx += 1
         return create_aussportsbetting_game_model(
             dt,
@@ -103,12 +102,8 @@ class AusSportsBettingLeagueModel(LeagueModel):
             with self.session.cache_disabled():
                 response = self.session.get(self._spreadsheet_url)
             response.raise_for_status()
-            workbook = load_workbook(filename=BytesIO(response.content))
-            ws = workbook.active
-            if ws is None:
-                raise ValueError("ws is null.")
             with tqdm.tqdm(position=self.position) as pbar:
-                for row in ws.iter_rows():
+                for row in iter_spreadsheet_rows(response.content):
                     if needs_shutdown():
                         return
                     game_model = self._row_to_game(row)
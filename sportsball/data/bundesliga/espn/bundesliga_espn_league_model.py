@@ -14,8 +14,21 @@ _SEASON_URL = (
 class BundesligaESPNLeagueModel(ESPNLeagueModel):
     """Bundesliga ESPN implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(_SEASON_URL, League.BUNDESLIGA, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        max_in_flight: int | None = None,
+        requests_per_second: float | None = None,
+    ) -> None:
+        super().__init__(
+            _SEASON_URL,
+            League.BUNDESLIGA,
+            session,
+            position=position,
+            max_in_flight=max_in_flight,
+            requests_per_second=requests_per_second,
+        )
 
     @classmethod
     def name(cls) -> str:
@@ -6,8 +6,8 @@ from typing import Any, Literal
 from pydantic import BaseModel, ConfigDict, Field
 
 from .field_type import FFILL_KEY, TYPE_KEY, FieldType
-from .sex import (FEMALE_GENDERS, GENDER_DETECTOR, MALE_GENDERS,
-                  UNCERTAIN_GENDERS, Sex)
+from .sex import (FEMALE_GENDERS, MALE_GENDERS, UNCERTAIN_GENDERS, Sex,
+                  gender_detector)
 
 COACH_IDENTIFIER_COLUMN: Literal["identifier"] = "identifier"
 COACH_NAME_COLUMN: Literal["name"] = "name"
@@ -19,7 +19,7 @@ VERSION = "0.0.1"
 
 def _guess_sex(data: dict[str, Any]) -> str | None:
     name = data[COACH_NAME_COLUMN]
-    gender_tag = GENDER_DETECTOR.get_gender(name)
+    gender_tag = gender_detector().get_gender(name)
     if gender_tag in MALE_GENDERS:
         return str(Sex.MALE)
     if gender_tag in FEMALE_GENDERS:
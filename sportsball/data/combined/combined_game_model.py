@@ -2,7 +2,6 @@
 
 # pylint: disable=too-many-locals,line-too-long,too-many-arguments,too-many-branches,too-many-statements,too-many-positional-arguments
 import datetime
-import logging
 from typing import Any
 
 import requests
@@ -18,26 +17,28 @@ from ..venue_model import VenueModel
 from .combined_team_model import create_combined_team_model
 from .combined_umpire_model import create_combined_umpire_model
 from .combined_venue_model import create_combined_venue_model
+from .identity_table import IdentityTable
+from .merge_fields import merge_fields
 from .most_interesting import more_interesting
 from .normalise_name import normalise_name
 
+_MERGE_EXCLUDE = frozenset(
+    {"dt", "venue", "teams", "league", "dividends", "version", "umpires"}
+)
+
 
 def _venue_models(
-    game_models: list[GameModel], venue_identity_map: dict[str, str]
+    game_models: list[GameModel], venue_identities: IdentityTable
 ) -> tuple[list[VenueModel], str | None]:
     venue_models = []
     full_venue_identity = None
     for game_model in game_models:
         game_model_venue = game_model.venue
         if game_model_venue is not None:
-            venue_identity = venue_identity_map.get(game_model_venue.identifier)
-            if venue_identity is None:
-                logging.warning(
-                    "Failed to find %s venue identifier (%s).",
-                    game_model_venue.identifier,
-                    game_model_venue.name,
-                )
-            else:
+            venue_identity = venue_identities.resolve(
+                game_model_venue.identifier, game_model_venue.name
+            )
+            if venue_identity is not None:
                 full_venue_identity = venue_identity
             venue_models.append(game_model_venue)
     return venue_models, full_venue_identity
@@ -45,8 +46,8 @@ def _venue_models(
 
 def _team_models(
     game_models: list[GameModel],
-    team_identity_map: dict[str, str],
-    player_identity_map: dict[str, str],
+    team_identities: IdentityTable,
+    player_identities: IdentityTable,
     names: dict[str, str],
     coach_names: dict[str, str],
     player_ffill: dict[str, dict[str, Any]],
@@ -58,22 +59,17 @@ def _team_models(
         game_model_teams = game_model.teams
         if game_model_teams:
             for team_model in game_model_teams:
-                team_identity = team_identity_map.get(team_model.identifier)
+                team_identity = team_identities.resolve(
+                    team_model.identifier, team_model.name
+                )
                 if team_identity is None:
-                    logging.warning(
-                        "Failed to find %s team identifier (%s).",
-                        team_model.identifier,
-                        team_model.name,
-                    )
                     team_identity = team_model.identifier
-                team_models[team_identity] = team_models.get(team_identity, []) + [
-                    team_model
-                ]
+                team_models.setdefault(team_identity, []).append(team_model)
     return [
         create_combined_team_model(
             v,
             k,
-            player_identity_map,
+            player_identities,
             names,
             coach_names,
             player_ffill,
@@ -110,9 +106,9 @@ def _remove_lookaheads(obj: PlayerModel) -> PlayerModel:
 
 def create_combined_game_model(
     game_models: list[GameModel],
-    venue_identity_map: dict[str, str],
-    team_identity_map: dict[str, str],
-    player_identity_map: dict[str, str],
+    venue_identities: IdentityTable,
+    team_identities: IdentityTable,
+    player_identities: IdentityTable,
     session: requests.Session,
     names: dict[str, str],
     coach_names: dict[str, str],
@@ -126,46 +122,24 @@ def create_combined_game_model(
 ) -> GameModel:
     """Create a game model by combining many game models."""
     umpires: dict[str, list[UmpireModel]] = {}
-    venue_models, full_venue_identity = _venue_models(game_models, venue_identity_map)
+    venue_models, full_venue_identity = _venue_models(game_models, venue_identities)
     full_team_models = _team_models(
         game_models,
-        team_identity_map,
-        player_identity_map,
+        team_identities,
+        player_identities,
         names,
         coach_names,
         player_ffill,
         team_ffill,
         coach_ffill,
     )
-    attendance = None
-    end_dt = None
-    year = None
-    season_type = None
-    week = None
-    game_number = None
-    postponed = None
-    play_off = None
-    distance = None
     dividends = []
-    pot = None
-    best_of = None
     dt_votes: dict[str, int] = {}
     for game_model in game_models:
         dt_votes[game_model.dt.isoformat()] = (
             dt_votes.get(game_model.dt.isoformat(), 0) + 1
         )
-        attendance = more_interesting(attendance, game_model.attendance)
-        end_dt = more_interesting(end_dt, game_model.end_dt)
-        year = more_interesting(year, game_model.year)
-        season_type = more_interesting(season_type, game_model.season_type)
-        week = more_interesting(week, game_model.week)
-        game_number = more_interesting(game_number, game_model.game_number)
-        postponed = more_interesting(postponed, game_model.postponed)
-        play_off = more_interesting(play_off, game_model.play_off)
-        distance = more_interesting(distance, game_model.distance)
         dividends.extend(game_model.dividends)
-        pot = more_interesting(pot, game_model.pot)
-        best_of = more_interesting(best_of, game_model.best_of)
         for umpire_model in game_model.umpires:
             umpire_id = umpire_model.identifier
             umpire_name_key = normalise_name(umpire_model.name)
@@ -173,7 +147,7 @@ def create_combined_game_model(
                 umpire_id = names[umpire_name_key]
             else:
                 names[umpire_name_key] = umpire_id
-            umpires[umpire_id] = umpires.get(umpire_id, []) + [umpire_model]
+            umpires.setdefault(umpire_id, []).append(umpire_model)
 
     dt = None
     for dt_iso, _ in sorted(dt_votes.items(), key=lambda x: x[1], reverse=True):
@@ -187,8 +161,9 @@ def create_combined_game_model(
             if venue_model_identifier is not None:
                 full_venue_identity = venue_model_identifier
 
-    if game_number is None and last_game_number is not None:
-        game_number = last_game_number + 1
+    fields = merge_fields(game_models, GameModel, _MERGE_EXCLUDE)
+    if fields["game_number"] is None and last_game_number is not None:
+        fields["game_number"] = last_game_number + 1
 
     league = game_models[0].league
 
@@ -205,24 +180,15 @@ def create_combined_game_model(
 
     return GameModel.model_construct(
         dt=dt,
-        week=week,
-        game_number=game_number,
         venue=create_combined_venue_model(
             venue_models, full_venue_identity, session, venue_ffill
         ),  # pyright: ignore
         teams=full_team_models,
-        end_dt=end_dt,
-        attendance=attendance,
         league=league,
-        year=year,
-        season_type=season_type,
-        postponed=postponed,
-        play_off=play_off,
-        distance=distance,
         dividends=dividends,
-        pot=pot,
         version=VERSION,
         umpires=[
             create_combined_umpire_model(v, k, umpire_ffill) for k, v in umpires.items()
         ],
+        **fields,
     )
@@ -2,23 +2,132 @@
 
 # pylint: disable=raise-missing-from,too-many-locals
 import datetime
+import heapq
 import logging
-import multiprocessing
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterator
 
 import tqdm
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
+from ...playwright import BROWSER_POOL
 from ..game_model import GameModel
 from ..league import League
-from ..league_model import LeagueModel
+from ..league_model import LeagueModel, before_since
 from ..player_model import PlayerModel
 from .combined_game_model import create_combined_game_model
+from .game_match_index import GameMatchIndex
+from .identity_table import IdentityTable
 
+DEFAULT_QUEUE_SIZE = 256
+_PUT_TIMEOUT = 0.1
+_DONE = object()
 
-def _produce_league_games(league_model: LeagueModel) -> list[GameModel]:
-    return list(league_model.games)
+
+def _put(games: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            games.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce_league_games(
+    league_model: LeagueModel,
+    index: int,
+    games: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    try:
+        for game_model in league_model.games:
+            if before_since(game_model.dt):
+                continue
+            if not _put(games, (index, game_model), stop):
+                return
+        _put(games, (index, _DONE), stop)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        _put(games, (index, exc), stop)
+    finally:
+        # Playwright is bound to this thread, so its browser is closed here.
+        BROWSER_POOL.close()
+
+
+def stream_game_groups(
+    league_models: list[LeagueModel],
+    match_index: GameMatchIndex,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> Iterator[list[GameModel]]:
+    """Group the games of the league models that the index matches, in date order.
+
+    Each model runs on its own thread and hands its games over a bounded queue.
+    A model's watermark is the date of the newest game it has yielded, less its
+    date disorder, and a group is yielded once its date is more than the
+    tolerance behind every watermark. A model without a date disorder holds its
+    watermark back until it finishes.
+    """
+    disorders = [x.date_disorder() for x in league_models]
+    watermarks: list[datetime.date | None] = [None for _ in league_models]
+    groups: dict[int, list[GameModel]] = {}
+    dates: list[tuple[datetime.date, int]] = []
+    finished = 0
+    games: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    # Every model needs its own thread for their watermarks to advance together.
+    with ThreadPoolExecutor(len(league_models)) as executor:
+        try:
+            for index, league_model in enumerate(league_models):
+                executor.submit(_produce_league_games, league_model, index, games, stop)
+            while finished < len(league_models):
+                index, item = games.get()
+                if item is _DONE:
+                    watermarks[index] = datetime.date.max
+                    finished += 1
+                elif isinstance(item, Exception):
+                    # We want to terminate immediately if any of our runners runs into trouble.
+                    raise item
+                else:
+                    dt = item.dt.date()
+                    watermark = watermarks[index]
+                    disorder = disorders[index]
+                    if watermark is not None and dt < watermark:
+                        logging.warning(
+                            "%s yielded a game on %s after its watermark of %s.",
+                            league_models[index].name(),
+                            dt,
+                            watermark,
+                        )
+                    if disorder is not None and (
+                        watermark is None or dt - disorder > watermark
+                    ):
+                        watermarks[index] = dt - disorder
+                    group = match_index.add(item, index)
+                    if group in groups:
+                        groups[group].append(item)
+                    else:
+                        groups[group] = [item]
+                        heapq.heappush(dates, (dt, group))
+                if any(x is None for x in watermarks):
+                    continue
+                low_watermark = min(watermarks)  # type: ignore
+                while dates and (
+                    low_watermark == datetime.date.max
+                    or dates[0][0] + match_index.tolerance < low_watermark
+                ):
+                    _, group = heapq.heappop(dates)
+                    if group not in groups:
+                        # Taken in by an earlier group as it was flushed.
+                        continue
+                    yield [
+                        game_model
+                        for flushed in match_index.flush(group)
+                        for game_model in groups.pop(flushed)
+                    ]
+        finally:
+            stop.set()
 
 
 class CombinedLeagueModel(LeagueModel):
@@ -59,57 +168,14 @@ class CombinedLeagueModel(LeagueModel):
 
     @property
     def games(self) -> Iterator[GameModel]:
-        games: dict[str, list[GameModel]] = {}
-        team_identity_map = self.team_identity_map()
+        team_identities = IdentityTable("team", self.team_identity_map())
+        venue_identities = IdentityTable("venue", self.venue_identity_map())
+        player_identities = IdentityTable(
+            "player", self.player_identity_map(), report_misses=False
+        )
+        match_index = GameMatchIndex(team_identities)
         for league_model in self._league_models:
             league_model.clear_session()
-        results: list[list[GameModel]] = []
-        with ThreadPoolExecutor(
-            min(multiprocessing.cpu_count(), len(self._league_models))
-        ) as p:
-            # We want to terminate immediately if any of our runners runs into trouble.
-
-            futures = {
-                p.submit(_produce_league_games, model): model
-                for model in self._league_models
-            }
-
-            try:
-                for future in as_completed(futures):
-                    result = future.result()  # Raises if an exception occurred
-                    results.append(sorted(result, key=lambda x: x.dt.date()))
-            except Exception:
-                # Cancel all pending futures
-                for f in futures:
-                    f.cancel()
-                raise  # Optionally re-raise the exception
-        for game_list in results:
-            for game_model in tqdm.tqdm(game_list, desc="Sorting Game Models"):
-                old_game_components = [
-                    str(game_model.dt.date() - datetime.timedelta(days=1))
-                ]
-                game_components = [str(game_model.dt.date())]
-                for team in game_model.teams:
-                    if team.identifier not in team_identity_map:
-                        logging.warning(
-                            "%s for team %s not found in team identity map.",
-                            team.identifier,
-                            team.name,
-                        )
-                    team_identifier = team_identity_map.get(
-                        team.identifier, team.identifier
-                    )
-                    old_game_components.append(team_identifier)
-                    game_components.append(team_identifier)
-                old_game_components = sorted(game_components)
-                game_components = sorted(game_components)
-                key = "-".join(old_game_components)
-                if key in games:
-                    games[key].append(game_model)
-                else:
-                    key = "-".join(game_components)
-                    games[key] = [game_model]
-        del results
 
         names: dict[str, str] = {}
         coach_names: dict[str, str] = {}
@@ -120,16 +186,14 @@ class CombinedLeagueModel(LeagueModel):
         team_players_ffill: dict[str, list[PlayerModel]] = {}
         venue_ffill: dict[str, dict[str, Any]] = {}
         last_game_number = None
-        keys = sorted(list(games.keys()), key=lambda x: games[x][0].dt.date())
         with tqdm.tqdm() as pbar:
-            for key in keys:
-                game_models = games.pop(key)
+            for game_models in stream_game_groups(self._league_models, match_index):
                 pbar.update(1)
                 game_model = create_combined_game_model(  # type: ignore
                     game_models=game_models,
-                    venue_identity_map=self.venue_identity_map(),
-                    team_identity_map=team_identity_map,
-                    player_identity_map=self.player_identity_map(),
+                    venue_identities=venue_identities,
+                    team_identities=team_identities,
+                    player_identities=player_identities,
                     session=self.session,
                     names=names,
                     coach_names=coach_names,
@@ -146,3 +210,6 @@ class CombinedLeagueModel(LeagueModel):
                 )
                 last_game_number = game_model.game_number
                 yield game_model
+        match_index.log_stats()
+        for identities in (team_identities, venue_identities, player_identities):
+            identities.log_stats()
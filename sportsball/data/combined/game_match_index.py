@@ -0,0 +1,132 @@
+"""An index matching the games of different sources by their teams and date."""
+
+import bisect
+import datetime
+import logging
+import time
+
+from ..game_model import GameModel
+from .identity_table import IdentityTable
+
+MATCH_TOLERANCE = datetime.timedelta(days=1)
+
+
+class MatchStats:
+    """Statistics on how games were matched across sources."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.groups = 0
+        self.exact_matches = 0
+        self.tolerance_matches = 0
+        self.unresolved_teams = 0
+        self.seconds = 0.0
+
+    @property
+    def matched(self) -> int:
+        """The games that joined a group another source had started."""
+        return self.exact_matches + self.tolerance_matches
+
+
+class GameMatchIndex:
+    """Matches games to groups by their resolved team pair and date.
+
+    A game joins the group of its team pair on its date, whichever source
+    started it, so the order the sources arrive in does not matter. Sources
+    can disagree on the date of a game, so a group being flushed takes in the
+    closest later group of its team pair within the tolerance that shares no
+    source with it, which keeps series and double headers between the same
+    teams apart.
+    """
+
+    def __init__(
+        self,
+        team_identities: IdentityTable,
+        tolerance: datetime.timedelta = MATCH_TOLERANCE,
+    ) -> None:
+        self.tolerance = tolerance
+        self.stats = MatchStats()
+        self._team_identities = team_identities
+        self._tolerance_days = tolerance.days
+        self._next_group = 0
+        self._pairs: dict[tuple[str, ...], tuple[list[int], list[int]]] = {}
+        self._groups: dict[int, tuple[tuple[str, ...], int, set[int]]] = {}
+
+    def _teams(self, game_model: GameModel) -> tuple[str, ...]:
+        teams = []
+        for team in game_model.teams:
+            identifier = self._team_identities.resolve(team.identifier, team.name)
+            if identifier is None:
+                self.stats.unresolved_teams += 1
+                identifier = team.identifier
+            teams.append(identifier)
+        return tuple(sorted(teams))
+
+    def add(self, game_model: GameModel, source: int) -> int:
+        """Match a game from a source, returning the group it belongs to."""
+        start = time.perf_counter()
+        self.stats.games += 1
+        teams = self._teams(game_model)
+        day = game_model.dt.date().toordinal()
+        dates, groups = self._pairs.setdefault(teams, ([], []))
+        position = bisect.bisect_left(dates, day)
+        if position < len(dates) and dates[position] == day:
+            group = groups[position]
+            self._groups[group][2].add(source)
+            self.stats.exact_matches += 1
+        else:
+            group = self._next_group
+            self._next_group += 1
+            self.stats.groups += 1
+            dates.insert(position, day)
+            groups.insert(position, group)
+            self._groups[group] = (teams, day, {source})
+        self.stats.seconds += time.perf_counter() - start
+        return group
+
+    def flush(self, group: int) -> list[int]:
+        """Forget a group once no more games can match it.
+
+        Groups are flushed in date order, once every group within the
+        tolerance after them is complete, and the returned groups are the
+        flushed group followed by the later group it takes in, if any.
+        """
+        start = time.perf_counter()
+        teams, day, sources = self._groups.pop(group)
+        dates, groups = self._pairs[teams]
+        position = bisect.bisect_left(dates, day)
+        del dates[position]
+        del groups[position]
+        flushed = [group]
+        end = bisect.bisect_right(dates, day + self._tolerance_days)
+        for neighbour_position in range(position, end):
+            neighbour = groups[neighbour_position]
+            if sources.isdisjoint(self._groups[neighbour][2]):
+                del self._groups[neighbour]
+                del dates[neighbour_position]
+                del groups[neighbour_position]
+                flushed.append(neighbour)
+                self.stats.groups -= 1
+                self.stats.tolerance_matches += 1
+                break
+        if not dates:
+            del self._pairs[teams]
+        self.stats.seconds += time.perf_counter() - start
+        return flushed
+
+    def log_stats(self) -> None:
+        """Log how the games were matched."""
+        stats = self.stats
+        logging.info(
+            "Matched %d games into %d groups (%d exact, %d within %s, "
+            "%d unresolved teams) in %.3fs.",
+            stats.games,
+            stats.groups,
+            stats.exact_matches,
+            stats.tolerance_matches,
+            self.tolerance,
+            stats.unresolved_teams,
+            stats.seconds,
+        )
@@ -0,0 +1,60 @@
+"""A read only identity map that counts how it is used."""
+
+import collections
+import logging
+import types
+from typing import Mapping
+
+_REPORTED_MISSES = 10
+
+
+class IdentityTable:
+    """Resolves the identifiers of one kind of entity to a consistent identity.
+
+    The table is a read only view of a combined league's identity map, and
+    it counts lookups and misses so a run can report the identifiers missing
+    from the map once rather than warning on every occurrence.
+    """
+
+    def __init__(
+        self, kind: str, identity_map: Mapping[str, str], report_misses: bool = True
+    ) -> None:
+        self.kind = kind
+        self._report_misses = report_misses
+        self._identity_map = types.MappingProxyType(identity_map)
+        self.lookups = 0
+        self.misses: collections.Counter[str] = collections.Counter()
+        self._names: dict[str, str] = {}
+
+    def resolve(self, identifier: str, name: str | None = None) -> str | None:
+        """The identity of an identifier, or None when it is not in the map."""
+        self.lookups += 1
+        identity = self._identity_map.get(identifier)
+        if identity is None:
+            self.misses[identifier] += 1
+            if name is not None:
+                self._names.setdefault(identifier, name)
+        return identity
+
+    def log_stats(self) -> None:
+        """Log the lookups and the identifiers most often missing."""
+        if not self.lookups:
+            return
+        logging.info(
+            "%s identities: %d lookups, %d misses over %d identifiers.",
+            self.kind,
+            self.lookups,
+            self.misses.total(),
+            len(self.misses),
+        )
+        if not self._report_misses:
+            return
+        for identifier, count in self.misses.most_common(_REPORTED_MISSES):
+            logging.warning(
+                "%s for %s %s not found in %s identity map (%d times).",
+                identifier,
+                self.kind,
+                self._names.get(identifier, identifier),
+                self.kind,
+                count,
+            )
@@ -0,0 +1,92 @@
+"""A function for merging the fields of many models of the same class."""
+
+import datetime
+import functools
+import types
+import typing
+from typing import Any, Callable, Sequence
+
+from pydantic import BaseModel
+
+from .most_interesting import more_interesting
+
+_NUMBER_TYPES = (bool, int, float)
+
+
+def _more_interesting_number(left: Any, right: Any) -> Any:
+    # NaN is the only value not equal to itself.
+    if left is None or left != left:  # pylint: disable=comparison-with-itself
+        return right
+    if right is None or right != right:  # pylint: disable=comparison-with-itself
+        return left
+    if left == 0 and right != 0:
+        if isinstance(left, float) and isinstance(right, float):
+            return right
+        if isinstance(left, int) and isinstance(right, int):
+            return right
+    return left
+
+
+def _more_interesting_datetime(left: Any, right: Any) -> Any:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return more_interesting(left, right)
+
+
+def _first_present(left: Any, right: Any) -> Any:
+    if left is None:
+        return right
+    return left
+
+
+def _field_merger(annotation: Any) -> Callable[[Any, Any], Any]:
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [x for x in typing.get_args(annotation) if x is not type(None)]
+        if len(args) != 1:
+            return more_interesting
+        annotation = args[0]
+    if annotation in _NUMBER_TYPES:
+        return _more_interesting_number
+    if annotation is datetime.datetime:
+        return _more_interesting_datetime
+    if typing.get_origin(annotation) is list or isinstance(annotation, type):
+        return _first_present
+    return more_interesting
+
+
+@functools.cache
+def _merge_plan(
+    model_class: type[BaseModel], exclude: frozenset[str]
+) -> tuple[tuple[str, Callable[[Any, Any], Any], bool], ...]:
+    return tuple(
+        (name, _field_merger(field.annotation), field.default_factory is not None)
+        for name, field in model_class.model_fields.items()
+        if name not in exclude
+    )
+
+
+def merge_fields(
+    models: Sequence[BaseModel],
+    model_class: type[BaseModel],
+    exclude: frozenset[str] = frozenset(),
+) -> dict[str, Any]:
+    """Merge the fields of the models into the most interesting value of each.
+
+    The plan of which fields to merge, and the null check and comparison for
+    each of them, is built once per model class from its annotations. Fields
+    that are excluded are left to the caller, and a field with a default
+    factory that no model has a value for is left out, so that the factory
+    fills it in on construction.
+    """
+    values = [vars(x) for x in models]
+    merged = {}
+    for name, merger, has_default_factory in _merge_plan(model_class, exclude):
+        value = None
+        for model_values in values:
+            value = merger(value, model_values.get(name))
+        if value is None and has_default_factory:
+            continue
+        merged[name] = value
+    return merged
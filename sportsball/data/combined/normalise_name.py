@@ -1,11 +1,13 @@
 """Function for normalising names."""
 
+import functools
 import re
 import unicodedata
 
 REGEX = re.compile("[^a-zA-Z]")
 
 
+@functools.cache
 def normalise_name(name: str) -> str:
     """Handles Surname, Firstname"""
     if "," in name:
@@ -1,14 +1,41 @@
 """A function for checking whether an object is null."""
 
-from typing import Any
+import datetime
+import enum
+from typing import Any, Callable
 
 import numpy as np
+from pydantic import BaseModel
 
+_NEVER_NULL_TYPES = (
+    bool,
+    int,
+    str,
+    bytes,
+    dict,
+    np.integer,
+    np.bool_,
+    datetime.date,
+    datetime.timedelta,
+    enum.Enum,
+    BaseModel,
+)
 
-def is_null(obj: Any) -> bool:
-    """Whether the object is a null type object."""
-    if obj is None:
-        return True
+
+def _never_null(_: Any) -> bool:
+    return False
+
+
+def _not_equal_to_itself(obj: Any) -> bool:
+    # NaN and NaT are the only values not equal to themselves.
+    return obj != obj  # pylint: disable=comparison-with-itself
+
+
+def _is_nat(obj: Any) -> bool:
+    return bool(np.isnat(obj))
+
+
+def _is_null_array_like(obj: Any) -> bool:
     try:
         if np.isnan(obj):
             return True
@@ -20,3 +47,28 @@ def is_null(obj: Any) -> bool:
     except TypeError:
         pass
     return False
+
+
+def _null_check(obj_type: type) -> Callable[[Any], bool]:
+    if issubclass(obj_type, (np.datetime64, np.timedelta64)):
+        return _is_nat
+    if issubclass(obj_type, (float, np.floating, datetime.datetime)):
+        return _not_equal_to_itself
+    if issubclass(obj_type, _NEVER_NULL_TYPES):
+        return _never_null
+    return _is_null_array_like
+
+
+_NULL_CHECKS: dict[type, Callable[[Any], bool]] = {}
+
+
+def is_null(obj: Any) -> bool:
+    """Whether the object is a null type object."""
+    if obj is None:
+        return True
+    obj_type = type(obj)
+    check = _NULL_CHECKS.get(obj_type)
+    if check is None:
+        check = _null_check(obj_type)
+        _NULL_CHECKS[obj_type] = check
+    return check(obj)
@@ -9,7 +9,7 @@ import pytest_is_running
 from dateutil.parser import parse
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
-from ...cache import MEMORY
+from ...cache import cache_key, keyed_cache
 from ..game_model import VERSION as GAME_VERSION
 from ..game_model import GameModel, localize
 from ..google.google_news_model import create_google_news_models
@@ -904,9 +904,19 @@ def _create_espn_game_model(
     )
 
 
-@MEMORY.cache(ignore=["session"])
+@keyed_cache(
+    "url",
+    "week",
+    "game_number",
+    "league",
+    "year",
+    "season_type",
+    "positions_validator",
+    "version",
+)
 def _cached_create_espn_game_model(
     competition: dict[str, Any],
+    url: str,
     week: int | None,
     game_number: int,
     session: ScrapeSession,
@@ -947,6 +957,7 @@ def create_espn_game_model(
     ):
         return _cached_create_espn_game_model(
             competition=competition,
+            url=cache_key(competition.get("$ref"), competition),
             week=week,
             game_number=game_number,
             session=session,
@@ -3,7 +3,7 @@
 # pylint: disable=too-many-locals,too-many-arguments,line-too-long,too-many-branches,too-many-statements
 import datetime
 import logging
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator
 from urllib.parse import urlparse
 
 import requests
@@ -11,12 +11,16 @@ import tqdm
 from dateutil.parser import parse
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
+from ... import prefetch
 from ..game_model import GameModel
 from ..league import League
-from ..league_model import SHUTDOWN_FLAG, LeagueModel, needs_shutdown
+from ..league_model import (SHUTDOWN_FLAG, LeagueModel, before_since,
+                            needs_shutdown)
 from ..season_type import SeasonType
 from .espn_game_model import create_espn_game_model
 
+_COMPETITION_REF_KEYS = ["status", "odds", "officials", "situation"]
+
 
 def _season_type_from_name(name: str) -> SeasonType:
     if (
@@ -52,10 +56,41 @@ def _season_type_from_name(name: str) -> SeasonType:
     raise ValueError(f"Unrecognised season name: {name}")
 
 
+def _ended_before_since(item: dict[str, Any]) -> bool:
+    end_date = item.get("endDate")
+    if end_date is None:
+        return False
+    return before_since(parse(end_date).date())
+
+
+def _competitions(event: dict[str, Any]) -> list[dict[str, Any]]:
+    competitions = event.get("competitions", [])
+    if not competitions:
+        for grouping in event.get("groupings", []):
+            competitions.extend(grouping["competitions"])
+    return competitions
+
+
+def _competition_refs(competition: dict[str, Any]) -> list[str]:
+    return [
+        competition[x]["$ref"]
+        for x in _COMPETITION_REF_KEYS
+        if x in competition and "$ref" in competition[x]
+    ]
+
+
+def _event_refs(response: requests.Response) -> list[str]:
+    refs = []
+    for competition in _competitions(response.json()):
+        refs.extend(_competition_refs(competition))
+    return refs
+
+
 class ESPNLeagueModel(LeagueModel):
     """ESPN implementation of the league model."""
 
     _found_games: set[str]
+    _prefetcher: prefetch.Prefetcher | None
 
     def __init__(
         self,
@@ -63,10 +98,17 @@ class ESPNLeagueModel(LeagueModel):
         league: League,
         session: ScrapeSession,
         position: int | None = None,
+        max_in_flight: int | None = None,
+        requests_per_second: float | None = None,
     ) -> None:
         super().__init__(league, session, position=position)
         self._start_url = start_url
         self._found_games = set()
+        # None takes the limits set for every model, and 0 requests per second
+        # lifts the rate limit.
+        self._max_in_flight = max_in_flight
+        self._requests_per_second = requests_per_second
+        self._prefetcher = None
 
     @classmethod
     def name(cls) -> str:
@@ -79,6 +121,35 @@ class ESPNLeagueModel(LeagueModel):
             "position_validator is not implemented by parent class"
         )
 
+    @classmethod
+    def date_disorder(cls) -> datetime.timedelta | None:
+        # The seasons, their types, weeks and calendar dates come oldest first,
+        # but the events within a week are in no particular order.
+        return datetime.timedelta(days=7)
+
+    def _get(self, url: str, cache_disabled: bool) -> requests.Response:
+        if cache_disabled:
+            with self.session.cache_disabled():
+                return self.session.get(url)
+        prefetcher = self._prefetcher
+        if prefetcher is None:
+            return self.session.get(url)
+        return prefetcher.get(url)
+
+    def _prefetch(
+        self,
+        urls: list[str],
+        follow: Callable[[requests.Response], list[str]] | None = None,
+    ) -> None:
+        prefetcher = self._prefetcher
+        if prefetcher is not None:
+            prefetcher.prefetch(urls, follow=follow)
+
+    def _discard(self, urls: list[str]) -> None:
+        prefetcher = self._prefetcher
+        if prefetcher is not None:
+            prefetcher.discard(urls)
+
     def _produce_game(
         self,
         cache_disabled: bool,
@@ -90,35 +161,31 @@ class ESPNLeagueModel(LeagueModel):
     ) -> Iterator[GameModel]:
         event = event_item
         if "$ref" in event_item:
-            if cache_disabled:
-                with self.session.cache_disabled():
-                    event_response = self.session.get(event_item["$ref"])
-            else:
-                event_response = self.session.get(event_item["$ref"])
+            event_response = self._get(event_item["$ref"], cache_disabled)
             event_response.raise_for_status()
             event = event_response.json()
 
-        competitions = event.get("competitions", [])
-        if not competitions:
-            for grouping in event.get("groupings", []):
-                competitions.extend(grouping["competitions"])
+        competitions = _competitions(event)
+        if not cache_disabled:
+            for competition in competitions:
+                self._prefetch(_competition_refs(competition))
 
         for competition in competitions:
             if "status" in competition:
-                if cache_disabled:
-                    with self.session.cache_disabled():
-                        status_response = self.session.get(
-                            competition["status"]["$ref"]
-                        )
-                else:
-                    status_response = self.session.get(competition["status"]["$ref"])
+                status_response = self._get(
+                    competition["status"]["$ref"], cache_disabled
+                )
                 status_response.raise_for_status()
                 status = status_response.json()
                 if not status["type"]["completed"]:
+                    self._discard(_competition_refs(competition))
                     continue
             competition_ref = competition["$ref"]
             if competition_ref in self._found_games:
+                self._discard(_competition_refs(competition))
                 continue
+            if self._prefetcher is not None:
+                self._prefetcher.wait(_competition_refs(competition))
             game_model = create_espn_game_model(
                 competition,
                 week_count,
@@ -150,17 +217,16 @@ class ESPNLeagueModel(LeagueModel):
         while True:
             if "events" not in week:
                 break
-            if cache_disabled:
-                with self.session.cache_disabled():
-                    events_response = self.session.get(
-                        week["events"]["$ref"] + f"&page={events_page}"
-                    )
-            else:
-                events_response = self.session.get(
-                    week["events"]["$ref"] + f"&page={events_page}"
-                )
+            events_response = self._get(
+                week["events"]["$ref"] + f"&page={events_page}", cache_disabled
+            )
             events_response.raise_for_status()
             events = events_response.json()
+            if not cache_disabled:
+                self._prefetch(
+                    [x["$ref"] for x in events["items"] if "$ref" in x],
+                    follow=_event_refs,
+                )
             for event_item in events["items"]:
                 for game_model in self._produce_game(
                     event_item=event_item,
@@ -180,16 +246,19 @@ class ESPNLeagueModel(LeagueModel):
         while True:
             if "qbr" not in week:
                 break
-            if cache_disabled:
-                with self.session.cache_disabled():
-                    qbr_response = self.session.get(
-                        week["qbr"]["$ref"] + f"&page={qbr_page}"
-                    )
-            else:
-                qbr_response = self.session.get(
-                    week["qbr"]["$ref"] + f"&page={qbr_page}"
-                )
+            qbr_response = self._get(
+                week["qbr"]["$ref"] + f"&page={qbr_page}", cache_disabled
+            )
             qbr = qbr_response.json()
+            if not cache_disabled:
+                self._prefetch(
+                    [
+                        x["event"]["$ref"]
+                        for x in qbr["items"]
+                        if "$ref" in x.get("event", {})
+                    ],
+                    follow=_event_refs,
+                )
             for qbr_item in qbr["items"]:
                 for game_model in self._produce_game(
                     event_item=qbr_item["event"],
@@ -217,27 +286,23 @@ class ESPNLeagueModel(LeagueModel):
             game_page = 1
             week_count = 0
             while True:
-                if cache_disabled:
-                    with self.session.cache_disabled():
-                        weeks_response = self.session.get(
-                            season_type_json["weeks"]["$ref"] + f"&page={page}"
-                        )
-                else:
-                    weeks_response = self.session.get(
-                        season_type_json["weeks"]["$ref"] + f"&page={page}"
-                    )
+                weeks_response = self._get(
+                    season_type_json["weeks"]["$ref"] + f"&page={page}", cache_disabled
+                )
                 weeks_response.raise_for_status()
                 weeks = weeks_response.json()
+                if not cache_disabled:
+                    self._prefetch([x["$ref"] for x in weeks["items"]])
                 for item in weeks["items"]:
                     if needs_shutdown():
                         return
-                    if cache_disabled:
-                        with self.session.cache_disabled():
-                            week_response = self.session.get(item["$ref"])
-                    else:
-                        week_response = self.session.get(item["$ref"])
+                    week_response = self._get(item["$ref"], cache_disabled)
                     week_response.raise_for_status()
                     week = week_response.json()
+                    if _ended_before_since(week):
+                        found_pages = True
+                        week_count += 1
+                        continue
                     for game_model in self._produce_games(
                         week, week_count, season_type_json, pbar, cache_disabled
                     ):
@@ -266,10 +331,11 @@ class ESPNLeagueModel(LeagueModel):
             }
             events_count = 0
             while calendar_dates:
-                calendar_date = calendar_dates.pop()
+                calendar_date = min(calendar_dates)
+                calendar_dates.remove(calendar_date)
                 if calendar_date > datetime.datetime.now().date() + datetime.timedelta(
                     days=7
-                ):
+                ) or before_since(calendar_date):
                     continue
                 dt = calendar_date.strftime("%Y%m%d")
                 url = f"https://site.api.espn.com/apis/site/v2/sports/{sport_slug}/{league_slug}/scoreboard?lang=en&region=us&calendartype=whitelist&limit=100&dates={dt}&league={league_slug}"
@@ -326,53 +392,82 @@ class ESPNLeagueModel(LeagueModel):
     @property
     def games(self) -> Iterator[GameModel]:
         self._found_games = set()
+        session = self.session
         try:
-            with self.session.wayback_disabled():
+            with session.wayback_disabled(), prefetch.Prefetcher(
+                session,
+                max_in_flight=(
+                    prefetch.MAX_IN_FLIGHT
+                    if self._max_in_flight is None
+                    else self._max_in_flight
+                ),
+                requests_per_second=(
+                    prefetch.REQUESTS_PER_SECOND
+                    if self._requests_per_second is None
+                    else self._requests_per_second
+                ),
+            ) as prefetcher:
+                self._prefetcher = prefetcher
+                # Every fetch of the crawl, the game models' included, goes
+                # through the prefetcher's rate limited session.
+                self._session = prefetcher.session
                 page = 1
-                first = True
-                with tqdm.tqdm(position=self.position) as pbar:
-                    while True:
-                        if page == 1:
-                            with self.session.cache_disabled():
-                                response = self.session.get(
-                                    self._start_url + f"&page={page}"
-                                )
-                        else:
+                season_refs = []
+                while True:
+                    if page == 1:
+                        with self.session.cache_disabled():
                             response = self.session.get(
                                 self._start_url + f"&page={page}"
                             )
-                        response.raise_for_status()
-                        seasons = response.json()
-                        for item in seasons.get("items", []):
+                    else:
+                        response = self.session.get(self._start_url + f"&page={page}")
+                    response.raise_for_status()
+                    seasons = response.json()
+                    season_refs.extend(
+                        (x["$ref"], page) for x in seasons.get("items", [])
+                    )
+                    if page >= seasons.get("pageCount", 0):
+                        break
+                    page += 1
+
+                # The seasons are listed newest first, produce them oldest first
+                # so the games come out in date order.
+                with tqdm.tqdm(position=self.position) as pbar:
+                    for count, (season_ref, page) in reversed(
+                        list(enumerate(season_refs))
+                    ):
+                        first = count == 0
+                        if first:
+                            with self.session.cache_disabled():
+                                season_response = self.session.get(season_ref)
+                        else:
+                            season_response = self.session.get(season_ref)
+                        season_response.raise_for_status()
+                        season_json = season_response.json()
+                        if _ended_before_since(season_json):
+                            continue
+
+                        for season_item in season_json["types"]["items"]:
                             if first:
                                 with self.session.cache_disabled():
-                                    season_response = self.session.get(item["$ref"])
-                            else:
-                                season_response = self.session.get(item["$ref"])
-                            season_response.raise_for_status()
-                            season_json = season_response.json()
-
-                            for season_item in season_json["types"]["items"]:
-                                if first:
-                                    with self.session.cache_disabled():
-                                        season_type_response = self.session.get(
-                                            season_item["$ref"]
-                                        )
-                                else:
                                     season_type_response = self.session.get(
                                         season_item["$ref"]
                                     )
-                                season_type_response.raise_for_status()
-                                season_type_json = season_type_response.json()
-
-                                yield from self._produce_week_games(
-                                    season_type_json, page, pbar, first
+                            else:
+                                season_type_response = self.session.get(
+                                    season_item["$ref"]
                                 )
-                            first = False
+                            season_type_response.raise_for_status()
+                            season_type_json = season_type_response.json()
+                            if _ended_before_since(season_type_json):
+                                continue
 
-                        if page >= seasons.get("pageCount", 0):
-                            break
-                        page += 1
+                            yield from self._produce_week_games(
+                                season_type_json, page, pbar, first
+                            )
         except Exception as exc:
             SHUTDOWN_FLAG.set()
             raise exc
+        finally:
+            self._prefetcher = None
+            self._session = session
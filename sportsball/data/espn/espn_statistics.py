@@ -0,0 +1,81 @@
+"""Decoding the statistics ESPN reports for a player or team."""
+
+from typing import Any, Callable, Sequence
+
+from ..combined.most_interesting import more_interesting
+
+StatReducer = Callable[[dict[str, Any]], Any]
+
+
+def stat_value(stat: dict[str, Any]) -> Any:
+    """The value of a statistic, which must be present."""
+    return stat["value"]
+
+
+def stat_int(stat: dict[str, Any]) -> Any:
+    """The value of a statistic, or its display value as an int."""
+    if "value" in stat:
+        return stat["value"]
+    return int(stat["displayValue"])
+
+
+def stat_float(stat: dict[str, Any]) -> Any:
+    """The value of a statistic, or its display value as a float."""
+    if "value" in stat:
+        return stat["value"]
+    return float(stat["displayValue"])
+
+
+def stat_optional(stat: dict[str, Any]) -> Any:
+    """The value of a statistic, or None when it is not reported."""
+    return stat.get("value")
+
+
+def stat_clock(stat: dict[str, Any]) -> Any:
+    """The value of a statistic, or its mm:ss display value in seconds."""
+    if "value" in stat:
+        return stat["value"]
+    minutes, seconds = stat["displayValue"].split(":")
+    return (float(minutes) * 60.0) + float(seconds)
+
+
+class StatisticsTable:
+    """Maps the names of ESPN statistics to the model fields they populate.
+
+    Each statistic name maps to the field it populates and the reducer that
+    reads its value, or to None for statistics that are known but ignored.
+    A field populated by more than one statistic keeps the most interesting
+    of their values.
+    """
+
+    def __init__(self, statistics: dict[str, tuple[str, StatReducer] | None]) -> None:
+        self._statistics = statistics
+        self.fields = tuple(
+            dict.fromkeys(x[0] for x in statistics.values() if x is not None)
+        )
+
+    def empty(self) -> dict[str, Any]:
+        """The fields of the table, none of them populated."""
+        return dict.fromkeys(self.fields)
+
+    def decode(
+        self,
+        values: dict[str, Any],
+        categories: Sequence[dict[str, Any]],
+        source: str,
+    ) -> None:
+        """Fold the statistics in the categories into the values of the fields."""
+        statistics = self._statistics
+        for category in categories:
+            for stat in category["stats"]:
+                name = stat["name"]
+                try:
+                    entry = statistics[name]
+                except KeyError:
+                    raise ValueError(  # pylint: disable=raise-missing-from
+                        f"Failed to account for statistic: {name} on {source}"
+                    )
+                if entry is None:
+                    continue
+                field, reducer = entry
+                values[field] = more_interesting(values[field], reducer(stat))
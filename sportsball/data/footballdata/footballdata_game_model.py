@@ -2,11 +2,8 @@
 
 # pylint: disable=too-many-arguments,duplicate-code
 import datetime
-import logging
 
 import pytest_is_running
-from dateutil import parser
-from dateutil.parser import parse
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...cache import MEMORY
@@ -153,8 +150,7 @@ def _cached_create_footballdata_game_model(
 def create_footballdata_game_model(
     session: ScrapeSession,
     league: League,
-    date: str,
-    time: str,
+    dt: datetime.datetime,
     home_team: str,
     away_team: str,
     full_time_home_goals: str,
@@ -175,13 +171,6 @@ def create_footballdata_game_model(
     draw_odds: str | None,
 ) -> GameModel:
     """Create a game model based off footballdata."""
-    dt = None
-    try:
-        dt = parse(" ".join([date, time]), dayfirst=False)
-    except parser._parser.ParserError as exc:  # type: ignore
-        logging.error(str(exc))
-        logging.error("%s %s", date, time)
-        raise exc
     if not pytest_is_running.is_running() and dt < datetime.datetime.now().replace(
         tzinfo=dt.tzinfo
     ) - datetime.timedelta(days=7):
@@ -1,13 +1,16 @@
 """FootballData league model."""
 
-import csv
+import datetime
 import io
 import logging
 import urllib.parse
-from typing import Any, Iterator
+from typing import Iterator
 
+import pandas as pd
 import tqdm
 from bs4 import BeautifulSoup
+from dateutil import parser
+from dateutil.parser import parse
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ..epl.position import Position
@@ -16,6 +19,49 @@ from ..league import League
 from ..league_model import SHUTDOWN_FLAG, LeagueModel, needs_shutdown
 from .footballdata_game_model import create_footballdata_game_model
 
+_DIVISIONS = {"E0", "D1", "SP1"}
+_COLUMNS = {
+    "Date": "date",
+    "Time": "time",
+    "HomeTeam": "home_team",
+    "AwayTeam": "away_team",
+    "FTHG": "full_time_home_goals",
+    "FTAG": "full_time_away_goals",
+    "Referee": "referee",
+    "HS": "home_shots",
+    "AS": "away_shots",
+    "HST": "home_shots_on_target",
+    "AST": "away_shots_on_target",
+    "HF": "home_fouls",
+    "AF": "away_fouls",
+    "HY": "home_yellow_cards",
+    "AY": "away_yellow_cards",
+    "HR": "home_red_cards",
+    "AR": "away_red_cards",
+    "B365H": "home_odds",
+    "B365A": "away_odds",
+    "B365D": "draw_odds",
+}
+_STRIPPED_COLUMNS = [
+    "date",
+    "time",
+    "home_team",
+    "away_team",
+    "full_time_home_goals",
+    "full_time_away_goals",
+]
+_OPTIONAL_COLUMNS = [x for x in _COLUMNS if _COLUMNS[x] not in _STRIPPED_COLUMNS]
+_GAME_COLUMNS = ["dt"] + [x for x in _COLUMNS.values() if x not in {"date", "time"}]
+
+
+def _parse_dt(date_time: str) -> datetime.datetime:
+    try:
+        return parse(date_time, dayfirst=False)
+    except parser._parser.ParserError as exc:  # type: ignore
+        logging.error(str(exc))
+        logging.error("%s", date_time)
+        raise exc
+
 
 class FootballDataLeagueModel(LeagueModel):
     """FootballData implementation of the league model."""
@@ -38,92 +84,42 @@ class FootballDataLeagueModel(LeagueModel):
         """Football position validators."""
         return {str(x): str(x) for x in Position}
 
-    def _row_to_game(self, row: Any) -> GameModel | None:
-        div_headers = [x for x in row.keys() if x is not None and x.endswith("Div")]
+    def _games_frame(self, text: str) -> pd.DataFrame:
+        # Only the columns of a game are parsed, out of the hundred or so odds
+        # columns, and selecting them by name drops the extra cells some rows
+        # of older seasons have beyond the header.
+        df = pd.read_csv(
+            io.StringIO(text),
+            dtype=object,
+            keep_default_na=False,
+            usecols=lambda x: x in _COLUMNS or x.endswith("Div"),
+            index_col=False,
+        )
+        div_headers = [x for x in df.columns if x.endswith("Div")]
         if not div_headers:
-            return None
-        div_header = div_headers[0]
-        division_cell = row.get(div_header)
-        if division_cell not in {"E0", "D1", "SP1"}:
-            return None
-        date_cell = str(row["Date"]).strip()
-        if not date_cell:
-            return None
-        time_cell = str(row.get("Time", "")).strip()
-        home_team_cell = str(row["HomeTeam"]).strip()
-        away_team_cell = str(row["AwayTeam"]).strip()
-        full_time_home_goals_cell = str(row["FTHG"]).strip()
-        full_time_away_goals_cell = str(row["FTAG"]).strip()
-        referee_cell = row.get("Referee")
-        home_shots_cell = row.get("HS")
-        if home_shots_cell is not None and not home_shots_cell:
-            home_shots_cell = None
-        away_shots_cell = row.get("AS")
-        if away_shots_cell is not None and not away_shots_cell:
-            away_shots_cell = None
-
-        home_shots_on_target_cell = row.get("HST")
-        if home_shots_on_target_cell is not None and not home_shots_on_target_cell:
-            home_shots_on_target_cell = None
-        away_shots_on_target_cell = row.get("AST")
-        if away_shots_on_target_cell is not None and not away_shots_on_target_cell:
-            away_shots_on_target_cell = None
-
-        home_fouls_cell = row.get("HF")
-        if home_fouls_cell is not None and not home_fouls_cell:
-            home_fouls_cell = None
-        away_fouls_cell = row.get("AF")
-        if away_fouls_cell is not None and not away_fouls_cell:
-            away_fouls_cell = None
-
-        home_yellow_cards_cell = row.get("HY")
-        if home_yellow_cards_cell is not None and not home_yellow_cards_cell:
-            home_yellow_cards_cell = None
-        away_yellow_cards_cell = row.get("AY")
-        if away_yellow_cards_cell is not None and not away_yellow_cards_cell:
-            away_yellow_cards_cell = None
-
-        home_red_cards_cell = row.get("HR")
-        if home_red_cards_cell is not None and not home_red_cards_cell:
-            home_red_cards_cell = None
-        away_red_cards_cell = row.get("AR")
-        if away_red_cards_cell is not None and not away_red_cards_cell:
-            away_red_cards_cell = None
-
-        home_odds_cell = row.get("B365H")
-        if home_odds_cell is not None and not home_odds_cell:
-            home_odds_cell = None
-        away_odds_cell = row.get("B365A")
-        if away_odds_cell is not None and not away_odds_cell:
-            away_odds_cell = None
-        draw_odds_cell = row.get("B365D")
-        if draw_odds_cell is not None and not draw_odds_cell:
-            draw_odds_cell = None
-
-        return create_footballdata_game_model(
-            session=self.session,
-            league=self.league,
-            date=date_cell,
-            time=time_cell,
-            home_team=home_team_cell,
-            away_team=away_team_cell,
-            full_time_home_goals=full_time_home_goals_cell,
-            full_time_away_goals=full_time_away_goals_cell,
-            referee=referee_cell,
-            home_shots=home_shots_cell,
-            away_shots=away_shots_cell,
-            home_shots_on_target=home_shots_on_target_cell,
-            away_shots_on_target=away_shots_on_target_cell,
-            home_fouls=home_fouls_cell,
-            away_fouls=away_fouls_cell,
-            home_yellow_cards=home_yellow_cards_cell,
-            away_yellow_cards=away_yellow_cards_cell,
-            home_red_cards=home_red_cards_cell,
-            away_red_cards=away_red_cards_cell,
-            home_odds=home_odds_cell,
-            away_odds=away_odds_cell,
-            draw_odds=draw_odds_cell,
+            return pd.DataFrame(columns=_GAME_COLUMNS)
+        df = df[df[div_headers[0]].isin(_DIVISIONS)]
+        if df.empty:
+            return pd.DataFrame(columns=_GAME_COLUMNS)
+        df = (
+            df.rename(columns=_COLUMNS)
+            .reindex(columns=list(_COLUMNS.values()), fill_value="")
+            .astype(object)
         )
+        for column in _STRIPPED_COLUMNS:
+            df[column] = df[column].str.strip()
+        df = df[df["date"] != ""]
+        optional_columns = [_COLUMNS[x] for x in _OPTIONAL_COLUMNS]
+        df[optional_columns] = df[optional_columns].replace("", None)
+        # Each game day has a handful of kick off times, so each is parsed once.
+        date_times = df["date"] + " " + df["time"]
+        dts = {x: _parse_dt(x) for x in date_times.unique()}
+        df.insert(
+            0,
+            "dt",
+            pd.Series([dts[x] for x in date_times], index=df.index, dtype=object),
+        )
+        return df.drop(columns=["date", "time"])
 
     @property
     def games(self) -> Iterator[GameModel]:
@@ -180,14 +176,16 @@ class FootballDataLeagueModel(LeagueModel):
                         with self.session.cache_disabled():
                             response = self.session.get(csv_url)
                         response.raise_for_status()
-                        handle = io.StringIO(response.text)
-                        cr = csv.DictReader(handle)
-                        for row in cr:
-                            game_model = self._row_to_game(row)
-                            if game_model is not None:
-                                pbar.update(1)
-                                pbar.set_description(f"FootballData - {game_model.dt}")
-                                yield game_model
+                        df = self._games_frame(response.text)
+                        for row in df.to_dict("records"):
+                            game_model = create_footballdata_game_model(
+                                session=self.session,
+                                league=self.league,
+                                **row,  # type: ignore
+                            )
+                            pbar.update(1)
+                            pbar.set_description(f"FootballData - {game_model.dt}")
+                            yield game_model
             except Exception as exc:
                 SHUTDOWN_FLAG.set()
                 raise exc
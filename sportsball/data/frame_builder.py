@@ -0,0 +1,143 @@
+"""A streaming builder of dataframe columns from flattened rows."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 4096
+
+
+_NONE_TYPE = type(None)
+_NUMBER_TYPES = {int, float, _NONE_TYPE}
+
+
+class _NullChunk:
+    """A run of missing values that has not been given a type yet."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+
+class _ColumnBuffer:
+    """The values of a single column, packed into typed chunks as they fill."""
+
+    def __init__(self) -> None:
+        self.chunks: list[np.ndarray | _NullChunk] = []
+        self.pending: list[Any] = []
+        self.size = 0
+        self.numeric = True
+        self.has_float = False
+
+    def pad(self, size: int) -> None:
+        """Back-fill missing values up to the size."""
+        missing = size - self.size - len(self.pending)
+        if missing > 0:
+            self.pending.extend([None] * missing)
+
+    def append(self, value: Any) -> None:
+        """Append a value to the column."""
+        self.pending.append(value)
+
+    def flush(self) -> None:
+        """Pack the pending values into a chunk."""
+        if not self.pending:
+            return
+        values = self.pending
+        self.pending = []
+        self.size += len(values)
+        types = set(map(type, values))
+        if types == {_NONE_TYPE}:
+            self.chunks.append(_NullChunk(len(values)))
+            return
+        if self.numeric and types <= _NUMBER_TYPES:
+            if types != {int}:
+                # numpy reads None as NaN for float arrays.
+                self.has_float = True
+                self.chunks.append(np.array(values, dtype=np.float64))
+                return
+            try:
+                self.chunks.append(np.array(values, dtype=np.int64))
+                return
+            except OverflowError:
+                pass
+        self.numeric = False
+        self.chunks.append(np.array(values, dtype=object))
+
+    def build(self) -> pd.Series:
+        """Join the chunks into a series, with the dtype a list would infer."""
+        self.flush()
+        chunks = self.chunks
+        self.chunks = []
+        if self.numeric:
+            if self.has_float or any(isinstance(x, _NullChunk) for x in chunks):
+                return pd.Series(
+                    np.concatenate(
+                        [
+                            np.full(x.size, np.nan)
+                            if isinstance(x, _NullChunk)
+                            else x.astype(np.float64)
+                            for x in chunks
+                        ]
+                    )
+                )
+            return pd.Series(np.concatenate(chunks))  # type: ignore
+        values: list[Any] = []
+        for chunk in chunks:
+            if isinstance(chunk, _NullChunk):
+                values.extend([None] * chunk.size)
+            else:
+                values.extend(chunk.tolist())
+        return pd.Series(values)
+
+
+class FrameBuilder:
+    """Builds dataframe columns from rows without holding the rows in memory.
+
+    Each row is appended straight into per-column buffers, which are packed
+    into typed numpy chunks every `chunk_size` rows. Columns that first appear
+    part way through are back-filled with nulls.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._chunk_size = chunk_size
+        self._columns: dict[str, _ColumnBuffer] = {}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def columns(self) -> set[str]:
+        """The columns seen so far."""
+        return set(self._columns.keys())
+
+    def append(self, row: dict[str, Any]) -> None:
+        """Append a flattened row."""
+        for col, value in row.items():
+            buffer = self._columns.get(col)
+            if buffer is None:
+                buffer = _ColumnBuffer()
+                self._columns[col] = buffer
+            buffer.pad(self._rows)
+            buffer.append(value)
+        self._rows += 1
+        if self._rows % self._chunk_size == 0:
+            self._flush()
+
+    def _flush(self) -> None:
+        for buffer in self._columns.values():
+            buffer.pad(self._rows)
+            buffer.flush()
+
+    def build(self) -> dict[str, pd.Series]:
+        """Release the buffers as a series per column."""
+        data = {}
+        for col in list(self._columns.keys()):
+            buffer = self._columns.pop(col)
+            buffer.pad(self._rows)
+            data[col] = buffer.build()
+        self._rows = 0
+        return data
@@ -0,0 +1,169 @@
+"""A process wide lookup of the timezone and altitude of a location."""
+
+import os
+import sqlite3
+import threading
+from typing import Any, Iterable
+
+import pytest_is_running
+import requests
+
+from ..cache import MEMORY
+
+GEO_PRECISION = 5
+ALTITUDE_BATCH_SIZE = 100
+_ALTITUDE_URL = "https://api.opentopodata.org/v1/aster30m?locations="
+
+_Location = tuple[float, float]
+
+
+def location_key(latitude: float, longitude: float) -> _Location:
+    """The rounded location that lookups are memoised under."""
+    return (round(latitude, GEO_PRECISION), round(longitude, GEO_PRECISION))
+
+
+class GeoService:
+    """Memoises the timezone and altitude of locations in an on-disk table.
+
+    A single TimezoneFinder is kept for the process, and altitudes are asked
+    of opentopodata in batches of up to `ALTITUDE_BATCH_SIZE` locations, made
+    up of the missing location and any that have been queued.
+    """
+
+    def __init__(self, path: str | None) -> None:
+        self._path = path
+        self._lock = threading.RLock()
+        self._connection: sqlite3.Connection | None = None
+        self._timezone_finder: Any = None
+        self._timezones: dict[_Location, str | None] = {}
+        self._altitudes: dict[_Location, float | None] = {}
+        self._queued: dict[_Location, None] = {}
+        self._requeued: set[_Location] = set()
+        self._loaded = False
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._path is None:
+            return
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS timezones "
+            "(latitude REAL, longitude REAL, timezone TEXT, "
+            "PRIMARY KEY (latitude, longitude))"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS altitudes "
+            "(latitude REAL, longitude REAL, altitude REAL, "
+            "PRIMARY KEY (latitude, longitude))"
+        )
+        for latitude, longitude, timezone in connection.execute(
+            "SELECT latitude, longitude, timezone FROM timezones"
+        ):
+            self._timezones[(latitude, longitude)] = timezone
+        for latitude, longitude, altitude in connection.execute(
+            "SELECT latitude, longitude, altitude FROM altitudes"
+        ):
+            self._altitudes[(latitude, longitude)] = altitude
+        self._connection = connection
+
+    def _store(self, table: str, rows: list[tuple[float, float, Any]]) -> None:
+        connection = self._connection
+        if connection is None or not rows:
+            return
+        with connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?)", rows
+            )
+
+    def timezone(self, latitude: float, longitude: float) -> str | None:
+        """The timezone of a location, if it falls within one."""
+        key = location_key(latitude, longitude)
+        with self._lock:
+            self._load()
+            if key in self._timezones:
+                return self._timezones[key]
+            if self._timezone_finder is None:
+                # pylint: disable=import-outside-toplevel
+                from timezonefinder import TimezoneFinder  # type: ignore
+
+                self._timezone_finder = TimezoneFinder()
+            timezone = self._timezone_finder.timezone_at(lng=key[1], lat=key[0])
+            self._timezones[key] = timezone
+            self._store("timezones", [(key[0], key[1], timezone)])
+            return timezone
+
+    def queue_altitudes(self, locations: Iterable[_Location]) -> None:
+        """Queue locations to be looked up with the next altitude miss."""
+        with self._lock:
+            self._load()
+            for latitude, longitude in locations:
+                key = location_key(latitude, longitude)
+                if key not in self._altitudes:
+                    self._queued[key] = None
+
+    def _requeue(self, locations: Iterable[_Location]) -> None:
+        # A location is only requeued once, so a bad one cannot fail every batch.
+        with self._lock:
+            for location in locations:
+                if location not in self._altitudes and location not in self._requeued:
+                    self._requeued.add(location)
+                    self._queued[location] = None
+
+    def altitude(
+        self, session: requests.Session, latitude: float, longitude: float
+    ) -> float | None:
+        """The altitude of a location in metres."""
+        key = location_key(latitude, longitude)
+        with self._lock:
+            self._load()
+            if key in self._altitudes:
+                return self._altitudes[key]
+            self._queued.pop(key, None)
+            batch = [key]
+            for queued in list(self._queued):
+                if len(batch) >= ALTITUDE_BATCH_SIZE:
+                    break
+                del self._queued[queued]
+                if queued not in self._altitudes:
+                    batch.append(queued)
+        # The request is made outside the lock, so other lookups are not held up by it.
+        try:
+            elevations = _fetch_altitudes(session, batch)
+        except Exception:  # pylint: disable=broad-exception-caught
+            if len(batch) == 1:
+                raise
+            # A bad queued location fails the whole batch, so it is left for a
+            # later miss and this location is asked for on its own.
+            self._requeue(batch[1:])
+            batch = [key]
+            elevations = _fetch_altitudes(session, batch)
+        with self._lock:
+            rows = []
+            for location, elevation in zip(batch, elevations):
+                self._altitudes[location] = elevation
+                rows.append((location[0], location[1], elevation))
+            self._store("altitudes", rows)
+            return self._altitudes.get(key)
+
+
+def _fetch_altitudes(
+    session: requests.Session, locations: list[_Location]
+) -> list[float | None]:
+    response = session.get(
+        _ALTITUDE_URL + "|".join(f"{x[0]},{x[1]}" for x in locations)
+    )
+    response.raise_for_status()
+    return [x["elevation"] for x in response.json()["results"]]
+
+
+# Tests keep their lookups in memory rather than in the user's cache.
+GEO_SERVICE = GeoService(
+    None
+    if pytest_is_running.is_running()
+    else os.path.join(MEMORY.location, "geo.sqlite")
+)
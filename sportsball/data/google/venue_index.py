@@ -0,0 +1,221 @@
+"""A pre-built SQLite index over the venue database.
+
+The venues and the searches that resolve to them are kept in venues.json,
+which is compiled into venues.sqlite with:
+
+python -m sportsball.data.google.venue_index
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+from collections import namedtuple
+from typing import Any
+
+VENUE_JSON = os.path.join(os.path.dirname(__file__), "venues.json")
+VENUE_SQLITE = os.path.join(os.path.dirname(__file__), "venues.sqlite")
+_SOURCE_HASH_KEY = "source_sha256"
+_VENUE_COLUMNS = [
+    "city",
+    "state",
+    "postal",
+    "lat",
+    "lng",
+    "housenumber",
+    "country",
+    "type",
+    "wiki",
+]
+_KM_PER_DEGREE = 111.195
+_EARTH_RADIUS_KM = 6371.0
+_NEAREST_START_DEGREES = 0.05
+
+SportsballGeocodeTuple = namedtuple(
+    "SportsballGeocodeTuple",
+    ["city", "state", "postal", "lat", "lng", "housenumber", "country"],
+)
+
+
+def normalise_query(query: str) -> str:
+    """The key a geocode query is stored under."""
+    query = query.replace("\n", "").replace("&nbsp;", " ")
+    return " ".join(query.split()).casefold()
+
+
+def _source_hash(json_path: str) -> str:
+    with open(json_path, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def build_venue_index(json_path: str = VENUE_JSON, path: str = VENUE_SQLITE) -> None:
+    """Compile the venue JSON into the SQLite index."""
+    with open(json_path, encoding="utf8") as handle:
+        venue_db = json.load(handle)
+    if os.path.exists(path):
+        os.remove(path)
+    connection = sqlite3.connect(path)
+    try:
+        connection.executescript(
+            f"""
+            CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+            CREATE TABLE venues (
+                id INTEGER PRIMARY KEY,
+                identifier TEXT UNIQUE,
+                {", ".join(_VENUE_COLUMNS)}
+            );
+            CREATE TABLE searches (
+                query TEXT PRIMARY KEY,
+                venue INTEGER REFERENCES venues (id)
+            ) WITHOUT ROWID;
+            CREATE VIRTUAL TABLE venue_locations USING rtree(
+                id, min_lat, max_lat, min_lng, max_lng
+            );
+            """
+        )
+        ids = {}
+        for count, (identifier, venue) in enumerate(venue_db["venues"].items()):
+            ids[identifier] = count
+            connection.execute(
+                f"INSERT INTO venues VALUES (?, ?{', ?' * len(_VENUE_COLUMNS)})",
+                [count, identifier] + [venue.get(x) for x in _VENUE_COLUMNS],
+            )
+            if venue["lat"] is not None and venue["lng"] is not None:
+                connection.execute(
+                    "INSERT INTO venue_locations VALUES (?, ?, ?, ?, ?)",
+                    [count, venue["lat"], venue["lat"], venue["lng"], venue["lng"]],
+                )
+        connection.executemany(
+            "INSERT OR REPLACE INTO searches VALUES (?, ?)",
+            [(normalise_query(k), ids[v]) for k, v in venue_db["searches"].items()],
+        )
+        connection.execute(
+            "INSERT INTO metadata VALUES (?, ?)",
+            [_SOURCE_HASH_KEY, _source_hash(json_path)],
+        )
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+
+
+def _distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    lat1, lng1, lat2, lng2 = map(math.radians, [lat1, lng1, lat2, lng2])
+    a = (
+        math.sin((lat2 - lat1) / 2.0) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2.0) ** 2
+    )
+    return 2.0 * _EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class VenueIndex:
+    """Read only lookups against the venue index, opened on first use."""
+
+    def __init__(self, path: str = VENUE_SQLITE) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _query(self, sql: str, parameters: list[Any]) -> list[sqlite3.Row]:
+        with self._lock:
+            connection = self._connection
+            if connection is None:
+                connection = sqlite3.connect(
+                    f"file:{self._path}?mode=ro&immutable=1",
+                    uri=True,
+                    check_same_thread=False,
+                )
+                connection.row_factory = sqlite3.Row
+                connection.execute("PRAGMA mmap_size = 67108864")
+                self._connection = connection
+            return connection.execute(sql, parameters).fetchall()
+
+    def source_hash(self) -> str | None:
+        """The hash of the venue JSON the index was built from."""
+        rows = self._query(
+            "SELECT value FROM metadata WHERE key = ?", [_SOURCE_HASH_KEY]
+        )
+        return rows[0]["value"] if rows else None
+
+    def search(self, query: str) -> SportsballGeocodeTuple | None:
+        """Find the geocode of a query."""
+        rows = self._query(
+            f"SELECT {', '.join(SportsballGeocodeTuple._fields)} FROM searches "
+            "JOIN venues ON venues.id = searches.venue WHERE query = ?",
+            [normalise_query(query)],
+        )
+        if not rows:
+            return None
+        return SportsballGeocodeTuple(*rows[0])
+
+    def _within(
+        self, latitude: float, longitude: float, lat_delta: float, lng_delta: float
+    ) -> list[dict[str, Any]]:
+        # The R*Tree holds 32 bit floats rounded outwards, so it finds a superset
+        # of the venues in the box and the exact locations come from venues.
+        rows = self._query(
+            f"SELECT {', '.join(_VENUE_COLUMNS)} FROM venue_locations "
+            "JOIN venues ON venues.id = venue_locations.id "
+            "WHERE max_lat >= ? AND min_lat <= ? AND max_lng >= ? AND min_lng <= ? "
+            "ORDER BY venues.id",
+            [
+                latitude - lat_delta,
+                latitude + lat_delta,
+                longitude - lng_delta,
+                longitude + lng_delta,
+            ],
+        )
+        return [dict(x) for x in rows]
+
+    def venue_at(self, latitude: float, longitude: float) -> dict[str, Any] | None:
+        """Find the first venue at exactly the location."""
+        for venue in self._within(latitude, longitude, 0.0, 0.0):
+            if venue["lat"] == latitude and venue["lng"] == longitude:
+                return venue
+        return None
+
+    def nearest(
+        self, latitude: float, longitude: float, max_distance_km: float | None = None
+    ) -> dict[str, Any] | None:
+        """Find the venue closest to the location."""
+        lat_delta = _NEAREST_START_DEGREES
+        while True:
+            lng_delta = min(
+                180.0, lat_delta / max(math.cos(math.radians(latitude)), 0.01)
+            )
+            candidates = self._within(latitude, longitude, lat_delta, lng_delta)
+            if candidates or lat_delta >= 180.0:
+                break
+            lat_delta *= 4.0
+        if not candidates:
+            return None
+        # The closest venue in the box may still be beaten by one just outside
+        # its corners, so search again over a box covering that distance.
+        distance = min(
+            _distance_km(latitude, longitude, x["lat"], x["lng"]) for x in candidates
+        )
+        lat_delta = min(180.0, distance / _KM_PER_DEGREE)
+        lng_delta = min(180.0, lat_delta / max(math.cos(math.radians(latitude)), 0.01))
+        candidates = self._within(
+            latitude, longitude, lat_delta * 1.01, lng_delta * 1.01
+        )
+        venue = min(
+            candidates,
+            key=lambda x: _distance_km(latitude, longitude, x["lat"], x["lng"]),
+        )
+        if (
+            max_distance_km is not None
+            and _distance_km(latitude, longitude, venue["lat"], venue["lng"])
+            > max_distance_km
+        ):
+            return None
+        return venue
+
+
+VENUE_INDEX = VenueIndex()
+
+
+if __name__ == "__main__":
+    build_venue_index()
@@ -6,6 +6,7 @@ import logging
 import threading
 from typing import Any, Callable, Iterator, Type, get_args, get_origin
 
+import numpy as np
 import pandas as pd
 import tqdm
 from flatten_json import flatten  # type: ignore
@@ -15,6 +16,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 from .address_model import ADDRESS_TIMEZONE_COLUMN
 from .delimiter import DELIMITER
 from .field_type import FieldType
+from .frame_builder import FrameBuilder
 from .game_model import GAME_DT_COLUMN, VENUE_COLUMN_PREFIX, GameModel
 from .league import League
 from .model import Model
@@ -23,6 +25,7 @@ from .venue_model import VENUE_ADDRESS_COLUMN
 LEAGUE_COLUMN = "league"
 SHUTDOWN_FLAG = threading.Event()
 TIMEOUT_DT = datetime.datetime.now() + datetime.timedelta(days=365)
+SINCE_DATE: datetime.date | None = None
 
 
 def _clear_column_list(df: pd.DataFrame) -> pd.DataFrame:
@@ -43,48 +46,94 @@ def _reduce_memory_usage(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _normalize_tz(df: pd.DataFrame) -> pd.DataFrame:
-    tz_column = DELIMITER.join(
-        [VENUE_COLUMN_PREFIX, VENUE_ADDRESS_COLUMN, ADDRESS_TIMEZONE_COLUMN]
-    )
-    if tz_column not in df.columns.values.tolist():
-        return df
-    df = df.dropna(subset=tz_column)
+def _localize_value(value: Any, tz: str) -> Any:
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        value = pd.to_datetime(value)
+    if value.tz is None:
+        return value.tz_localize(tz, ambiguous=True, nonexistent="shift_forward")
+    if str(value.tz) != str(tz):
+        return value.tz_convert(tz)
+    return value
 
-    tqdm.tqdm.pandas(desc="Timezone Conversions")
 
-    # Check each row to see if they have the correct timezone
-    dt_cols = set()
+def _localize_column(series: pd.Series, tz: str) -> pd.Series:
+    if series.dt.tz is None:
+        return series.dt.tz_localize(
+            tz,
+            ambiguous=np.ones(len(series), dtype=bool),
+            nonexistent="shift_forward",
+        )
+    if str(series.dt.tz) != str(tz):
+        return series.dt.tz_convert(tz)
+    return series
 
-    def apply_tz(row: pd.Series) -> pd.Series:
-        if tz_column not in row:
-            return row
-        tz = row[tz_column]
-        if pd.isnull(tz):
-            return row
 
-        datetime_cols = {
-            col for col, val in row.items() if isinstance(val, pd.Timestamp)
+def _is_datetime_column(series: pd.Series) -> bool:
+    if isinstance(series.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(
+        series.dtype
+    ):
+        return True
+    if series.dtype == object:
+        # Timestamps of mixed timezones infer as datetime rather than datetime64.
+        return pd.api.types.infer_dtype(series, skipna=True) in {
+            "datetime64",
+            "datetime",
         }
-        datetime_cols.add(GAME_DT_COLUMN)
-        for col in datetime_cols:
-            dt_cols.add(col)
-            dt = row[col]  # type: ignore
-            if isinstance(dt, (datetime.date, datetime.datetime)):
-                dt = pd.to_datetime(dt)
-            if dt.tz is None:
-                row[col] = dt.tz_localize(
-                    tz, ambiguous=True, nonexistent="shift_forward"
-                )
-            elif str(dt.tz) != str(tz):
-                row[col] = dt.tz_convert(tz)
+    return False
 
-        return row
 
-    for dt_col in dt_cols:
-        df[dt_col] = pd.to_datetime(df[dt_col])
+def _to_datetime(series: pd.Series) -> pd.Series:
+    try:
+        return pd.to_datetime(series)
+    except (TypeError, ValueError):
+        pass
+    values = series.dropna()
+    if values.empty or not all(getattr(x, "tzinfo", None) is not None for x in values):
+        # Naive values would be taken as UTC rather than the venue timezone.
+        return series
+    try:
+        return pd.to_datetime(series, utc=True)
+    except (TypeError, ValueError):
+        return series
 
-    return df.progress_apply(apply_tz, axis=1)  # type: ignore
+
+def _normalize_tz(df: pd.DataFrame) -> pd.DataFrame:
+    tz_column = DELIMITER.join(
+        [VENUE_COLUMN_PREFIX, VENUE_ADDRESS_COLUMN, ADDRESS_TIMEZONE_COLUMN]
+    )
+    if tz_column not in df.columns.values.tolist():
+        return df
+    df = df.dropna(subset=tz_column)
+
+    groups = df.groupby(tz_column, sort=False).indices
+    dt_cols = [x for x in df.columns if _is_datetime_column(df[x])]
+    if GAME_DT_COLUMN in df.columns and GAME_DT_COLUMN not in dt_cols:
+        dt_cols.append(GAME_DT_COLUMN)
+
+    columns = {}
+    for col in tqdm.tqdm(dt_cols, desc="Timezone Conversions"):
+        series = df[col]
+        if not _is_datetime_column(series) or series.dtype == object:
+            series = _to_datetime(series)
+        if series.dtype == object:
+            # Mixed values that pandas can't hold as one datetime column.
+            values = series.to_numpy(copy=True)
+            for tz, idx in groups.items():
+                values[idx] = [_localize_value(x, tz) for x in values[idx]]
+            columns[col] = pd.Series(values, index=df.index)
+            continue
+        if len(groups) == 1:
+            tz = next(iter(groups))
+            columns[col] = _localize_column(series, tz)
+            continue
+        values = np.empty(len(series), dtype=object)
+        for tz, idx in groups.items():
+            values[idx] = _localize_column(series.iloc[idx], tz).astype(object)
+        columns[col] = pd.Series(values, index=df.index)
+
+    if not columns:
+        return df
+    return df.assign(**columns)
 
 
 def _find_nested_paths(
@@ -174,6 +223,15 @@ def needs_shutdown() -> bool:
     return False
 
 
+def before_since(dt: datetime.date | None) -> bool:
+    """Whether the date is older than an incremental export needs."""
+    if SINCE_DATE is None or dt is None:
+        return False
+    if isinstance(dt, datetime.datetime):
+        dt = dt.date()
+    return dt < SINCE_DATE
+
+
 class LeagueModel(Model):
     """The prototype league model class."""
 
@@ -192,6 +250,15 @@ class LeagueModel(Model):
         """The name of the league model."""
         raise NotImplementedError("name is not implemented by parent class.")
 
+    @classmethod
+    def date_disorder(cls) -> datetime.timedelta | None:
+        """How far behind the newest game yielded so far a later game can be.
+
+        None means the games come in no date order, so a combined league has to
+        wait for the model to finish before it can combine any of them.
+        """
+        return None
+
     @property
     def games(self) -> Iterator[GameModel]:
         """Find all the games in this league."""
@@ -204,20 +271,22 @@ class LeagueModel(Model):
 
     def to_frame(self) -> pd.DataFrame:
         """Render the league as a dataframe."""
-        jsonl: list[dict[str, Any]] = []
-        cols: set[str] = set()
+        builder = FrameBuilder()
         for game in tqdm.tqdm(self.games, desc="Games"):
-            game_dict = flatten(
-                game.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
-                DELIMITER,
+            if before_since(game.dt):
+                continue
+            builder.append(
+                flatten(
+                    game.model_dump(
+                        by_alias=True, exclude_none=True, exclude_unset=True
+                    ),
+                    DELIMITER,
+                )
             )
-            jsonl.append(game_dict)
-            cols |= set(game_dict.keys())
-
-        data: dict[str, Any] = {x: [] for x in cols}
-        for json_dict in jsonl:
-            for col in cols:
-                data[col].append(json_dict.get(col))
+        if not len(builder):
+            return pd.DataFrame()
+        cols = builder.columns
+        data: dict[str, Any] = builder.build()
 
         categorical_cols = set(
             _find_nested_field_type_paths(FieldType.CATEGORICAL, GameModel, list(cols))
@@ -2,12 +2,11 @@
 
 # pylint: disable=too-many-arguments,line-too-long,duplicate-code
 import datetime
+from typing import Any
 
-import pandas as pd
 import pytest_is_running
 import pytz
 import requests_cache
-from dateutil.parser import parse
 
 from ....cache import MEMORY
 from ...game_model import VERSION, GameModel
@@ -26,16 +25,17 @@ _SEASON_TYPE_MAP = {
 
 
 def _create_nba_nba_game_model(
-    row: pd.Series,
+    row: dict[str, Any],
     league: League,
     week: int,
     game_number: int,
     session: requests_cache.CachedSession,
+    dt: datetime.datetime,
     league_id: str,
     version: str,
 ) -> GameModel:
     season_id = row["SEASON_ID"]
-    dt = pytz.timezone("EST").localize(parse(row["GAME_DATE"]))
+    dt = pytz.timezone("EST").localize(dt)
     return GameModel(
         dt=dt,
         week=week,
@@ -67,11 +67,12 @@ def _create_nba_nba_game_model(
 
 @MEMORY.cache(ignore=["session"])
 def _cached_create_nba_nba_game_model(
-    row: pd.Series,
+    row: dict[str, Any],
     league: League,
     week: int,
     game_number: int,
     session: requests_cache.CachedSession,
+    dt: datetime.datetime,
     league_id: str,
     version: str,
 ) -> GameModel:
@@ -82,13 +83,14 @@ def _cached_create_nba_nba_game_model(
         week,
         game_number,
         session,
+        dt,
         league_id,
         version=version,
     )
 
 
 def create_nba_nba_game_model(
-    row: pd.Series,
+    row: dict[str, Any],
     league: League,
     week: int,
     game_number: int,
@@ -107,6 +109,7 @@ def create_nba_nba_game_model(
             week,
             game_number,
             session,
+            dt,
             league_id,
             version=VERSION,
         )
@@ -117,6 +120,7 @@ def create_nba_nba_game_model(
             week,
             game_number,
             session,
+            dt,
             league_id,
             version=VERSION,
         )
@@ -1,11 +1,10 @@
 """NBA NBA league model."""
 
 import datetime
-from typing import Iterator, TypedDict
+from typing import Any, Iterator, TypedDict
 
 import pandas as pd
 import tqdm
-from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
 from nba_api.library.http import NBAHTTP  # type: ignore
 from nba_api.stats.endpoints import leaguegamefinder  # type: ignore
@@ -18,7 +17,7 @@ from .nba_nba_game_model import create_nba_nba_game_model
 
 
 def _combine_team_games(df: pd.DataFrame, keep_method="home") -> pd.DataFrame:
-    """Combine a TEAM_ID-GAME_ID unique table into rows by game. Slow.
+    """Combine a TEAM_ID-GAME_ID unique table into rows by game.
 
     Parameters
     ----------
@@ -35,38 +34,64 @@ def _combine_team_games(df: pd.DataFrame, keep_method="home") -> pd.DataFrame:
     -------
     result : DataFrame
     """
-    # Join every row to all others with the same game ID.
-    joined = pd.merge(
-        df, df, suffixes=["_A", "_B"], on=["SEASON_ID", "GAME_ID", "GAME_DATE"]
-    )
-    # Filter out any row that is joined to itself.
-    result = joined[joined.TEAM_ID_A != joined.TEAM_ID_B]
-    # Take action based on the keep_method flag.
+    # Take action based on the keep_method flag, before the join so that only
+    # the kept TEAM_A rows are joined.
     if keep_method is None:
-        # Return all the rows.
-        pass
+        # Keep all the rows.
+        kept = df
     elif keep_method.lower() == "home":
         # Keep rows where TEAM_A is the home team.
-        result = result[result.MATCHUP_A.str.contains(" vs. ")]
+        kept = df[df.MATCHUP.str.contains(" vs. ", regex=False)]
     elif keep_method.lower() == "away":
         # Keep rows where TEAM_A is the away team.
-        result = result[result.MATCHUP_A.str.contains(" @ ")]
+        kept = df[df.MATCHUP.str.contains(" @ ", regex=False)]
     elif keep_method.lower() == "winner":
-        result = result[result.WL_A == "W"]
+        kept = df[df.WL == "W"]
     elif keep_method.lower() == "loser":
-        result = result[result.WL_A == "L"]
+        kept = df[df.WL == "L"]
     else:
         raise ValueError(f"Invalid keep_method: {keep_method}")
-    return result
+    # Join every kept row to all others with the same game ID.
+    joined = pd.merge(
+        kept, df, suffixes=["_A", "_B"], on=["SEASON_ID", "GAME_ID", "GAME_DATE"]
+    )
+    # Filter out any row that is joined to itself.
+    return joined[joined.TEAM_ID_A != joined.TEAM_ID_B]
+
+
+class _SeasonInfo(TypedDict):
+    start: datetime.datetime
+    games: int
+
+
+def _game_records(
+    all_games: pd.DataFrame, seasons: dict[str, _SeasonInfo]
+) -> Iterator[tuple[dict[str, Any], datetime.datetime, int, int]]:
+    """Find the record, date, week and season game number of each game."""
+    season_ids = all_games["SEASON_ID"]
+    dts = pd.to_datetime(all_games["GAME_DATE"], format="ISO8601")
+    # A season carries its start and game count over from the windows already
+    # produced.
+    for season_id, start in dts.groupby(season_ids, sort=False).first().items():
+        seasons.setdefault(season_id, {"start": start.to_pydatetime(), "games": 0})
+    starts = pd.to_datetime(season_ids.map({k: v["start"] for k, v in seasons.items()}))
+    weeks = ((dts - starts).dt.days / 7).astype(int)
+    game_numbers = season_ids.groupby(season_ids).cumcount() + season_ids.map(
+        {k: v["games"] for k, v in seasons.items()}
+    )
+    for season_id, count in season_ids.value_counts().items():
+        seasons[season_id]["games"] += int(count)
+    return zip(
+        all_games.to_dict("records"),
+        dts.dt.to_pydatetime(),
+        weeks.tolist(),
+        game_numbers.tolist(),
+    )
 
 
 class NBANBALeagueModel(LeagueModel):
     """NBA NBA implementation of the league model."""
 
-    class _SeasonInfo(TypedDict):
-        start: datetime.datetime
-        games: int
-
     def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
         super().__init__(League.NBA, session, position=position)
         self._league_id = "00"
@@ -82,24 +107,14 @@ class NBANBALeagueModel(LeagueModel):
         seasons: dict[str, _SeasonInfo],
         pbar: tqdm.tqdm,
     ) -> Iterator[GameModel]:
-        for _, row in all_games.iterrows():
+        for row, dt, week, game_number in _game_records(all_games, seasons):
             if needs_shutdown():
                 return
-            season_id = row["SEASON_ID"]
-            dt = parse(row["GAME_DATE"])
-            season_info = seasons.get(
-                season_id,
-                {
-                    "start": dt,
-                    "games": 0,
-                },
-            )
-            week = int((dt - season_info["start"]).days / 7)
-            game_model = create_nba_nba_game_model(  # type: ignore
+            game_model = create_nba_nba_game_model(
                 row,
                 self.league,
                 week,
-                season_info["games"],  # type: ignore
+                game_number,
                 self.session,
                 dt,
                 self._league_id,
@@ -109,14 +124,12 @@ class NBANBALeagueModel(LeagueModel):
                 f"NBA API {game_model.year} - {game_model.season_type} - {game_model.dt}"
             )
             yield game_model
-            season_info["games"] += 1
-            seasons[season_id] = season_info
 
     @property
     def games(self) -> Iterator[GameModel]:
         try:
             to_date = datetime.datetime.today().date()
-            seasons: dict[str, NBANBALeagueModel._SeasonInfo] = {}
+            seasons: dict[str, _SeasonInfo] = {}
             first_call = False
             with tqdm.tqdm(position=self.position) as pbar:
                 while True:
@@ -137,7 +150,9 @@ class NBANBALeagueModel(LeagueModel):
                         )
 
                     all_games = _combine_team_games(result.get_data_frames()[0])
-                    all_games = all_games.sort_values(by="GAME_DATE", ascending=True)
+                    all_games = all_games.sort_values(
+                        by="GAME_DATE", ascending=True, kind="stable"
+                    )
                     if all_games.empty:
                         break
                     yield from self._produce_games(all_games, seasons, pbar)
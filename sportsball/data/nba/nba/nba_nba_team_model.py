@@ -2,9 +2,9 @@
 
 # pylint: disable=too-many-arguments,unused-argument,duplicate-code
 import datetime
+from typing import Any
 
 import numpy as np
-import pandas as pd
 import pytest_is_running
 import requests_cache
 
@@ -16,7 +16,7 @@ from ...x.x_social_model import create_x_social_model
 
 
 def _create_nba_nba_team_model(
-    row: pd.Series,
+    row: dict[str, Any],
     home: bool,
     session: requests_cache.CachedSession,
     dt: datetime.datetime,
@@ -692,7 +692,7 @@ def _create_nba_nba_team_model(
 
 @MEMORY.cache(ignore=["session"])
 def _cached_create_nba_nba_team_model(
-    row: pd.Series,
+    row: dict[str, Any],
     home: bool,
     session: requests_cache.CachedSession,
     dt: datetime.datetime,
@@ -712,7 +712,7 @@ def _cached_create_nba_nba_team_model(
 
 
 def create_nba_nba_team_model(
-    row: pd.Series,
+    row: dict[str, Any],
     home: bool,
     session: requests_cache.CachedSession,
     dt: datetime.datetime,
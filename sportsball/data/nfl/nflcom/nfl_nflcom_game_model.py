@@ -4,10 +4,9 @@ import datetime
 from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
-from playwright.sync_api import Playwright
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
-from ....playwright import ensure_install
+from ....playwright import BROWSER_POOL
 from ...game_model import GameModel
 from ...league import League
 from ...team_model import VERSION
@@ -19,7 +18,6 @@ from .nfl_nflcom_venue_model import create_nfl_nflcom_venue_model
 def create_nfl_nflcom_game_model(
     url: str,
     session: ScrapeSession,
-    playwright: Playwright,
     version: str,
 ) -> GameModel:
     """Create a game model from NFL.com."""
@@ -27,12 +25,9 @@ def create_nfl_nflcom_game_model(
     end_path_split = o.path.split("/")[-1].split("-")
     week = int(end_path_split[-1])
 
-    ensure_install()
-    browser = playwright.chromium.launch()
-    context = browser.new_context()
-    page = context.new_page()
-    page.goto(url, wait_until="load")
-    soup = BeautifulSoup(page.content(), "lxml")
+    with BROWSER_POOL.page() as page:
+        page.goto(url, wait_until="load")
+        soup = BeautifulSoup(page.content(), "lxml")
 
     dt = None
     for time in soup.find_all("time"):
@@ -4,10 +4,9 @@ import urllib.parse
 from typing import Iterator
 
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
-from ....playwright import ensure_install
+from ....playwright import BROWSER_POOL
 from ...game_model import VERSION, GameModel
 from ...league import League
 from ...league_model import SHUTDOWN_FLAG, LeagueModel
@@ -27,11 +26,7 @@ class NFLNFLComLeagueModel(LeagueModel):
     @property
     def games(self) -> Iterator[GameModel]:
         try:
-            ensure_install()
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                context = browser.new_context()
-                page = context.new_page()
+            with BROWSER_POOL.page() as page:
                 url = "https://www.nfl.com/schedules/"
                 try:
                     page.goto(
@@ -48,13 +43,12 @@ class NFLNFLComLeagueModel(LeagueModel):
                 ):
                     game_url = urllib.parse.urljoin(url, a.get("href"))
                     game_urls.append(game_url)
-                for game_url in game_urls:
-                    yield create_nfl_nflcom_game_model(
-                        url=game_url,
-                        session=self.session,
-                        playwright=p,
-                        version=VERSION,
-                    )
+            for game_url in game_urls:
+                yield create_nfl_nflcom_game_model(
+                    url=game_url,
+                    session=self.session,
+                    version=VERSION,
+                )
         except Exception as exc:
             SHUTDOWN_FLAG.set()
             raise exc
@@ -3,9 +3,13 @@
 # pylint: disable=too-many-locals
 import base64
 import binascii
+import functools
+import hashlib
 import json
 import logging
+import threading
 import urllib.parse
+from collections import namedtuple
 from typing import Any
 
 import requests
@@ -16,51 +20,107 @@ from cryptography.hazmat.primitives.hashes import SHA256
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
+_BundleSecrets = namedtuple("_BundleSecrets", ["digest", "salt", "password"])
+_BUNDLE_SECRETS: dict[str, _BundleSecrets] = {}
+_BUNDLE_SECRETS_LOCK = threading.Lock()
+
+
+def _find_bundle_url(soup: BeautifulSoup, referer_url: str) -> str | None:
+    for script in soup.find_all("script"):
+        src = script.get("src")
+        if src is None:
+            continue
+        if ("/app-" in src and src.endswith(".js")) or "/app.js" in src:
+            return urllib.parse.urljoin(referer_url, src)
+    return None
+
+
+def _parse_bundle(text: str) -> tuple[bytes, bytes]:
+    sentinel = 'break}return e.next=9,g(r.data,"'
+    variables = text[text.find(sentinel) + len(sentinel) :]
+    variables = variables[
+        : variables.find('");case 9:return s=e.sent,l=JSON.parse(s),e.abrupt')
+    ]
+    try:
+        password_str, salt_str = variables.split('","')
+    except ValueError:
+        sentinel = "YupiOddsPortal"
+        variables = text[: text.find(sentinel) + len(sentinel)]
+        variables = '"'.join(variables.split('"')[-3:])
+        password_str, salt_str = variables.split('","')
+    return str.encode(salt_str), str.encode(password_str)
+
 
 def _find_decryption_data(
     session: ScrapeSession,
     soup: BeautifulSoup,
     referer_url: str,
     user_agent: str | None = None,
+    refresh: bool = False,
 ) -> tuple[bytes, bytes]:
-    salt: bytes | None = None
-    password: bytes | None = None
-    for script in soup.find_all("script"):
-        src = script.get("src")
-        if src is None:
-            continue
-        if ("/app-" in src and src.endswith(".js")) or "/app.js" in src:
-            src_url = urllib.parse.urljoin(referer_url, src)
-            headers = {}
-            if user_agent is not None:
-                headers["User-Agent"] = user_agent
-            with session.wayback_disabled():
-                src_response = session.get(src_url, headers=headers)
-            src_response.raise_for_status()
-            variables = src_response.text
-            sentinel = 'break}return e.next=9,g(r.data,"'
-            variables = variables[variables.find(sentinel) + len(sentinel) :]
-            variables = variables[
-                : variables.find('");case 9:return s=e.sent,l=JSON.parse(s),e.abrupt')
-            ]
-            try:
-                password_str, salt_str = variables.split('","')
-            except ValueError:
-                sentinel = "YupiOddsPortal"
-                variables = src_response.text
-                variables = variables[: variables.find(sentinel) + len(sentinel)]
-                variables = '"'.join(variables.split('"')[-3:])
-                password_str, salt_str = variables.split('","')
-            salt = str.encode(salt_str)
-            password = str.encode(password_str)
-            break
-    if salt is None:
+    src_url = _find_bundle_url(soup, referer_url)
+    if src_url is None:
         raise ValueError(f"salt is null for {referer_url}.")
-    if password is None:
-        raise ValueError("password is null.")
+    with _BUNDLE_SECRETS_LOCK:
+        secrets = _BUNDLE_SECRETS.get(src_url)
+    if secrets is not None and not refresh:
+        return secrets.salt, secrets.password
+
+    headers = {}
+    if user_agent is not None:
+        headers["User-Agent"] = user_agent
+    with session.wayback_disabled():
+        if refresh:
+            with session.cache_disabled():
+                src_response = session.get(src_url, headers=headers)
+        else:
+            src_response = session.get(src_url, headers=headers)
+    src_response.raise_for_status()
+    digest = hashlib.sha256(src_response.content).hexdigest()
+    if secrets is not None and secrets.digest == digest:
+        return secrets.salt, secrets.password
+    salt, password = _parse_bundle(src_response.text)
+    with _BUNDLE_SECRETS_LOCK:
+        _BUNDLE_SECRETS[src_url] = _BundleSecrets(digest, salt, password)
     return salt, password
 
 
+@functools.lru_cache(maxsize=16)
+def _derive_key(salt: bytes, password: bytes) -> bytes:
+    kdf = PBKDF2HMAC(
+        algorithm=SHA256(),
+        length=32,
+        salt=salt,
+        iterations=1000,
+        backend=default_backend(),
+    )
+    return kdf.derive(password)
+
+
+def _decrypt(content: bytes, url: str, salt: bytes, password: bytes) -> dict[str, Any]:
+    try:
+        decoded_data = base64.b64decode(content).decode()
+    except (UnicodeDecodeError, binascii.Error) as exc:
+        logging.error("URL: %s", url)
+        logging.error("Error base64 decoding payload: %s", content)
+        raise exc
+    encrypted, key = decoded_data.split(":")
+    encrypted_bytes = base64.urlsafe_b64decode(encrypted)
+    key_bytes = bytes.fromhex(key)
+    cipher = Cipher(
+        algorithms.AES(_derive_key(salt, password)),
+        modes.CBC(key_bytes),
+        backend=default_backend(),
+    )
+    decryptor = cipher.decryptor()
+    decrypted_bytes = decryptor.update(encrypted_bytes) + decryptor.finalize()
+    decrypted_data = decrypted_bytes.decode("utf-8")
+    end_of_json = decrypted_data.rfind("}")
+    if end_of_json != -1:
+        decrypted_data = decrypted_data[: end_of_json + 1]
+    return json.loads(decrypted_data)
+
+
 def fetch_data(
     url: str,
     session: ScrapeSession,
@@ -68,7 +128,13 @@ def fetch_data(
     soup: BeautifulSoup,
     user_agent: str | None = None,
 ) -> dict[str, Any]:
-    """Fetch the data from the URL and decrypt it."""
+    """Fetch the data from the URL and decrypt it.
+
+    The salt and password are cached per app bundle URL and the derived AES key
+    per salt and password, so both are only worked out once per bundle. If
+    decryption fails the bundle is fetched again, and the new secrets are used
+    if its contents have changed.
+    """
     salt, password = _find_decryption_data(
         session, soup, referer_url, user_agent=user_agent
     )
@@ -90,29 +156,11 @@ def fetch_data(
         raise exc
 
     try:
-        decoded_data = base64.b64decode(response.content).decode()
-    except (UnicodeDecodeError, binascii.Error) as exc:
-        logging.error("URL: %s", url)
-        logging.error("Error base64 decoding payload: %s", response.content)
-        raise exc
-    encrypted, key = decoded_data.split(":")
-    encrypted_bytes = base64.urlsafe_b64decode(encrypted)
-    key_bytes = bytes.fromhex(key)
-    kdf = PBKDF2HMAC(
-        algorithm=SHA256(),
-        length=32,
-        salt=salt,
-        iterations=1000,
-        backend=default_backend(),
-    )
-    aes_key = kdf.derive(password)
-    cipher = Cipher(
-        algorithms.AES(aes_key), modes.CBC(key_bytes), backend=default_backend()
-    )
-    decryptor = cipher.decryptor()
-    decrypted_bytes = decryptor.update(encrypted_bytes) + decryptor.finalize()
-    decrypted_data = decrypted_bytes.decode("utf-8")
-    end_of_json = decrypted_data.rfind("}")
-    if end_of_json != -1:
-        decrypted_data = decrypted_data[: end_of_json + 1]
-    return json.loads(decrypted_data)
+        return _decrypt(response.content, url, salt, password)
+    except ValueError as exc:
+        refreshed = _find_decryption_data(
+            session, soup, referer_url, user_agent=user_agent, refresh=True
+        )
+        if refreshed == (salt, password):
+            raise exc
+        return _decrypt(response.content, url, *refreshed)
@@ -14,8 +14,8 @@ from .delimiter import DELIMITER
 from .field_type import FFILL_KEY, TYPE_KEY, FieldType
 from .owner_model import VERSION as OWNER_VERSION
 from .owner_model import OwnerModel
-from .sex import (FEMALE_GENDERS, GENDER_DETECTOR, MALE_GENDERS,
-                  UNCERTAIN_GENDERS, Sex)
+from .sex import (FEMALE_GENDERS, MALE_GENDERS, UNCERTAIN_GENDERS, Sex,
+                  gender_detector)
 from .venue_model import VERSION as VENUE_VERSION
 from .venue_model import VenueModel
 
@@ -1676,7 +1676,7 @@ VERSION = DELIMITER.join(["0.0.16", ADDRESS_VERSION, OWNER_VERSION, VENUE_VERSIO
 
 def _guess_sex(data: dict[str, Any]) -> str | None:
     name = data[PLAYER_NAME_COLUMN]
-    gender_tag = GENDER_DETECTOR.get_gender(name)
+    gender_tag = gender_detector().get_gender(name)
     if gender_tag in MALE_GENDERS:
         return str(Sex.MALE)
     if gender_tag in FEMALE_GENDERS:
@@ -1729,7 +1729,7 @@ def _calculate_total_rebounds(data: dict[str, Any]) -> int | None:
     if offensive_rebounds is None:
         return None
     defensive_rebounds = data.get(PLAYER_DEFENSIVE_REBOUNDS_COLUMN)
-    if defensive_rebounds:
+    if defensive_rebounds is None:
         return None
     return offensive_rebounds + defensive_rebounds
 
@@ -1,8 +1,8 @@
 """The enumeration of the different supported sexes."""
 
+import functools
 from enum import StrEnum
-
-import gender_guesser.detector as gender  # type: ignore
+from typing import Any
 
 
 class Sex(StrEnum):
@@ -18,7 +18,6 @@ class Sex(StrEnum):
     RIG = "rig"
 
 
-GENDER_DETECTOR = gender.Detector()
 MALE_GENDERS = {"male", "mostly_male"}
 FEMALE_GENDERS = {"female", "mostly_female"}
 UNCERTAIN_GENDERS = {"andy", "unknown"}
@@ -26,6 +25,15 @@ UNCERTAIN_GENDERS = {"andy", "unknown"}
 _SEX = {str(x): x for x in Sex}
 
 
+@functools.cache
+def gender_detector() -> Any:
+    """The gender detector, loaded on first use as its name list is large."""
+    # pylint: disable=import-outside-toplevel
+    import gender_guesser.detector as gender  # type: ignore
+
+    return gender.Detector()
+
+
 def sex_from_str(sex_str: str) -> Sex:
     """Find a sex from a string."""
     sex_str = sex_str.lower().strip()
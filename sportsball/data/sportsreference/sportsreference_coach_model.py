@@ -7,13 +7,13 @@ import os
 from urllib.parse import urlparse
 
 import pytest_is_running
-from bs4 import BeautifulSoup
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...cache import MEMORY
 from ..coach_model import VERSION, CoachModel
+from .sportsreference_document import parse_sportsreference_document
 
 _NON_WAYBACK_URLS: set[str] = {
     "https://www.sports-reference.com/cbb/coaches/kelvin-sampson-1.html",
@@ -37,7 +37,7 @@ def _create_sportsreference_coach_model(
     else:
         response = session.get(coach_url)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "lxml")
+    soup = parse_sportsreference_document(response).soup
 
     name = None
     for h1 in soup.find_all("h1"):
@@ -0,0 +1,78 @@
+"""A Sports Reference page shared by the models built from it."""
+
+import collections
+import functools
+import io
+import threading
+from typing import Any
+
+import extruct  # type: ignore
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+# The documents are bounded by the length of their pages, as the soup of a
+# page takes a multiple of its text.
+_MAX_CACHED_TEXT = 16 * 1024 * 1024
+_DOCUMENTS: collections.OrderedDict[str, "SportsReferenceDocument"] = (
+    collections.OrderedDict()
+)
+_DOCUMENTS_LOCK = threading.Lock()
+
+
+class SportsReferenceDocument:
+    """A Sports Reference page, shared by the models reading it.
+
+    The soup, the tables and the structured data of the page are each built
+    the first time they are used. Each of them reads the page text on its own,
+    as read_html and extruct cannot take the soup, but none is built twice.
+    """
+
+    def __init__(self, url: str, text: str) -> None:
+        self.url = url
+        self.text = text
+        self._structured_data: dict[str, dict[str, list[dict[str, Any]]]] = {}
+
+    @functools.cached_property
+    def soup(self) -> BeautifulSoup:
+        """The soup of the page."""
+        return BeautifulSoup(self.text, "lxml")
+
+    @functools.cached_property
+    def _tables(self) -> list[pd.DataFrame]:
+        return pd.read_html(io.StringIO(self.text))
+
+    @property
+    def tables(self) -> list[pd.DataFrame]:
+        """The tables shown on the page."""
+        # Shallow copies, so a caller relabelling a table leaves the shared one alone.
+        return [x.copy(deep=False) for x in self._tables]
+
+    def structured_data(self, base_url: str) -> dict[str, list[dict[str, Any]]]:
+        """The structured data, such as JSON-LD, embedded in the page."""
+        data = self._structured_data.get(base_url)
+        if data is None:
+            data = extruct.extract(self.text, base_url=base_url)
+            self._structured_data[base_url] = data
+        return data
+
+
+def parse_sportsreference_document(
+    response: requests.Response,
+) -> SportsReferenceDocument:
+    """The parsed document of a response, shared while the page is unchanged."""
+    url = response.url
+    text = response.text
+    with _DOCUMENTS_LOCK:
+        document = _DOCUMENTS.get(url)
+        if document is not None and document.text == text:
+            _DOCUMENTS.move_to_end(url)
+            return document
+        document = SportsReferenceDocument(url, text)
+        _DOCUMENTS[url] = document
+        _DOCUMENTS.move_to_end(url)
+        cached_text = sum(len(x.text) for x in _DOCUMENTS.values())
+        while len(_DOCUMENTS) > 1 and cached_text > _MAX_CACHED_TEXT:
+            _, evicted = _DOCUMENTS.popitem(last=False)
+            cached_text -= len(evicted.text)
+        return document
@@ -2,7 +2,6 @@
 
 # pylint: disable=too-many-locals,too-many-statements,unused-argument,protected-access,too-many-arguments,use-maxsplit-arg,too-many-branches,duplicate-code,broad-exception-caught,too-many-lines,line-too-long
 import datetime
-import io
 import logging
 import math
 import os
@@ -26,6 +25,7 @@ from ..game_model import VERSION, GameModel
 from ..league import League
 from ..season_type import SeasonType
 from ..team_model import TeamModel
+from .sportsreference_document import parse_sportsreference_document
 from .sportsreference_team_model import create_sportsreference_team_model
 from .sportsreference_umpire_model import create_sportsreference_umpire_model
 from .sportsreference_venue_model import create_sportsreference_venue_model
@@ -1130,7 +1130,8 @@ def _create_sportsreference_game_model(
     else:
         response = session.get(url)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "lxml")
+    document = parse_sportsreference_document(response)
+    soup = document.soup
     page_title = soup.find("h1", class_="page_title")
 
     # If the page_title is bad, try fetching from a non wayback source
@@ -1140,7 +1141,8 @@ def _create_sportsreference_game_model(
             with session.wayback_disabled():
                 response = session.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
+            document = parse_sportsreference_document(response)
+            soup = document.soup
 
     comp_ids = []
     for a in soup.find_all("a"):
@@ -1189,9 +1191,6 @@ def _create_sportsreference_game_model(
             return None
         return value
 
-    handle = io.StringIO()
-    handle.write(response.text)
-    handle.seek(0)
     fg = {}
     fga = {}
     offensive_rebounds = {}
@@ -1391,7 +1390,7 @@ def _create_sportsreference_game_model(
     defensive_rating = {}
     box_plus_minus = {}
     try:
-        dfs = pd.read_html(handle)
+        dfs = document.tables
         for df in dfs:
             if df.index.nlevels > 1:
                 df.columns = df.columns.get_level_values(1)
@@ -1,25 +1,26 @@
 """Sports reference player model."""
 
 # pylint: disable=too-many-arguments,unused-argument,line-too-long,duplicate-code,too-many-locals,too-many-statements,too-many-branches,broad-exception-caught,too-many-lines
+import contextlib
 import datetime
 import http
 import logging
+from collections import namedtuple
 from urllib.parse import unquote
 
-import extruct  # type: ignore
 import pytest_is_running
-from bs4 import BeautifulSoup
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 from scrapesession.session import DEFAULT_TIMEOUT  # type: ignore
 
-from ...cache import MEMORY
+from ...cache import keyed_cache
 from ..google.address_exception import AddressException
 from ..google.google_address_model import create_google_address_model
 from ..player_model import VERSION, PlayerModel
 from ..sex import Sex
 from ..species import Species
+from .sportsreference_document import parse_sportsreference_document
 from .sportsreference_venue_model import create_sportsreference_venue_model
 
 _FIX_URLS = {
@@ -33,6 +34,19 @@ _FIX_URLS = {
     "https://www.sports-reference.com/cbb/players/nadège-jean-1.html": "https://www.sports-reference.com/cbb/players/nadege-jean-1.html",
 }
 
+SportsReferencePlayerBio = namedtuple(
+    "SportsReferencePlayerBio",
+    [
+        "name",
+        "birth_date",
+        "weight",
+        "birth_address",
+        "height",
+        "headshot",
+        "college_titles",
+    ],
+)
+
 
 def _fix_url(url: str) -> str:
     url = unquote(url)
@@ -51,6 +65,105 @@ def _fix_url(url: str) -> str:
     return _FIX_URLS.get(url, url)
 
 
+def _parse_sportsreference_player_bio(
+    session: ScrapeSession, player_url: str, version: str
+) -> SportsReferencePlayerBio | None:
+    player_url = _fix_url(player_url)
+
+    if player_url.endswith("uniform.cgi"):
+        return None
+
+    response = session.get(player_url, timeout=DEFAULT_TIMEOUT)
+    # Some players can't be accessed on sports reference
+    if response.status_code == http.HTTPStatus.FORBIDDEN:
+        logging.warning("Cannot access player at URL %s", player_url)
+        return None
+    response.raise_for_status()
+    document = parse_sportsreference_document(response)
+    soup = document.soup
+    h1 = soup.find("h1")
+    if h1 is None:
+        logging.warning("h1 is null for %s", player_url)
+        return None
+    name = h1.get_text().strip()
+    data = document.structured_data(response.url)
+    birth_date = None
+    weight = None
+    birth_address = None
+    height = None
+    headshot = None
+    for jsonld in data["json-ld"]:
+        if jsonld["@type"] != "Person":
+            continue
+        try:
+            birth_date = parse(jsonld["birthDate"])
+        except Exception as exc:
+            logging.warning(str(exc))
+        if "weight" in jsonld:
+            weight = float(jsonld["weight"]["value"].split()[0]) * 0.453592
+        if "birthPlace" in jsonld:
+            try:
+                birth_address = create_google_address_model(
+                    query=jsonld["birthPlace"],
+                    session=session,
+                    dt=None,
+                )
+            except AddressException as exc:
+                logging.warning("Failed to find birth address: %s", str(exc))
+        if "height" in jsonld:
+            height_ft_inches = jsonld["height"]["value"].split()[0].split("-")
+            if len(height_ft_inches) == 1:
+                height_ft_inches = [
+                    x.replace('"', "") for x in height_ft_inches[0].split("'")
+                ]
+            height = (float(height_ft_inches[0]) * 30.48) + (
+                float(height_ft_inches[1]) * 2.54
+            )
+        if "image" in jsonld:
+            headshot = jsonld["image"]["contentUrl"]
+    college_titles = []
+    for a in soup.find_all("a"):
+        url = a.get("href")
+        if url is None:
+            continue
+        if not url.startswith("/friv/colleges.cgi?college="):
+            continue
+        title = a.get("title")
+        if title in college_titles:
+            continue
+        college_titles.append(title)
+    return SportsReferencePlayerBio(
+        name=name,
+        birth_date=birth_date,
+        weight=weight,
+        birth_address=birth_address,
+        height=height,
+        headshot=headshot,
+        college_titles=college_titles,
+    )
+
+
+@keyed_cache("player_url", "version")
+def _cached_parse_sportsreference_player_bio(
+    session: ScrapeSession, player_url: str, version: str
+) -> SportsReferencePlayerBio | None:
+    return _parse_sportsreference_player_bio(
+        session=session, player_url=player_url, version=version
+    )
+
+
+def _create_sportsreference_player_bio(
+    session: ScrapeSession, player_url: str
+) -> SportsReferencePlayerBio | None:
+    if not pytest_is_running.is_running():
+        return _cached_parse_sportsreference_player_bio(
+            session=session, player_url=player_url, version=VERSION
+        )
+    return _parse_sportsreference_player_bio(
+        session=session, player_url=player_url, version=VERSION
+    )
+
+
 def _create_sportsreference_player_model(
     session: ScrapeSession,
     player_url: str,
@@ -259,72 +372,21 @@ def _create_sportsreference_player_model(
     box_plus_minus: dict[str, float],
 ) -> PlayerModel | None:
     """Create a player model from sports reference."""
-    player_url = _fix_url(player_url)
-
-    if player_url.endswith("uniform.cgi"):
-        return None
-
-    response = session.get(player_url, timeout=DEFAULT_TIMEOUT)
-    # Some players can't be accessed on sports reference
-    if response.status_code == http.HTTPStatus.FORBIDDEN:
-        logging.warning("Cannot access player at URL %s", player_url)
-        return None
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "lxml")
-    h1 = soup.find("h1")
-    if h1 is None:
-        logging.warning("h1 is null for %s", player_url)
+    bio = _create_sportsreference_player_bio(session, player_url)
+    if bio is None:
         return None
-    name = h1.get_text().strip()
-    data = extruct.extract(response.text, base_url=response.url)
-    birth_date = None
-    weight = None
-    birth_address = None
-    height = None
-    headshot = None
-    for jsonld in data["json-ld"]:
-        if jsonld["@type"] != "Person":
-            continue
-        try:
-            birth_date = parse(jsonld["birthDate"])
-        except Exception as exc:
-            logging.warning(str(exc))
-        if "weight" in jsonld:
-            weight = float(jsonld["weight"]["value"].split()[0]) * 0.453592
-        if "birthPlace" in jsonld:
-            try:
-                birth_address = create_google_address_model(
-                    query=jsonld["birthPlace"],
-                    session=session,
-                    dt=None,
-                )
-            except AddressException as exc:
-                logging.warning("Failed to find birth address: %s", str(exc))
-        if "height" in jsonld:
-            height_ft_inches = jsonld["height"]["value"].split()[0].split("-")
-            if len(height_ft_inches) == 1:
-                height_ft_inches = [
-                    x.replace('"', "") for x in height_ft_inches[0].split("'")
-                ]
-            height = (float(height_ft_inches[0]) * 30.48) + (
-                float(height_ft_inches[1]) * 2.54
-            )
-        if "image" in jsonld:
-            headshot = jsonld["image"]["contentUrl"]
+    name = bio.name
+    birth_date = bio.birth_date
+    weight = bio.weight
+    birth_address = bio.birth_address
+    height = bio.height
+    headshot = bio.headshot
     position = positions.get(name)
     seconds_played = None
     if name in minutes_played:
         seconds_played = int(minutes_played[name].total_seconds())
     colleges = {}
-    for a in soup.find_all("a"):
-        url = a.get("href")
-        if url is None:
-            continue
-        if not url.startswith("/friv/colleges.cgi?college="):
-            continue
-        title = a.get("title")
-        if title in colleges:
-            continue
+    for title in bio.college_titles:
         college = None
         try:
             college = create_sportsreference_venue_model(
@@ -1235,424 +1297,7 @@ def _create_sportsreference_player_model(
     )
 
 
-@MEMORY.cache(ignore=["session"])
-def _cached_create_sportsreference_player_model(
-    session: ScrapeSession,
-    player_url: str,
-    fg: dict[str, int],
-    fga: dict[str, int],
-    offensive_rebounds: dict[str, int],
-    assists: dict[str, int],
-    turnovers: dict[str, int],
-    positions: dict[str, str],
-    positions_validator: dict[str, str],
-    sex: Sex,
-    dt: datetime.datetime,
-    minutes_played: dict[str, datetime.timedelta],
-    three_point_field_goals: dict[str, int],
-    three_point_field_goals_attempted: dict[str, int],
-    free_throws: dict[str, int],
-    free_throws_attempted: dict[str, int],
-    defensive_rebounds: dict[str, int],
-    steals: dict[str, int],
-    blocks: dict[str, int],
-    personal_fouls: dict[str, int],
-    points: dict[str, int],
-    game_scores: dict[str, float],
-    point_differentials: dict[str, int],
-    version: str,
-    goals: dict[str, int],
-    penalties_in_minutes: dict[str, datetime.timedelta],
-    even_strength_goals: dict[str, int],
-    power_play_goals: dict[str, int],
-    short_handed_goals: dict[str, int],
-    game_winning_goals: dict[str, int],
-    even_strength_assists: dict[str, int],
-    power_play_assists: dict[str, int],
-    short_handed_assists: dict[str, int],
-    shots_on_goal: dict[str, int],
-    shooting_percentage: dict[str, float],
-    shifts: dict[str, int],
-    time_on_ice: dict[str, datetime.timedelta],
-    decision: dict[str, str],
-    goals_against: dict[str, int],
-    shots_against: dict[str, int],
-    saves: dict[str, int],
-    save_percentage: dict[str, float],
-    shutouts: dict[str, int],
-    individual_corsi_for_events: dict[str, int],
-    on_shot_ice_for_events: dict[str, int],
-    on_shot_ice_against_events: dict[str, int],
-    corsi_for_percentage: dict[str, float],
-    relative_corsi_for_percentage: dict[str, float],
-    offensive_zone_starts: dict[str, int],
-    defensive_zone_starts: dict[str, int],
-    offensive_zone_start_percentage: dict[str, float],
-    hits: dict[str, int],
-    true_shooting_percentage: dict[str, float],
-    at_bats: dict[str, int],
-    runs_scored: dict[str, int],
-    runs_batted_in: dict[str, int],
-    bases_on_balls: dict[str, int],
-    strikeouts: dict[str, int],
-    plate_appearances: dict[str, int],
-    hits_at_bats: dict[str, float],
-    obp: dict[str, float],
-    slg: dict[str, float],
-    ops: dict[str, float],
-    pitches: dict[str, int],
-    strikes: dict[str, int],
-    win_probability_added: dict[str, float],
-    average_leverage_index: dict[str, float],
-    wpa_plus: dict[str, float],
-    wpa_minus: dict[str, float],
-    cwpa: dict[str, float],
-    acli: dict[str, float],
-    re24: dict[str, float],
-    putouts: dict[str, int],
-    innings_pitched: dict[str, int],
-    earned_runs: dict[str, int],
-    home_runs: dict[str, int],
-    era: dict[str, float],
-    batters_faced: dict[str, int],
-    strikes_by_contact: dict[str, int],
-    strikes_swinging: dict[str, int],
-    strikes_looking: dict[str, int],
-    ground_balls: dict[str, int],
-    fly_balls: dict[str, int],
-    line_drives: dict[str, int],
-    inherited_runners: dict[str, int],
-    inherited_scores: dict[str, int],
-    effective_field_goal_percentage: dict[str, float],
-    penalty_kicks_made: dict[str, int],
-    penalty_kicks_attempted: dict[str, int],
-    shots_total: dict[str, int],
-    shots_on_target: dict[str, int],
-    yellow_cards: dict[str, int],
-    red_cards: dict[str, int],
-    touches: dict[str, int],
-    expected_goals: dict[str, float],
-    non_penalty_expected_goals: dict[str, float],
-    expected_assisted_goals: dict[str, float],
-    shot_creating_actions: dict[str, int],
-    goal_creating_actions: dict[str, int],
-    passes_completed: dict[str, int],
-    passes_attempted: dict[str, int],
-    pass_completion: dict[str, int],
-    progressive_passes: dict[str, int],
-    carries: dict[str, int],
-    progressive_carries: dict[str, int],
-    take_ons_attempted: dict[str, int],
-    successful_take_ons: dict[str, int],
-    total_passing_distance: dict[str, int],
-    progressive_passing_distance: dict[str, int],
-    passes_completed_short: dict[str, int],
-    passes_attempted_short: dict[str, int],
-    pass_completion_short: dict[str, int],
-    passes_completed_medium: dict[str, int],
-    passes_attempted_medium: dict[str, int],
-    pass_completion_medium: dict[str, int],
-    passes_completed_long: dict[str, int],
-    passes_attempted_long: dict[str, int],
-    pass_completion_long: dict[str, int],
-    expected_assists: dict[str, float],
-    key_passes: dict[str, int],
-    passes_into_final_third: dict[str, int],
-    passes_into_penalty_area: dict[str, int],
-    crosses_into_penalty_area: dict[str, int],
-    live_ball_passes: dict[str, int],
-    dead_ball_passes: dict[str, int],
-    passes_from_free_kicks: dict[str, int],
-    through_balls: dict[str, int],
-    switches: dict[str, int],
-    crosses: dict[str, int],
-    throw_ins_taken: dict[str, int],
-    corner_kicks: dict[str, int],
-    inswinging_corner_kicks: dict[str, int],
-    outswinging_corner_kicks: dict[str, int],
-    straight_corner_kicks: dict[str, int],
-    passes_offside: dict[str, int],
-    passes_blocked: dict[str, int],
-    tackles_won: dict[str, int],
-    tackles_in_defensive_third: dict[str, int],
-    tackles_in_middle_third: dict[str, int],
-    tackles_in_attacking_third: dict[str, int],
-    dribblers_tackled: dict[str, int],
-    dribbles_challenged: dict[str, int],
-    percent_of_dribblers_tackled: dict[str, float],
-    challenges_lost: dict[str, int],
-    shots_blocked: dict[str, int],
-    tackles_plus_interceptions: dict[str, int],
-    errors: dict[str, int],
-    touches_in_defensive_penalty_area: dict[str, int],
-    touches_in_defensive_third: dict[str, int],
-    touches_in_middle_third: dict[str, int],
-    touches_in_attacking_third: dict[str, int],
-    touches_in_attacking_penalty_area: dict[str, int],
-    live_ball_touches: dict[str, int],
-    successful_take_on_percentage: dict[str, float],
-    times_tackled_during_take_ons: dict[str, int],
-    tackled_during_take_ons_percentage: dict[str, int],
-    total_carrying_distance: dict[str, int],
-    progressive_carrying_distance: dict[str, int],
-    carries_into_final_third: dict[str, int],
-    carries_into_penalty_area: dict[str, int],
-    miscontrols: dict[str, int],
-    dispossessed: dict[str, int],
-    passes_received: dict[str, int],
-    progressive_passes_received: dict[str, int],
-    second_yellow_card: dict[str, int],
-    fouls_committed: dict[str, int],
-    fouls_drawn: dict[str, int],
-    offsides: dict[str, int],
-    penalty_kicks_won: dict[str, int],
-    penalty_kicks_conceded: dict[str, int],
-    own_goals: dict[str, int],
-    ball_recoveries: dict[str, int],
-    aerials_won: dict[str, int],
-    aerials_lost: dict[str, int],
-    percentage_of_aerials_won: dict[str, float],
-    shots_on_target_against: dict[str, int],
-    post_shot_expected_goals: dict[str, int],
-    passes_attempted_minus_goal_kicks: dict[str, int],
-    throws_attempted: dict[str, int],
-    percentage_of_passes_that_were_launched: dict[str, float],
-    average_pass_length: dict[str, float],
-    goal_kicks_attempted: dict[str, int],
-    percentage_of_goal_kicks_that_were_launched: dict[str, float],
-    average_goal_kick_length: dict[str, float],
-    crosses_faced: dict[str, int],
-    crosses_stopped: dict[str, int],
-    percentage_crosses_stopped: dict[str, float],
-    defensive_actions_outside_penalty_area: dict[str, int],
-    average_distance_of_defensive_actions: dict[str, float],
-    three_point_attempt_rate: dict[str, float],
-    tackles: dict[str, int],
-    interceptions: dict[str, int],
-    clearances: dict[str, int],
-    free_throw_attempt_rate: dict[str, float],
-    offensive_rebound_percentage: dict[str, float],
-    defensive_rebound_percentage: dict[str, float],
-    total_rebound_percentage: dict[str, float],
-    assist_percentage: dict[str, float],
-    steal_percentage: dict[str, float],
-    block_percentage: dict[str, float],
-    turnover_percentage: dict[str, float],
-    usage_percentage: dict[str, float],
-    offensive_rating: dict[str, int],
-    defensive_rating: dict[str, int],
-    box_plus_minus: dict[str, float],
-) -> PlayerModel | None:
-    return _create_sportsreference_player_model(
-        session=session,
-        player_url=player_url,
-        fg=fg,
-        fga=fga,
-        offensive_rebounds=offensive_rebounds,
-        assists=assists,
-        turnovers=turnovers,
-        positions=positions,
-        positions_validator=positions_validator,
-        sex=sex,
-        dt=dt,
-        minutes_played=minutes_played,
-        three_point_field_goals=three_point_field_goals,
-        three_point_field_goals_attempted=three_point_field_goals_attempted,
-        free_throws=free_throws,
-        free_throws_attempted=free_throws_attempted,
-        defensive_rebounds=defensive_rebounds,
-        steals=steals,
-        blocks=blocks,
-        personal_fouls=personal_fouls,
-        points=points,
-        game_scores=game_scores,
-        point_differentials=point_differentials,
-        version=version,
-        goals=goals,
-        penalties_in_minutes=penalties_in_minutes,
-        even_strength_goals=even_strength_goals,
-        power_play_goals=power_play_goals,
-        short_handed_goals=short_handed_goals,
-        game_winning_goals=game_winning_goals,
-        even_strength_assists=even_strength_assists,
-        power_play_assists=power_play_assists,
-        short_handed_assists=short_handed_assists,
-        shots_on_goal=shots_on_goal,
-        shooting_percentage=shooting_percentage,
-        shifts=shifts,
-        time_on_ice=time_on_ice,
-        decision=decision,
-        goals_against=goals_against,
-        shots_against=shots_against,
-        saves=saves,
-        save_percentage=save_percentage,
-        shutouts=shutouts,
-        individual_corsi_for_events=individual_corsi_for_events,
-        on_shot_ice_for_events=on_shot_ice_for_events,
-        on_shot_ice_against_events=on_shot_ice_against_events,
-        corsi_for_percentage=corsi_for_percentage,
-        relative_corsi_for_percentage=relative_corsi_for_percentage,
-        offensive_zone_starts=offensive_zone_starts,
-        defensive_zone_starts=defensive_zone_starts,
-        offensive_zone_start_percentage=offensive_zone_start_percentage,
-        hits=hits,
-        true_shooting_percentage=true_shooting_percentage,
-        at_bats=at_bats,
-        runs_scored=runs_scored,
-        runs_batted_in=runs_batted_in,
-        bases_on_balls=bases_on_balls,
-        strikeouts=strikeouts,
-        plate_appearances=plate_appearances,
-        hits_at_bats=hits_at_bats,
-        obp=obp,
-        slg=slg,
-        ops=ops,
-        pitches=pitches,
-        strikes=strikes,
-        win_probability_added=win_probability_added,
-        average_leverage_index=average_leverage_index,
-        wpa_plus=wpa_plus,
-        wpa_minus=wpa_minus,
-        cwpa=cwpa,
-        acli=acli,
-        re24=re24,
-        putouts=putouts,
-        innings_pitched=innings_pitched,
-        earned_runs=earned_runs,
-        home_runs=home_runs,
-        era=era,
-        batters_faced=batters_faced,
-        strikes_by_contact=strikes_by_contact,
-        strikes_swinging=strikes_swinging,
-        strikes_looking=strikes_looking,
-        ground_balls=ground_balls,
-        fly_balls=fly_balls,
-        line_drives=line_drives,
-        inherited_runners=inherited_runners,
-        inherited_scores=inherited_scores,
-        effective_field_goal_percentage=effective_field_goal_percentage,
-        penalty_kicks_made=penalty_kicks_made,
-        penalty_kicks_attempted=penalty_kicks_attempted,
-        shots_total=shots_total,
-        shots_on_target=shots_on_target,
-        yellow_cards=yellow_cards,
-        red_cards=red_cards,
-        touches=touches,
-        expected_goals=expected_goals,
-        non_penalty_expected_goals=non_penalty_expected_goals,
-        expected_assisted_goals=expected_assisted_goals,
-        shot_creating_actions=shot_creating_actions,
-        goal_creating_actions=goal_creating_actions,
-        passes_completed=passes_completed,
-        passes_attempted=passes_attempted,
-        pass_completion=pass_completion,
-        progressive_passes=progressive_passes,
-        carries=carries,
-        progressive_carries=progressive_carries,
-        take_ons_attempted=take_ons_attempted,
-        successful_take_ons=successful_take_ons,
-        total_passing_distance=total_passing_distance,
-        progressive_passing_distance=progressive_passing_distance,
-        passes_completed_short=passes_completed_short,
-        passes_attempted_short=passes_attempted_short,
-        pass_completion_short=pass_completion_short,
-        passes_completed_medium=passes_completed_medium,
-        passes_attempted_medium=passes_attempted_medium,
-        pass_completion_medium=pass_completion_medium,
-        passes_completed_long=passes_completed_long,
-        passes_attempted_long=passes_attempted_long,
-        pass_completion_long=pass_completion_long,
-        expected_assists=expected_assists,
-        key_passes=key_passes,
-        passes_into_final_third=passes_into_final_third,
-        passes_into_penalty_area=passes_into_penalty_area,
-        crosses_into_penalty_area=crosses_into_penalty_area,
-        live_ball_passes=live_ball_passes,
-        dead_ball_passes=dead_ball_passes,
-        passes_from_free_kicks=passes_from_free_kicks,
-        through_balls=through_balls,
-        switches=switches,
-        crosses=crosses,
-        throw_ins_taken=throw_ins_taken,
-        corner_kicks=corner_kicks,
-        inswinging_corner_kicks=inswinging_corner_kicks,
-        outswinging_corner_kicks=outswinging_corner_kicks,
-        straight_corner_kicks=straight_corner_kicks,
-        passes_offside=passes_offside,
-        passes_blocked=passes_blocked,
-        tackles_won=tackles_won,
-        tackles_in_defensive_third=tackles_in_defensive_third,
-        tackles_in_middle_third=tackles_in_middle_third,
-        tackles_in_attacking_third=tackles_in_attacking_third,
-        dribblers_tackled=dribblers_tackled,
-        dribbles_challenged=dribbles_challenged,
-        percent_of_dribblers_tackled=percent_of_dribblers_tackled,
-        challenges_lost=challenges_lost,
-        shots_blocked=shots_blocked,
-        tackles_plus_interceptions=tackles_plus_interceptions,
-        errors=errors,
-        touches_in_defensive_penalty_area=touches_in_defensive_penalty_area,
-        touches_in_defensive_third=touches_in_defensive_third,
-        touches_in_middle_third=touches_in_middle_third,
-        touches_in_attacking_third=touches_in_attacking_third,
-        touches_in_attacking_penalty_area=touches_in_attacking_penalty_area,
-        live_ball_touches=live_ball_touches,
-        successful_take_on_percentage=successful_take_on_percentage,
-        times_tackled_during_take_ons=times_tackled_during_take_ons,
-        tackled_during_take_ons_percentage=tackled_during_take_ons_percentage,
-        total_carrying_distance=total_carrying_distance,
-        progressive_carrying_distance=progressive_carrying_distance,
-        carries_into_final_third=carries_into_final_third,
-        carries_into_penalty_area=carries_into_penalty_area,
-        miscontrols=miscontrols,
-        dispossessed=dispossessed,
-        passes_received=passes_received,
-        progressive_passes_received=progressive_passes_received,
-        second_yellow_card=second_yellow_card,
-        fouls_committed=fouls_committed,
-        fouls_drawn=fouls_drawn,
-        offsides=offsides,
-        penalty_kicks_won=penalty_kicks_won,
-        penalty_kicks_conceded=penalty_kicks_conceded,
-        own_goals=own_goals,
-        ball_recoveries=ball_recoveries,
-        aerials_won=aerials_won,
-        aerials_lost=aerials_lost,
-        percentage_of_aerials_won=percentage_of_aerials_won,
-        shots_on_target_against=shots_on_target_against,
-        post_shot_expected_goals=post_shot_expected_goals,
-        passes_attempted_minus_goal_kicks=passes_attempted_minus_goal_kicks,
-        throws_attempted=throws_attempted,
-        percentage_of_passes_that_were_launched=percentage_of_passes_that_were_launched,
-        average_pass_length=average_pass_length,
-        goal_kicks_attempted=goal_kicks_attempted,
-        percentage_of_goal_kicks_that_were_launched=percentage_of_goal_kicks_that_were_launched,
-        average_goal_kick_length=average_goal_kick_length,
-        crosses_faced=crosses_faced,
-        crosses_stopped=crosses_stopped,
-        percentage_crosses_stopped=percentage_crosses_stopped,
-        defensive_actions_outside_penalty_area=defensive_actions_outside_penalty_area,
-        average_distance_of_defensive_actions=average_distance_of_defensive_actions,
-        three_point_attempt_rate=three_point_attempt_rate,
-        tackles=tackles,
-        interceptions=interceptions,
-        clearances=clearances,
-        free_throw_attempt_rate=free_throw_attempt_rate,
-        offensive_rebound_percentage=offensive_rebound_percentage,
-        defensive_rebound_percentage=defensive_rebound_percentage,
-        total_rebound_percentage=total_rebound_percentage,
-        assist_percentage=assist_percentage,
-        steal_percentage=steal_percentage,
-        block_percentage=block_percentage,
-        turnover_percentage=turnover_percentage,
-        usage_percentage=usage_percentage,
-        offensive_rating=offensive_rating,
-        defensive_rating=defensive_rating,
-        box_plus_minus=box_plus_minus,
-    )
-
-
-def create_sportsreference_player_model(
+def create_sportsreference_player_model(
     session: ScrapeSession,
     player_url: str,
     fg: dict[str, int],
@@ -1859,215 +1504,11 @@ def create_sportsreference_player_model(
     box_plus_minus: dict[str, float],
 ) -> PlayerModel | None:
     """Create a player model from sports reference."""
-    if not pytest_is_running.is_running():
-        return _cached_create_sportsreference_player_model(
-            session=session,
-            player_url=player_url,
-            fg=fg,
-            fga=fga,
-            offensive_rebounds=offensive_rebounds,
-            assists=assists,
-            turnovers=turnovers,
-            positions=positions,
-            positions_validator=positions_validator,
-            sex=sex,
-            dt=dt,
-            minutes_played=minutes_played,
-            three_point_field_goals=three_point_field_goals,
-            three_point_field_goals_attempted=three_point_field_goals_attempted,
-            free_throws=free_throws,
-            free_throws_attempted=free_throws_attempted,
-            defensive_rebounds=defensive_rebounds,
-            steals=steals,
-            blocks=blocks,
-            personal_fouls=personal_fouls,
-            points=points,
-            game_scores=game_scores,
-            point_differentials=point_differentials,
-            version=VERSION,
-            goals=goals,
-            penalties_in_minutes=penalties_in_minutes,
-            even_strength_goals=even_strength_goals,
-            power_play_goals=power_play_goals,
-            short_handed_goals=short_handed_goals,
-            game_winning_goals=game_winning_goals,
-            even_strength_assists=even_strength_assists,
-            power_play_assists=power_play_assists,
-            short_handed_assists=short_handed_assists,
-            shots_on_goal=shots_on_goal,
-            shooting_percentage=shooting_percentage,
-            shifts=shifts,
-            time_on_ice=time_on_ice,
-            decision=decision,
-            goals_against=goals_against,
-            shots_against=shots_against,
-            saves=saves,
-            save_percentage=save_percentage,
-            shutouts=shutouts,
-            individual_corsi_for_events=individual_corsi_for_events,
-            on_shot_ice_for_events=on_shot_ice_for_events,
-            on_shot_ice_against_events=on_shot_ice_against_events,
-            corsi_for_percentage=corsi_for_percentage,
-            relative_corsi_for_percentage=relative_corsi_for_percentage,
-            offensive_zone_starts=offensive_zone_starts,
-            defensive_zone_starts=defensive_zone_starts,
-            offensive_zone_start_percentage=offensive_zone_start_percentage,
-            hits=hits,
-            true_shooting_percentage=true_shooting_percentage,
-            at_bats=at_bats,
-            runs_scored=runs_scored,
-            runs_batted_in=runs_batted_in,
-            bases_on_balls=bases_on_balls,
-            strikeouts=strikeouts,
-            plate_appearances=plate_appearances,
-            hits_at_bats=hits_at_bats,
-            obp=obp,
-            slg=slg,
-            ops=ops,
-            pitches=pitches,
-            strikes=strikes,
-            win_probability_added=win_probability_added,
-            average_leverage_index=average_leverage_index,
-            wpa_plus=wpa_plus,
-            wpa_minus=wpa_minus,
-            cwpa=cwpa,
-            acli=acli,
-            re24=re24,
-            putouts=putouts,
-            innings_pitched=innings_pitched,
-            earned_runs=earned_runs,
-            home_runs=home_runs,
-            era=era,
-            batters_faced=batters_faced,
-            strikes_by_contact=strikes_by_contact,
-            strikes_swinging=strikes_swinging,
-            strikes_looking=strikes_looking,
-            ground_balls=ground_balls,
-            fly_balls=fly_balls,
-            line_drives=line_drives,
-            inherited_runners=inherited_runners,
-            inherited_scores=inherited_scores,
-            effective_field_goal_percentage=effective_field_goal_percentage,
-            penalty_kicks_made=penalty_kicks_made,
-            penalty_kicks_attempted=penalty_kicks_attempted,
-            shots_total=shots_total,
-            shots_on_target=shots_on_target,
-            yellow_cards=yellow_cards,
-            red_cards=red_cards,
-            touches=touches,
-            expected_goals=expected_goals,
-            non_penalty_expected_goals=non_penalty_expected_goals,
-            expected_assisted_goals=expected_assisted_goals,
-            shot_creating_actions=shot_creating_actions,
-            goal_creating_actions=goal_creating_actions,
-            passes_completed=passes_completed,
-            passes_attempted=passes_attempted,
-            pass_completion=pass_completion,
-            progressive_passes=progressive_passes,
-            carries=carries,
-            progressive_carries=progressive_carries,
-            take_ons_attempted=take_ons_attempted,
-            successful_take_ons=successful_take_ons,
-            total_passing_distance=total_passing_distance,
-            progressive_passing_distance=progressive_passing_distance,
-            passes_completed_short=passes_completed_short,
-            passes_attempted_short=passes_attempted_short,
-            pass_completion_short=pass_completion_short,
-            passes_completed_medium=passes_completed_medium,
-            passes_attempted_medium=passes_attempted_medium,
-            pass_completion_medium=pass_completion_medium,
-            passes_completed_long=passes_completed_long,
-            passes_attempted_long=passes_attempted_long,
-            pass_completion_long=pass_completion_long,
-            expected_assists=expected_assists,
-            key_passes=key_passes,
-            passes_into_final_third=passes_into_final_third,
-            passes_into_penalty_area=passes_into_penalty_area,
-            crosses_into_penalty_area=crosses_into_penalty_area,
-            live_ball_passes=live_ball_passes,
-            dead_ball_passes=dead_ball_passes,
-            passes_from_free_kicks=passes_from_free_kicks,
-            through_balls=through_balls,
-            switches=switches,
-            crosses=crosses,
-            throw_ins_taken=throw_ins_taken,
-            corner_kicks=corner_kicks,
-            inswinging_corner_kicks=inswinging_corner_kicks,
-            outswinging_corner_kicks=outswinging_corner_kicks,
-            straight_corner_kicks=straight_corner_kicks,
-            passes_offside=passes_offside,
-            passes_blocked=passes_blocked,
-            tackles_won=tackles_won,
-            tackles_in_defensive_third=tackles_in_defensive_third,
-            tackles_in_middle_third=tackles_in_middle_third,
-            tackles_in_attacking_third=tackles_in_attacking_third,
-            dribblers_tackled=dribblers_tackled,
-            dribbles_challenged=dribbles_challenged,
-            percent_of_dribblers_tackled=percent_of_dribblers_tackled,
-            challenges_lost=challenges_lost,
-            shots_blocked=shots_blocked,
-            tackles_plus_interceptions=tackles_plus_interceptions,
-            errors=errors,
-            touches_in_defensive_penalty_area=touches_in_defensive_penalty_area,
-            touches_in_defensive_third=touches_in_defensive_third,
-            touches_in_middle_third=touches_in_middle_third,
-            touches_in_attacking_third=touches_in_attacking_third,
-            touches_in_attacking_penalty_area=touches_in_attacking_penalty_area,
-            live_ball_touches=live_ball_touches,
-            successful_take_on_percentage=successful_take_on_percentage,
-            times_tackled_during_take_ons=times_tackled_during_take_ons,
-            tackled_during_take_ons_percentage=tackled_during_take_ons_percentage,
-            total_carrying_distance=total_carrying_distance,
-            progressive_carrying_distance=progressive_carrying_distance,
-            carries_into_final_third=carries_into_final_third,
-            carries_into_penalty_area=carries_into_penalty_area,
-            miscontrols=miscontrols,
-            dispossessed=dispossessed,
-            passes_received=passes_received,
-            progressive_passes_received=progressive_passes_received,
-            second_yellow_card=second_yellow_card,
-            fouls_committed=fouls_committed,
-            fouls_drawn=fouls_drawn,
-            offsides=offsides,
-            penalty_kicks_won=penalty_kicks_won,
-            penalty_kicks_conceded=penalty_kicks_conceded,
-            own_goals=own_goals,
-            ball_recoveries=ball_recoveries,
-            aerials_won=aerials_won,
-            aerials_lost=aerials_lost,
-            percentage_of_aerials_won=percentage_of_aerials_won,
-            shots_on_target_against=shots_on_target_against,
-            post_shot_expected_goals=post_shot_expected_goals,
-            passes_attempted_minus_goal_kicks=passes_attempted_minus_goal_kicks,
-            throws_attempted=throws_attempted,
-            percentage_of_passes_that_were_launched=percentage_of_passes_that_were_launched,
-            average_pass_length=average_pass_length,
-            goal_kicks_attempted=goal_kicks_attempted,
-            percentage_of_goal_kicks_that_were_launched=percentage_of_goal_kicks_that_were_launched,
-            average_goal_kick_length=average_goal_kick_length,
-            crosses_faced=crosses_faced,
-            crosses_stopped=crosses_stopped,
-            percentage_crosses_stopped=percentage_crosses_stopped,
-            defensive_actions_outside_penalty_area=defensive_actions_outside_penalty_area,
-            average_distance_of_defensive_actions=average_distance_of_defensive_actions,
-            three_point_attempt_rate=three_point_attempt_rate,
-            tackles=tackles,
-            interceptions=interceptions,
-            clearances=clearances,
-            free_throw_attempt_rate=free_throw_attempt_rate,
-            offensive_rebound_percentage=offensive_rebound_percentage,
-            defensive_rebound_percentage=defensive_rebound_percentage,
-            total_rebound_percentage=total_rebound_percentage,
-            assist_percentage=assist_percentage,
-            steal_percentage=steal_percentage,
-            block_percentage=block_percentage,
-            turnover_percentage=turnover_percentage,
-            usage_percentage=usage_percentage,
-            offensive_rating=offensive_rating,
-            defensive_rating=defensive_rating,
-            box_plus_minus=box_plus_minus,
-        )
-    with session.cache_disabled():
+    with (
+        session.cache_disabled()
+        if pytest_is_running.is_running()
+        else contextlib.nullcontext()
+    ):
         return _create_sportsreference_player_model(
             session=session,
             player_url=player_url,
@@ -8,7 +8,6 @@ import logging
 import urllib.parse
 from urllib.parse import urlparse
 
-import extruct  # type: ignore
 import pytest_is_running
 import requests
 from bs4 import BeautifulSoup, Tag
@@ -22,6 +21,7 @@ from ..sex import Sex
 from ..team_model import VERSION, TeamModel
 from ..x.x_social_model import create_x_social_model
 from .sportsreference_coach_model import create_sportsreference_coach_model
+from .sportsreference_document import parse_sportsreference_document
 from .sportsreference_player_model import create_sportsreference_player_model
 
 _BAD_URLS = {
@@ -55,7 +55,7 @@ _BAD_TEAM_URLS = {
 def _find_name(response: requests.Response, soup: BeautifulSoup, url: str) -> str:
     base_url = get_base_url(response.text, url)
     try:
-        data = extruct.extract(response.text, base_url=base_url)
+        data = parse_sportsreference_document(response).structured_data(base_url)
         return data["json-ld"][0]["name"]
     except (json.decoder.JSONDecodeError, IndexError, UnicodeDecodeError) as exc:
         h1 = soup.find("h1")
@@ -1606,7 +1606,7 @@ def _create_sportsreference_team_model(
         )
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "lxml")
+    soup = parse_sportsreference_document(response).soup
     title = soup.find("title")
     if not isinstance(title, Tag):
         raise ValueError(f"title not a tag for {url}.")
@@ -7,7 +7,6 @@ import os
 from urllib.parse import urlparse
 
 import pytest_is_running
-from bs4 import BeautifulSoup
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
@@ -16,6 +15,7 @@ from ...cache import MEMORY
 from ..google.address_exception import AddressException
 from ..google.google_address_model import create_google_address_model
 from ..umpire_model import VERSION, UmpireModel
+from .sportsreference_document import parse_sportsreference_document
 from .sportsreference_venue_model import create_sportsreference_venue_model
 
 
@@ -27,7 +27,7 @@ def _create_sportsreference_umpire_model(
 ) -> UmpireModel:
     response = session.get(url)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "lxml")
+    soup = parse_sportsreference_document(response).soup
 
     name = None
     for h1 in soup.find_all("h1"):
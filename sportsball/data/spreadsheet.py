@@ -0,0 +1,31 @@
+"""A function for streaming the rows of a spreadsheet."""
+
+from io import BytesIO
+from typing import Any, Iterator
+
+
+def iter_spreadsheet_rows(content: bytes) -> Iterator[tuple[Any, ...]]:
+    """Stream the cell values of the active sheet of a workbook, row by row.
+
+    The workbook is opened read only, so cells are parsed as the rows are
+    reached rather than loaded up front with their styles, and each row is a
+    tuple of values padded to the width of the sheet. A sheet's recorded
+    dimensions can be stale, so the rows are read to their last cell and padded
+    to the widest of the recorded width and the rows read so far.
+    """
+    # openpyxl is slow to import, so it is only loaded once it is needed.
+    # pylint: disable=import-outside-toplevel
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(filename=BytesIO(content), read_only=True)
+    try:
+        ws = workbook.active
+        if ws is None:
+            raise ValueError("ws is null.")
+        width = ws.max_column or 0
+        ws.reset_dimensions()  # type: ignore
+        for row in ws.iter_rows(values_only=True):
+            width = max(width, len(row))
+            yield tuple(row) + (None,) * (width - len(row))
+    finally:
+        workbook.close()
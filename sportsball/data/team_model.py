@@ -2,7 +2,9 @@
 
 # pylint: disable=duplicate-code
 import datetime
-from typing import Any, Literal
+import operator
+import threading
+from typing import Any, Callable, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -1181,382 +1183,87 @@ TEAM_SET_FIVE_POINTS_COLUMN: Literal["set_five_points"] = "set_five_points"
 VERSION = DELIMITER.join(["0.0.16", PLAYER_VERSION, COACH_VERSION])
 
 
-def _calculate_kicks(data: dict[str, Any]) -> int | None:
-    kicks = 0
-    found_kicks = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_kicks = player.kicks
-        if player_kicks is None:
-            continue
-        found_kicks = True
-        kicks += player_kicks
-    if not found_kicks:
-        return None
-    return kicks
-
-
-def _calculate_field_goals(data: dict[str, Any]) -> int | None:
-    field_goals = 0
-    found_field_goals = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_field_goals = player.field_goals
-        if player_field_goals is None:
-            continue
-        found_field_goals = True
-        field_goals += player_field_goals
-    if not found_field_goals:
-        return None
-    return field_goals
-
-
-def _calculate_field_goals_attempted(data: dict[str, Any]) -> int | None:
-    field_goals_attempted = 0
-    found_field_goals_attempted = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_field_goals_attempted = player.field_goals_attempted
-        if player_field_goals_attempted is None:
-            continue
-        found_field_goals_attempted = True
-        field_goals_attempted += player_field_goals_attempted
-    if not found_field_goals_attempted:
-        return None
-    return field_goals_attempted
-
-
-def _calculate_offensive_rebounds(data: dict[str, Any]) -> int | None:
-    offensive_rebounds = 0
-    found_offensive_rebounds = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_offensive_rebounds = player.offensive_rebounds
-        if player_offensive_rebounds is None:
-            continue
-        found_offensive_rebounds = True
-        offensive_rebounds += player_offensive_rebounds
-    if not found_offensive_rebounds:
-        return None
-    return offensive_rebounds
-
-
-def _calculate_assists(data: dict[str, Any]) -> int | None:
-    assists = 0
-    found_assists = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_assists = player.assists
-        if player_assists is None:
-            continue
-        found_assists = True
-        assists += player_assists
-    if not found_assists:
-        return None
-    return assists
+_ROSTER_STATS = (
+    "kicks",
+    "field_goals",
+    "field_goals_attempted",
+    "offensive_rebounds",
+    "assists",
+    "turnovers",
+    "marks",
+    "handballs",
+    "disposals",
+    "goals",
+    "behinds",
+    "hit_outs",
+    "tackles",
+    "rebounds",
+    "insides",
+    "clearances",
+    "clangers",
+    "free_kicks_for",
+    "free_kicks_against",
+    "brownlow_votes",
+    "contested_possessions",
+    "uncontested_possessions",
+    "contested_marks",
+    "marks_inside",
+    "one_percenters",
+    "bounces",
+    "goal_assists",
+    "three_point_field_goals",
+    "three_point_field_goals_attempted",
+    "free_throws",
+    "free_throws_attempted",
+    "defensive_rebounds",
+    "steals",
+    "blocks",
+    "personal_fouls",
+    "forced_fumbles",
+    "fumbles_recovered",
+    "fumbles_touchdowns",
+)
+_FLOAT_ROSTER_STATS = {"forced_fumbles", "fumbles_recovered", "fumbles_touchdowns"}
+_ROSTER_GETTER = operator.itemgetter(*_ROSTER_STATS)
+_ROSTER_TOTALS = threading.local()
 
 
-def _calculate_turnovers(data: dict[str, Any]) -> int | None:
-    turnovers = 0
-    found_turnovers = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_turnovers = player.turnovers
-        if player_turnovers is None:
-            continue
-        found_turnovers = True
-        turnovers += player_turnovers
-    if not found_turnovers:
-        return None
-    return turnovers
-
-
-def _calculate_marks(data: dict[str, Any]) -> int | None:
-    marks = 0
-    found_marks = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_marks = player.marks
-        if player_marks is None:
-            continue
-        found_marks = True
-        marks += player_marks
-    if not found_marks:
-        return None
-    return marks
-
-
-def _calculate_handballs(data: dict[str, Any]) -> int | None:
-    handballs = 0
-    found_handballs = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_handballs = player.handballs
-        if player_handballs is None:
-            continue
-        found_handballs = True
-        handballs += player_handballs
-    if not found_handballs:
-        return None
-    return handballs
-
+def sum_roster(players: list[PlayerModel]) -> dict[str, int | float | None]:
+    """Sum every roster stat over the players in a single pass.
 
-def _calculate_disposals(data: dict[str, Any]) -> int | None:
-    disposals = 0
-    found_disposals = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_disposals = player.disposals
-        if player_disposals is None:
+    A stat is None if no player has a value for it.
+    """
+    totals: dict[str, int | float | None] = dict.fromkeys(_ROSTER_STATS)
+    if not players:
+        return totals
+    # Fields live in the model __dict__, which is quicker to read than attributes.
+    rows = [_ROSTER_GETTER(vars(x)) for x in players]
+    for stat, values in zip(_ROSTER_STATS, zip(*rows)):
+        found = [x for x in values if x is not None]
+        if not found:
             continue
-        found_disposals = True
-        disposals += player_disposals
-    if not found_disposals:
-        return None
-    return disposals
+        total = sum(found)
+        totals[stat] = float(total) if stat in _FLOAT_ROSTER_STATS else total
+    return totals
 
 
-def _calculate_goals(data: dict[str, Any]) -> int | None:
-    goals = 0
-    found_goals = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_goals = player.goals
-        if player_goals is None:
-            continue
-        found_goals = True
-        goals += player_goals
-    if not found_goals:
-        return None
-    return goals
+def _roster_totals(data: dict[str, Any]) -> dict[str, int | float | None]:
+    # Every default factory of a team is called in turn with the same validated
+    # players list, so only the last roster summed needs to be kept.
+    players = data.get(PLAYER_COLUMN_PREFIX, [])
+    cached = getattr(_ROSTER_TOTALS, "cached", None)
+    if cached is not None and cached[0] is players:
+        return cached[1]
+    totals = sum_roster(players)
+    _ROSTER_TOTALS.cached = (players, totals)
+    return totals
 
 
-def _calculate_behinds(data: dict[str, Any]) -> int | None:
-    behinds = 0
-    found_behinds = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_behinds = player.behinds
-        if player_behinds is None:
-            continue
-        found_behinds = True
-        behinds += player_behinds
-    if not found_behinds:
-        return None
-    return behinds
+def _roster_total(stat: str) -> Callable[[dict[str, Any]], int | float | None]:
+    def _calculate(data: dict[str, Any]) -> int | float | None:
+        return _roster_totals(data)[stat]
 
-
-def _calculate_hit_outs(data: dict[str, Any]) -> int | None:
-    hit_outs = 0
-    found_hit_outs = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_hit_outs = player.hit_outs
-        if player_hit_outs is None:
-            continue
-        found_hit_outs = True
-        hit_outs += player_hit_outs
-    if not found_hit_outs:
-        return None
-    return hit_outs
-
-
-def _calculate_tackles(data: dict[str, Any]) -> int | None:
-    tackles = 0
-    found_tackles = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_tackles = player.tackles
-        if player_tackles is None:
-            continue
-        found_tackles = True
-        tackles += player_tackles
-    if not found_tackles:
-        return None
-    return tackles
-
-
-def _calculate_rebounds(data: dict[str, Any]) -> int | None:
-    rebounds = 0
-    found_rebounds = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_rebounds = player.rebounds
-        if player_rebounds is None:
-            continue
-        found_rebounds = True
-        rebounds += player_rebounds
-    if not found_rebounds:
-        return None
-    return rebounds
-
-
-def _calculate_insides(data: dict[str, Any]) -> int | None:
-    insides = 0
-    found_insides = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_insides = player.insides
-        if player_insides is None:
-            continue
-        found_insides = True
-        insides += player_insides
-    if not found_insides:
-        return None
-    return insides
-
-
-def _calculate_clearances(data: dict[str, Any]) -> int | None:
-    clearances = 0
-    found_clearances = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_clearances = player.clearances
-        if player_clearances is None:
-            continue
-        found_clearances = True
-        clearances += player_clearances
-    if not found_clearances:
-        return None
-    return clearances
-
-
-def _calculate_clangers(data: dict[str, Any]) -> int | None:
-    clangers = 0
-    found_clangers = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_clangers = player.clangers
-        if player_clangers is None:
-            continue
-        found_clangers = True
-        clangers += player_clangers
-    if not found_clangers:
-        return None
-    return clangers
-
-
-def _calculate_free_kicks_for(data: dict[str, Any]) -> int | None:
-    free_kicks_for = 0
-    found_free_kicks_for = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_free_kicks_for = player.free_kicks_for
-        if player_free_kicks_for is None:
-            continue
-        found_free_kicks_for = True
-        free_kicks_for += player_free_kicks_for
-    if not found_free_kicks_for:
-        return None
-    return free_kicks_for
-
-
-def _calculate_free_kicks_against(data: dict[str, Any]) -> int | None:
-    free_kicks_against = 0
-    found_free_kicks_against = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_free_kicks_against = player.free_kicks_against
-        if player_free_kicks_against is None:
-            continue
-        found_free_kicks_against = True
-        free_kicks_against += player_free_kicks_against
-    if not found_free_kicks_against:
-        return None
-    return free_kicks_against
-
-
-def _calculate_brownlow_votes(data: dict[str, Any]) -> int | None:
-    brownlow_votes = 0
-    found_brownlow_votes = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_brownlow_votes = player.brownlow_votes
-        if player_brownlow_votes is None:
-            continue
-        found_brownlow_votes = True
-        brownlow_votes += player_brownlow_votes
-    if not found_brownlow_votes:
-        return None
-    return brownlow_votes
-
-
-def _calculate_contested_possessions(data: dict[str, Any]) -> int | None:
-    contested_possessions = 0
-    found_contested_possessions = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_contested_possessions = player.contested_possessions
-        if player_contested_possessions is None:
-            continue
-        found_contested_possessions = True
-        contested_possessions += player_contested_possessions
-    if not found_contested_possessions:
-        return None
-    return contested_possessions
-
-
-def _calculate_uncontested_possessions(data: dict[str, Any]) -> int | None:
-    uncontested_possessions = 0
-    found_uncontested_possessions = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_uncontested_possessions = player.uncontested_possessions
-        if player_uncontested_possessions is None:
-            continue
-        found_uncontested_possessions = True
-        uncontested_possessions += player_uncontested_possessions
-    if not found_uncontested_possessions:
-        return None
-    return uncontested_possessions
-
-
-def _calculate_contested_marks(data: dict[str, Any]) -> int | None:
-    contested_marks = 0
-    found_contested_marks = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_contested_marks = player.contested_marks
-        if player_contested_marks is None:
-            continue
-        found_contested_marks = True
-        contested_marks += player_contested_marks
-    if not found_contested_marks:
-        return None
-    return contested_marks
-
-
-def _calculate_marks_inside(data: dict[str, Any]) -> int | None:
-    marks_inside = 0
-    found_marks_inside = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_marks_inside = player.marks_inside
-        if player_marks_inside is None:
-            continue
-        found_marks_inside = True
-        marks_inside += player_marks_inside
-    if not found_marks_inside:
-        return None
-    return marks_inside
-
-
-def _calculate_one_percenters(data: dict[str, Any]) -> int | None:
-    one_percenters = 0
-    found_one_percenters = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_one_percenters = player.one_percenters
-        if player_one_percenters is None:
-            continue
-        found_one_percenters = True
-        one_percenters += player_one_percenters
-    if not found_one_percenters:
-        return None
-    return one_percenters
-
-
-def _calculate_bounces(data: dict[str, Any]) -> int | None:
-    bounces = 0
-    found_bounces = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_bounces = player.bounces
-        if player_bounces is None:
-            continue
-        found_bounces = True
-        bounces += player_bounces
-    if not found_bounces:
-        return None
-    return bounces
-
-
-def _calculate_goal_assists(data: dict[str, Any]) -> int | None:
-    goal_assists = 0
-    found_goal_assists = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_goal_assists = player.goal_assists
-        if player_goal_assists is None:
-            continue
-        found_goal_assists = True
-        goal_assists += player_goal_assists
-    if not found_goal_assists:
-        return None
-    return goal_assists
+    return _calculate
 
 
 def _calcualte_field_goals_percentage(data: dict[str, Any]) -> float | None:
@@ -1571,36 +1278,6 @@ def _calcualte_field_goals_percentage(data: dict[str, Any]) -> float | None:
     return float(field_goals) / float(field_goals_attempted)  # type: ignore
 
 
-def _calculate_three_point_field_goals(data: dict[str, Any]) -> int | None:
-    three_point_field_goals = 0
-    found_three_point_field_goals = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_three_point_field_goals = player.three_point_field_goals
-        if player_three_point_field_goals is None:
-            continue
-        found_three_point_field_goals = True
-        three_point_field_goals += player_three_point_field_goals
-    if not found_three_point_field_goals:
-        return None
-    return three_point_field_goals
-
-
-def _calculate_three_point_field_goals_attempted(data: dict[str, Any]) -> int | None:
-    three_point_field_goals_attempted = 0
-    found_three_point_field_goals_attempted = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_three_point_field_goals_attempted = (
-            player.three_point_field_goals_attempted
-        )
-        if player_three_point_field_goals_attempted is None:
-            continue
-        found_three_point_field_goals_attempted = True
-        three_point_field_goals_attempted += player_three_point_field_goals_attempted
-    if not found_three_point_field_goals_attempted:
-        return None
-    return three_point_field_goals_attempted
-
-
 def _calculate_three_point_field_goals_percentage(data: dict[str, Any]) -> float | None:
     three_point_field_goals = data.get(TEAM_THREE_POINT_FIELD_GOALS_COLUMN)
     if three_point_field_goals is None:
@@ -1615,34 +1292,6 @@ def _calculate_three_point_field_goals_percentage(data: dict[str, Any]) -> float
     return float(three_point_field_goals) / float(three_point_field_goals_attempted)  # type: ignore
 
 
-def _calculate_free_throws(data: dict[str, Any]) -> int | None:
-    free_throws = 0
-    found_free_throws = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_free_throws = player.free_throws
-        if player_free_throws is None:
-            continue
-        found_free_throws = True
-        free_throws += player_free_throws
-    if not found_free_throws:
-        return None
-    return free_throws
-
-
-def _calculate_free_throws_attempted(data: dict[str, Any]) -> int | None:
-    free_throws_attempted = 0
-    found_free_throws_attempted = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_free_throws_attempted = player.free_throws_attempted
-        if player_free_throws_attempted is None:
-            continue
-        found_free_throws_attempted = True
-        free_throws_attempted += player_free_throws_attempted
-    if not found_free_throws_attempted:
-        return None
-    return free_throws_attempted
-
-
 def _calculate_free_throws_percentage(data: dict[str, Any]) -> float | None:
     free_throws = data.get(TEAM_FREE_THROWS_COLUMN)
     if free_throws is None:
@@ -1655,20 +1304,6 @@ def _calculate_free_throws_percentage(data: dict[str, Any]) -> float | None:
     return float(free_throws) / float(free_throws_attempted)  # type: ignore
 
 
-def _calculate_defensive_rebounds(data: dict[str, Any]) -> int | None:
-    defensive_rebounds = 0
-    found_defensive_rebounds = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_defensive_rebounds = player.defensive_rebounds
-        if player_defensive_rebounds is None:
-            continue
-        found_defensive_rebounds = True
-        defensive_rebounds += player_defensive_rebounds
-    if not found_defensive_rebounds:
-        return None
-    return defensive_rebounds
-
-
 def _calculate_total_rebounds(data: dict[str, Any]) -> int | None:
     offensive_rebounds = data.get(OFFENSIVE_REBOUNDS_COLUMN)
     if offensive_rebounds is None:
@@ -1679,90 +1314,6 @@ def _calculate_total_rebounds(data: dict[str, Any]) -> int | None:
     return offensive_rebounds + defensive_rebounds
 
 
-def _calculate_steals(data: dict[str, Any]) -> int | None:
-    steals = 0
-    found_steals = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_steals = player.steals
-        if player_steals is None:
-            continue
-        found_steals = True
-        steals += player_steals
-    if not found_steals:
-        return None
-    return steals
-
-
-def _calculate_blocks(data: dict[str, Any]) -> int | None:
-    blocks = 0
-    found_blocks = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_blocks = player.blocks
-        if player_blocks is None:
-            continue
-        found_blocks = True
-        blocks += player_blocks
-    if not found_blocks:
-        return None
-    return blocks
-
-
-def _calculate_personal_fouls(data: dict[str, Any]) -> int | None:
-    personal_fouls = 0
-    found_personal_fouls = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_personal_fouls = player.personal_fouls
-        if player_personal_fouls is None:
-            continue
-        found_personal_fouls = True
-        personal_fouls += player_personal_fouls
-    if not found_personal_fouls:
-        return None
-    return personal_fouls
-
-
-def _calculate_forced_fumbles(data: dict[str, Any]) -> float | None:
-    forced_fumbles = 0.0
-    found_forced_fumbles = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_forced_fumbles = player.forced_fumbles
-        if player_forced_fumbles is None:
-            continue
-        found_forced_fumbles = True
-        forced_fumbles += player_forced_fumbles
-    if not found_forced_fumbles:
-        return None
-    return forced_fumbles
-
-
-def _calculate_fumbles_recovered(data: dict[str, Any]) -> float | None:
-    fumbles_recovered = 0.0
-    found_fumbles_recovered = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_fumbles_recovered = player.fumbles_recovered
-        if player_fumbles_recovered is None:
-            continue
-        found_fumbles_recovered = True
-        fumbles_recovered += player_fumbles_recovered
-    if not found_fumbles_recovered:
-        return None
-    return fumbles_recovered
-
-
-def _calculate_fumbles_touchdowns(data: dict[str, Any]) -> float | None:
-    fumbles_touchdowns = 0.0
-    found_fumbles_touchdowns = False
-    for player in data.get(PLAYER_COLUMN_PREFIX, []):
-        player_fumbles_touchdowns = player.fumbles_touchdowns
-        if player_fumbles_touchdowns is None:
-            continue
-        found_fumbles_touchdowns = True
-        fumbles_touchdowns += player_fumbles_touchdowns
-    if not found_fumbles_touchdowns:
-        return None
-    return fumbles_touchdowns
-
-
 class TeamModel(BaseModel):
     """The serialisable team class."""
 
@@ -1791,139 +1342,139 @@ class TeamModel(BaseModel):
     )
     ladder_rank: int | None
     kicks: int | None = Field(
-        default_factory=_calculate_kicks,
+        default_factory=_roster_total("kicks"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=KICKS_COLUMN,
     )
     news: list[NewsModel] = Field(..., alias=TEAM_NEWS_COLUMN)
     social: list[SocialModel]
     field_goals: float | None = Field(
-        default_factory=_calculate_field_goals,
+        default_factory=_roster_total("field_goals"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=FIELD_GOALS_COLUMN,
     )
     field_goals_attempted: int | None = Field(
-        default_factory=_calculate_field_goals_attempted,
+        default_factory=_roster_total("field_goals_attempted"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=FIELD_GOALS_ATTEMPTED_COLUMN,
     )
     offensive_rebounds: int | None = Field(
-        default_factory=_calculate_offensive_rebounds,
+        default_factory=_roster_total("offensive_rebounds"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=OFFENSIVE_REBOUNDS_COLUMN,
     )
     assists: int | None = Field(
-        default_factory=_calculate_assists,
+        default_factory=_roster_total("assists"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=ASSISTS_COLUMN,
     )
     turnovers: int | None = Field(
-        default_factory=_calculate_turnovers,
+        default_factory=_roster_total("turnovers"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TURNOVERS_COLUMN,
     )
     marks: int | None = Field(
-        default_factory=_calculate_marks,
+        default_factory=_roster_total("marks"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_MARKS_COLUMN,
     )
     handballs: int | None = Field(
-        default_factory=_calculate_handballs,
+        default_factory=_roster_total("handballs"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_HANDBALLS_COLUMN,
     )
     disposals: int | None = Field(
-        default_factory=_calculate_disposals,
+        default_factory=_roster_total("disposals"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_DISPOSALS_COLUMN,
     )
     goals: int | None = Field(
-        default_factory=_calculate_goals,
+        default_factory=_roster_total("goals"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_GOALS_COLUMN,
     )
     behinds: int | None = Field(
-        default_factory=_calculate_behinds,
+        default_factory=_roster_total("behinds"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_BEHINDS_COLUMN,
     )
     hit_outs: int | None = Field(
-        default_factory=_calculate_hit_outs,
+        default_factory=_roster_total("hit_outs"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_HIT_OUTS_COLUMN,
     )
     tackles: int | None = Field(
-        default_factory=_calculate_tackles,
+        default_factory=_roster_total("tackles"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_TACKLES_COLUMN,
     )
     rebounds: int | None = Field(
-        default_factory=_calculate_rebounds,
+        default_factory=_roster_total("rebounds"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_REBOUNDS_COLUMN,
     )
     insides: int | None = Field(
-        default_factory=_calculate_insides,
+        default_factory=_roster_total("insides"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_INSIDES_COLUMN,
     )
     clearances: int | None = Field(
-        default_factory=_calculate_clearances,
+        default_factory=_roster_total("clearances"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_CLEARANCES_COLUMN,
     )
     clangers: int | None = Field(
-        default_factory=_calculate_clangers,
+        default_factory=_roster_total("clangers"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_CLANGERS_COLUMN,
     )
     free_kicks_for: int | None = Field(
-        default_factory=_calculate_free_kicks_for,
+        default_factory=_roster_total("free_kicks_for"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_FREE_KICKS_FOR_COLUMN,
     )
     free_kicks_against: int | None = Field(
-        default_factory=_calculate_free_kicks_against,
+        default_factory=_roster_total("free_kicks_against"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_FREE_KICKS_AGAINST_COLUMN,
     )
     brownlow_votes: int | None = Field(
-        default_factory=_calculate_brownlow_votes,
+        default_factory=_roster_total("brownlow_votes"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_BROWNLOW_VOTES_COLUMN,
     )
     contested_possessions: int | None = Field(
-        default_factory=_calculate_contested_possessions,
+        default_factory=_roster_total("contested_possessions"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_CONTESTED_POSSESSIONS_COLUMN,
     )
     uncontested_possessions: int | None = Field(
-        default_factory=_calculate_uncontested_possessions,
+        default_factory=_roster_total("uncontested_possessions"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_UNCONTESTED_POSSESSIONS_COLUMN,
     )
     contested_marks: int | None = Field(
-        default_factory=_calculate_contested_marks,
+        default_factory=_roster_total("contested_marks"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_CONTESTED_MARKS_COLUMN,
     )
     marks_inside: int | None = Field(
-        default_factory=_calculate_marks_inside,
+        default_factory=_roster_total("marks_inside"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_MARKS_INSIDE_COLUMN,
     )
     one_percenters: int | None = Field(
-        default_factory=_calculate_one_percenters,
+        default_factory=_roster_total("one_percenters"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_ONE_PERCENTERS_COLUMN,
     )
     bounces: int | None = Field(
-        default_factory=_calculate_bounces,
+        default_factory=_roster_total("bounces"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_BOUNCES_COLUMN,
     )
     goal_assists: int | None = Field(
-        default_factory=_calculate_goal_assists,
+        default_factory=_roster_total("goal_assists"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_GOAL_ASSISTS_COLUMN,
     )
@@ -1944,12 +1495,12 @@ class TeamModel(BaseModel):
         alias=TEAM_FIELD_GOALS_PERCENTAGE_COLUMN,
     )
     three_point_field_goals: int | None = Field(
-        default_factory=_calculate_three_point_field_goals,
+        default_factory=_roster_total("three_point_field_goals"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_THREE_POINT_FIELD_GOALS_COLUMN,
     )
     three_point_field_goals_attempted: int | None = Field(
-        default_factory=_calculate_three_point_field_goals_attempted,
+        default_factory=_roster_total("three_point_field_goals_attempted"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
     )
@@ -1959,12 +1510,12 @@ class TeamModel(BaseModel):
         alias=TEAM_THREE_POINT_FIELD_GOALS_PERCENTAGE_COLUMN,
     )
     free_throws: float | None = Field(
-        default_factory=_calculate_free_throws,
+        default_factory=_roster_total("free_throws"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_FREE_THROWS_COLUMN,
     )
     free_throws_attempted: int | None = Field(
-        default_factory=_calculate_free_throws_attempted,
+        default_factory=_roster_total("free_throws_attempted"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_FREE_THROWS_ATTEMPTED_COLUMN,
     )
@@ -1974,7 +1525,7 @@ class TeamModel(BaseModel):
         alias=TEAM_FREE_THROWS_PERCENTAGE_COLUMN,
     )
     defensive_rebounds: int | None = Field(
-        default_factory=_calculate_defensive_rebounds,
+        default_factory=_roster_total("defensive_rebounds"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_DEFENSIVE_REBOUNDS_COLUMN,
     )
@@ -1984,32 +1535,32 @@ class TeamModel(BaseModel):
         alias=TEAM_TOTAL_REBOUNDS_COLUMN,
     )
     steals: int | None = Field(
-        default_factory=_calculate_steals,
+        default_factory=_roster_total("steals"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_STEALS_COLUMN,
     )
     blocks: int | None = Field(
-        default_factory=_calculate_blocks,
+        default_factory=_roster_total("blocks"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_BLOCKS_COLUMN,
     )
     personal_fouls: int | None = Field(
-        default_factory=_calculate_personal_fouls,
+        default_factory=_roster_total("personal_fouls"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_PERSONAL_FOULS_COLUMN,
     )
     forced_fumbles: float | None = Field(
-        default_factory=_calculate_forced_fumbles,
+        default_factory=_roster_total("forced_fumbles"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_FORCED_FUMBLES_COLUMN,
     )
     fumbles_recovered: float | None = Field(
-        default_factory=_calculate_fumbles_recovered,
+        default_factory=_roster_total("fumbles_recovered"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_FUMBLES_RECOVERED_COLUMN,
     )
     fumbles_touchdowns: float | None = Field(
-        default_factory=_calculate_fumbles_touchdowns,
+        default_factory=_roster_total("fumbles_touchdowns"),
         json_schema_extra={TYPE_KEY: FieldType.LOOKAHEAD},
         alias=TEAM_FUMBLES_TOUCHDOWNS_COLUMN,
     )
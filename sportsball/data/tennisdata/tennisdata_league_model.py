@@ -1,18 +1,17 @@
 """TennisData league model."""
 
 import urllib.parse
-from io import BytesIO
 from typing import Any, Iterator
 from urllib.parse import urlparse
 
 import tqdm
 from bs4 import BeautifulSoup
-from openpyxl import load_workbook
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ..game_model import GameModel
 from ..league import League
 from ..league_model import SHUTDOWN_FLAG, LeagueModel, needs_shutdown
+from ..spreadsheet import iter_spreadsheet_rows
 from .tennisdata_game_model import create_tennisdata_game_model
 
 
@@ -37,57 +36,37 @@ class TennisDataLeagueModel(LeagueModel):
         """Tennis position validators."""
         return {}
 
-    def _row_to_game(self, row: Any) -> GameModel | None:
-        tour_number_cell = str(row[0].value)
+    def _row_to_game(self, row: tuple[Any, ...]) -> GameModel | None:
+        tour_number_cell = str(row[0])
         if tour_number_cell in {"ATP", "None", "WTA"}:
             return None
-        location_cell = str(row[1].value).strip()
-        date_cell = str(row[3].value).strip()
-        court_cell = str(row[5].value).strip()
-        surface_cell = str(row[6].value).strip()
-        best_of_cell = str(row[8].value).strip()
+        location_cell = str(row[1]).strip()
+        date_cell = str(row[3]).strip()
+        court_cell = str(row[5]).strip()
+        surface_cell = str(row[6]).strip()
+        best_of_cell = str(row[8]).strip()
         if best_of_cell == "None":
             return None
-        winner_cell = str(row[9].value).strip()
-        loser_cell = str(row[10].value).strip()
+        winner_cell = str(row[9]).strip()
+        loser_cell = str(row[10]).strip()
         winner_rank_cell = (
-            str(row[11].value).strip()
-            if row[11].value is not None and row[11].value != "N/A"
-            else None
+            str(row[11]).strip() if row[11] is not None and row[11] != "N/A" else None
         )
         loser_rank_cell = (
-            str(row[12].value).strip()
-            if row[12].value is not None and row[12].value != "N/A"
-            else None
+            str(row[12]).strip() if row[12] is not None and row[12] != "N/A" else None
         )
         winner_total_points_cell = (
-            str(row[13].value).strip()
-            if row[13].value is not None and row[13].value != "N/A"
-            else None
+            str(row[13]).strip() if row[13] is not None and row[13] != "N/A" else None
         )
         loser_total_points_cell = (
-            str(row[14].value).strip()
-            if row[14].value is not None and row[14].value != "N/A"
-            else None
-        )
-        winner_points_set_1_cell = (
-            str(row[15].value).strip() if row[15].value is not None else None
-        )
-        loser_points_set_1_cell = (
-            str(row[16].value).strip() if row[16].value is not None else None
-        )
-        winner_points_set_2_cell = (
-            str(row[17].value).strip() if row[17].value is not None else None
-        )
-        loser_points_set_2_cell = (
-            str(row[18].value).strip() if row[18].value is not None else None
-        )
-        winner_points_set_3_cell = (
-            str(row[19].value).strip() if row[19].value is not None else None
-        )
-        loser_points_set_3_cell = (
-            str(row[20].value).strip() if row[20].value is not None else None
+            str(row[14]).strip() if row[14] is not None and row[14] != "N/A" else None
         )
+        winner_points_set_1_cell = str(row[15]).strip() if row[15] is not None else None
+        loser_points_set_1_cell = str(row[16]).strip() if row[16] is not None else None
+        winner_points_set_2_cell = str(row[17]).strip() if row[17] is not None else None
+        loser_points_set_2_cell = str(row[18]).strip() if row[18] is not None else None
+        winner_points_set_3_cell = str(row[19]).strip() if row[19] is not None else None
+        loser_points_set_3_cell = str(row[20]).strip() if row[20] is not None else None
         current_cell = 21
         winner_points_set_4_cell = None
         loser_points_set_4_cell = None
@@ -95,52 +74,48 @@ class TennisDataLeagueModel(LeagueModel):
         loser_points_set_5_cell = None
         if self.league == League.ATP:
             winner_points_set_4_cell = (
-                str(row[current_cell].value).strip()
-                if row[current_cell].value is not None
+                str(row[current_cell]).strip()
+                if row[current_cell] is not None
                 else None
             )
             current_cell += 1
             loser_points_set_4_cell = (
-                str(row[current_cell].value).strip()
-                if row[current_cell].value is not None
+                str(row[current_cell]).strip()
+                if row[current_cell] is not None
                 else None
             )
             current_cell += 1
             winner_points_set_5_cell = (
-                str(row[current_cell].value).strip()
-                if row[current_cell].value is not None
+                str(row[current_cell]).strip()
+                if row[current_cell] is not None
                 else None
             )
             current_cell += 1
             loser_points_set_5_cell = (
-                str(row[current_cell].value).strip()
-                if row[current_cell].value is not None
+                str(row[current_cell]).strip()
+                if row[current_cell] is not None
                 else None
             )
             current_cell += 1
         winner_sets_cell = (
-            str(row[current_cell].value).strip()
-            if row[current_cell].value is not None
-            else None
+            str(row[current_cell]).strip() if row[current_cell] is not None else None
         )
         current_cell += 1
         loser_sets_cell = (
-            str(row[current_cell].value).strip()
-            if row[current_cell].value is not None
-            else None
+            str(row[current_cell]).strip() if row[current_cell] is not None else None
         )
         current_cell += 2
 
         winner_odds_cell = None
-        if row[current_cell].value is not None:
-            winner_odds_cell = str(row[current_cell].value).strip()
+        if row[current_cell] is not None:
+            winner_odds_cell = str(row[current_cell]).strip()
             current_cell += 1
         else:
             current_cell += 6
-            winner_odds_cell = str(row[current_cell].value).strip()
+            winner_odds_cell = str(row[current_cell]).strip()
             current_cell += 1
 
-        loser_odds_cell: str | None = str(row[current_cell].value).strip()
+        loser_odds_cell: str | None = str(row[current_cell]).strip()
         if winner_odds_cell == "None":
             winner_odds_cell = None
         if loser_odds_cell == "None":
@@ -214,11 +189,7 @@ class TennisDataLeagueModel(LeagueModel):
                         else:
                             response = self.session.get(spreadsheet_url)
                         response.raise_for_status()
-                        workbook = load_workbook(filename=BytesIO(response.content))
-                        ws = workbook.active
-                        if ws is None:
-                            raise ValueError("ws is null.")
-                        for row in ws.iter_rows():
+                        for row in iter_spreadsheet_rows(response.content):
                             game_model = self._row_to_game(row)
                             if game_model is not None:
                                 pbar.update(1)
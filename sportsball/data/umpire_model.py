@@ -10,8 +10,8 @@ from .address_model import VERSION as ADDRESS_VERSION
 from .address_model import AddressModel
 from .delimiter import DELIMITER
 from .field_type import FFILL_KEY, TYPE_KEY, FieldType
-from .sex import (FEMALE_GENDERS, GENDER_DETECTOR, MALE_GENDERS,
-                  UNCERTAIN_GENDERS, Sex)
+from .sex import (FEMALE_GENDERS, MALE_GENDERS, UNCERTAIN_GENDERS, Sex,
+                  gender_detector)
 from .venue_model import VERSION as VENUE_VERSION
 from .venue_model import VenueModel
 
@@ -27,7 +27,7 @@ VERSION = DELIMITER.join(["0.0.1", ADDRESS_VERSION, VENUE_VERSION])
 
 def _guess_sex(data: dict[str, Any]) -> str | None:
     name = data[UMPIRE_NAME_COLUMN]
-    gender_tag = GENDER_DETECTOR.get_gender(name)
+    gender_tag = gender_detector().get_gender(name)
     if gender_tag in MALE_GENDERS:
         return str(Sex.MALE)
     if gender_tag in FEMALE_GENDERS:
@@ -1,8 +1,11 @@
 """Openmeteo weather model."""
 
 # pylint: disable=too-many-statements,too-many-locals,line-too-long,duplicate-code,too-many-arguments,too-many-positional-arguments
+import collections
 import datetime
 import struct
+import threading
+from typing import Any
 
 import openmeteo_requests  # type: ignore
 import pandas as pd
@@ -16,10 +19,19 @@ from openmeteo_requests.Client import WeatherApiResponse
 from ....cache import MEMORY
 from ...weather_model import VERSION, WeatherModel
 
+_SEASON_MONTHS = 3
+_COORDINATE_PRECISION = 2
+_MAX_SEASONS = 64
+_SEASONS: collections.OrderedDict[
+    tuple[float, float, datetime.date, str],
+    tuple[pd.DataFrame, pd.DataFrame] | None,
+] = collections.OrderedDict()
+_SEASONS_LOCK = threading.Lock()
 
-def _parse_openmeteo(
-    responses: list[WeatherApiResponse], tz: str, dt: datetime.datetime, version: str
-) -> WeatherModel | None:
+
+def _parse_openmeteo_frames(
+    responses: list[WeatherApiResponse], tz: str
+) -> tuple[pd.DataFrame, pd.DataFrame] | None:
     # pylint: disable=broad-exception-caught
     if not responses:
         return None
@@ -220,155 +232,7 @@ def _parse_openmeteo(
             },
         )
 
-        dt = dt.replace(tzinfo=None)
-        timezone = pytz.timezone(tz)
-        dt = timezone.localize(dt)
-
-        hourly_idx = hourly_df.index.get_indexer([dt], method="nearest")[0]
-        temperature = hourly_df.iloc[hourly_idx]["temperature_2m"]  # type: ignore
-        relative_humidity = hourly_df.iloc[hourly_idx]["relative_humidity_2m"]  # type: ignore
-        dew_point_2m = hourly_df.iloc[hourly_idx]["dew_point_2m"]  # type: ignore
-        apparent_temperature = hourly_df.iloc[hourly_idx]["apparent_temperature"]  # type: ignore
-        precipitation_probability = hourly_df.iloc[hourly_idx][
-            "precipitation_probability"
-        ]  # type: ignore
-        precipitation = hourly_df.iloc[hourly_idx]["precipitation"]  # type: ignore
-        rain = hourly_df.iloc[hourly_idx]["rain"]  # type: ignore
-        showers = hourly_df.iloc[hourly_idx]["showers"]  # type: ignore
-        snowfall = hourly_df.iloc[hourly_idx]["snowfall"]  # type: ignore
-        snow_depth = hourly_df.iloc[hourly_idx]["snow_depth"]  # type: ignore
-        weather_code = hourly_df.iloc[hourly_idx]["weather_code"]  # type: ignore
-        pressure_msl = hourly_df.iloc[hourly_idx]["pressure_msl"]  # type: ignore
-        surface_pressure = hourly_df.iloc[hourly_idx]["surface_pressure"]  # type: ignore
-        cloud_cover = hourly_df.iloc[hourly_idx]["cloud_cover"]  # type: ignore
-        cloud_cover_low = hourly_df.iloc[hourly_idx]["cloud_cover_low"]  # type: ignore
-        cloud_cover_mid = hourly_df.iloc[hourly_idx]["cloud_cover_mid"]  # type: ignore
-        cloud_cover_high = hourly_df.iloc[hourly_idx]["cloud_cover_high"]  # type: ignore
-        visibility = hourly_df.iloc[hourly_idx]["visibility"]  # type: ignore
-        evapotranspiration = hourly_df.iloc[hourly_idx]["evapotranspiration"]  # type: ignore
-        reference_evapotranspiration = hourly_df.iloc[hourly_idx][
-            "reference_evapotranspiration"
-        ]  # type: ignore
-        vapour_pressure_deficit = hourly_df.iloc[hourly_idx]["vapour_pressure_deficit"]  # type: ignore
-        wind_speed_10m = hourly_df.iloc[hourly_idx]["wind_speed_10m"]  # type: ignore
-        wind_speed_80m = hourly_df.iloc[hourly_idx]["wind_speed_80m"]  # type: ignore
-        wind_speed_120m = hourly_df.iloc[hourly_idx]["wind_speed_120m"]  # type: ignore
-        wind_speed_180m = hourly_df.iloc[hourly_idx]["wind_speed_180m"]  # type: ignore
-        wind_direction_10m = hourly_df.iloc[hourly_idx]["wind_direction_10m"]  # type: ignore
-        wind_direction_80m = hourly_df.iloc[hourly_idx]["wind_direction_80m"]  # type: ignore
-        wind_direction_120m = hourly_df.iloc[hourly_idx]["wind_direction_120m"]  # type: ignore
-        wind_direction_180m = hourly_df.iloc[hourly_idx]["wind_direction_180m"]  # type: ignore
-        wind_gusts = hourly_df.iloc[hourly_idx]["wind_gusts"]  # type: ignore
-        temperature_80m = hourly_df.iloc[hourly_idx]["temperature_80m"]  # type: ignore
-        temperature_120m = hourly_df.iloc[hourly_idx]["temperature_120m"]  # type: ignore
-        temperature_180m = hourly_df.iloc[hourly_idx]["temperature_180m"]  # type: ignore
-        soil_temperature = hourly_df.iloc[hourly_idx]["soil_temperature"]  # type: ignore
-        soil_temperature_6cm = hourly_df.iloc[hourly_idx]["soil_temperature_6cm"]  # type: ignore
-        soil_temperature_18cm = hourly_df.iloc[hourly_idx]["soil_temperature_18cm"]  # type: ignore
-        soil_temperature_54cm = hourly_df.iloc[hourly_idx]["soil_temperature_54cm"]  # type: ignore
-        soil_moisture = hourly_df.iloc[hourly_idx]["soil_moisture"]  # type: ignore
-        soil_moisture_1cm = hourly_df.iloc[hourly_idx]["soil_moisture_1cm"]  # type: ignore
-        soil_moisture_3cm = hourly_df.iloc[hourly_idx]["soil_moisture_3cm"]  # type: ignore
-        soil_moisture_9cm = hourly_df.iloc[hourly_idx]["soil_moisture_9cm"]  # type: ignore
-        soil_moisture_27cm = hourly_df.iloc[hourly_idx]["soil_moisture_27cm"]  # type: ignore
-
-        daily_idx = daily_df.index.get_indexer([dt], method="nearest")[0]
-        daily_weather_code = daily_df.iloc[daily_idx]["weather_code"]  # type: ignore
-        temperature_2m_max = daily_df.iloc[daily_idx]["temperature_2m_max"]  # type: ignore
-        temperature_2m_min = daily_df.iloc[daily_idx]["temperature_2m_min"]  # type: ignore
-        apparent_temperature_max = daily_df.iloc[daily_idx]["apparent_temperature_max"]  # type: ignore
-        apparent_temperature_min = daily_df.iloc[daily_idx]["apparent_temperature_min"]  # type: ignore
-        sunrise = daily_df.iloc[daily_idx]["sunrise"]  # type: ignore
-        sunset = daily_df.iloc[daily_idx]["sunset"]  # type: ignore
-        daylight_duration = daily_df.iloc[daily_idx]["daylight_duration"]  # type: ignore
-        sunshine_duration = daily_df.iloc[daily_idx]["sunshine_duration"]  # type: ignore
-        uv_index_max = daily_df.iloc[daily_idx]["uv_index_max"]  # type: ignore
-        uv_index_clear_sky_max = daily_df.iloc[daily_idx]["uv_index_clear_sky_max"]  # type: ignore
-        rain_sum = daily_df.iloc[daily_idx]["rain_sum"]  # type: ignore
-        showers_sum = daily_df.iloc[daily_idx]["showers_sum"]  # type: ignore
-        snowfall_sum = daily_df.iloc[daily_idx]["snowfall_sum"]  # type: ignore
-        precipitation_sum = daily_df.iloc[daily_idx]["precipitation_sum"]  # type: ignore
-        precipitation_hours = daily_df.iloc[daily_idx]["precipitation_hours"]  # type: ignore
-        precipitation_probability_max = daily_df.iloc[daily_idx][
-            "precipitation_probability_max"
-        ]  # type: ignore
-        wind_speed_10m_max = daily_df.iloc[daily_idx]["wind_speed_10m_max"]  # type: ignore
-        wind_gusts_10m_max = daily_df.iloc[daily_idx]["wind_gusts_10m_max"]  # type: ignore
-        wind_direction_10m_dominant = daily_df.iloc[daily_idx][
-            "wind_direction_10m_dominant"
-        ]  # type: ignore
-        shortwave_radiation_sum = daily_df.iloc[daily_idx]["shortwave_radiation_sum"]  # type: ignore
-        et0_fao_evapotranspiration = daily_df.iloc[daily_idx][
-            "et0_fao_evapotranspiration"
-        ]  # type: ignore
-
-        return WeatherModel(
-            temperature=temperature,
-            relative_humidity=relative_humidity,
-            dew_point=dew_point_2m,
-            apparent_temperature=apparent_temperature,
-            precipitation_probability=precipitation_probability,
-            precipitation=precipitation,
-            rain=rain,
-            showers=showers,
-            snowfall=snowfall,
-            snow_depth=snow_depth,
-            weather_code=weather_code,
-            sealevel_pressure=pressure_msl,
-            surface_pressure=surface_pressure,
-            cloud_cover_total=cloud_cover,
-            cloud_cover_low=cloud_cover_low,
-            cloud_cover_mid=cloud_cover_mid,
-            cloud_cover_high=cloud_cover_high,
-            visibility=visibility,
-            evapotranspiration=evapotranspiration,
-            reference_evapotranspiration=reference_evapotranspiration,
-            vapour_pressure_deficit=vapour_pressure_deficit,
-            wind_speed_10m=wind_speed_10m,
-            wind_speed_80m=wind_speed_80m,
-            wind_speed_120m=wind_speed_120m,
-            wind_speed_180m=wind_speed_180m,
-            wind_direction_10m=wind_direction_10m,
-            wind_direction_80m=wind_direction_80m,
-            wind_direction_120m=wind_direction_120m,
-            wind_direction_180m=wind_direction_180m,
-            wind_gusts=wind_gusts,
-            temperature_80m=temperature_80m,
-            temperature_120m=temperature_120m,
-            temperature_180m=temperature_180m,
-            soil_temperature_0cm=soil_temperature,
-            soil_temperature_6cm=soil_temperature_6cm,
-            soil_temperature_18cm=soil_temperature_18cm,
-            soil_temperature_54cm=soil_temperature_54cm,
-            soil_moisture_0cm=soil_moisture,
-            soil_moisture_1cm=soil_moisture_1cm,
-            soil_moisture_3cm=soil_moisture_3cm,
-            soil_moisture_9cm=soil_moisture_9cm,
-            soil_moisture_27cm=soil_moisture_27cm,
-            daily_weather_code=daily_weather_code,
-            daily_maximum_temperature_2m=temperature_2m_max,
-            daily_minimum_temperature_2m=temperature_2m_min,
-            daily_maximum_apparent_temperature_2m=apparent_temperature_max,
-            daily_minimum_apparent_temperature_2m=apparent_temperature_min,
-            sunrise=sunrise,
-            sunset=sunset,
-            daylight_duration=daylight_duration,
-            sunshine_duration=sunshine_duration,
-            uv_index=uv_index_max,
-            uv_index_clear_sky=uv_index_clear_sky_max,
-            rain_sum=rain_sum,
-            showers_sum=showers_sum,
-            snowfall_sum=snowfall_sum,
-            precipitation_sum=precipitation_sum,
-            precipitation_hours=precipitation_hours,
-            precipitation_probability_max=precipitation_probability_max,
-            maximum_wind_speed_10m=wind_speed_10m_max,
-            maximum_wind_gusts_10m=wind_gusts_10m_max,
-            dominant_wind_direction=wind_direction_10m_dominant,
-            shortwave_radiation_sum=shortwave_radiation_sum,
-            daily_reference_evapotranspiration=et0_fao_evapotranspiration,
-            version=version,
-        )
+        return hourly_df, daily_df
     except (
         struct.error,
         requests.exceptions.HTTPError,
@@ -377,6 +241,236 @@ def _parse_openmeteo(
         return None
 
 
+def _slice_openmeteo(
+    hourly_df: pd.DataFrame,
+    daily_df: pd.DataFrame,
+    tz: str,
+    dt: datetime.datetime,
+    version: str,
+) -> WeatherModel:
+    dt = dt.replace(tzinfo=None)
+    timezone = pytz.timezone(tz)
+    dt = timezone.localize(dt)
+
+    hourly_idx = hourly_df.index.get_indexer([dt], method="nearest")[0]
+    temperature = hourly_df.iloc[hourly_idx]["temperature_2m"]  # type: ignore
+    relative_humidity = hourly_df.iloc[hourly_idx]["relative_humidity_2m"]  # type: ignore
+    dew_point_2m = hourly_df.iloc[hourly_idx]["dew_point_2m"]  # type: ignore
+    apparent_temperature = hourly_df.iloc[hourly_idx]["apparent_temperature"]  # type: ignore
+    precipitation_probability = hourly_df.iloc[hourly_idx]["precipitation_probability"]  # type: ignore
+    precipitation = hourly_df.iloc[hourly_idx]["precipitation"]  # type: ignore
+    rain = hourly_df.iloc[hourly_idx]["rain"]  # type: ignore
+    showers = hourly_df.iloc[hourly_idx]["showers"]  # type: ignore
+    snowfall = hourly_df.iloc[hourly_idx]["snowfall"]  # type: ignore
+    snow_depth = hourly_df.iloc[hourly_idx]["snow_depth"]  # type: ignore
+    weather_code = hourly_df.iloc[hourly_idx]["weather_code"]  # type: ignore
+    pressure_msl = hourly_df.iloc[hourly_idx]["pressure_msl"]  # type: ignore
+    surface_pressure = hourly_df.iloc[hourly_idx]["surface_pressure"]  # type: ignore
+    cloud_cover = hourly_df.iloc[hourly_idx]["cloud_cover"]  # type: ignore
+    cloud_cover_low = hourly_df.iloc[hourly_idx]["cloud_cover_low"]  # type: ignore
+    cloud_cover_mid = hourly_df.iloc[hourly_idx]["cloud_cover_mid"]  # type: ignore
+    cloud_cover_high = hourly_df.iloc[hourly_idx]["cloud_cover_high"]  # type: ignore
+    visibility = hourly_df.iloc[hourly_idx]["visibility"]  # type: ignore
+    evapotranspiration = hourly_df.iloc[hourly_idx]["evapotranspiration"]  # type: ignore
+    reference_evapotranspiration = hourly_df.iloc[hourly_idx][
+        "reference_evapotranspiration"
+    ]  # type: ignore
+    vapour_pressure_deficit = hourly_df.iloc[hourly_idx]["vapour_pressure_deficit"]  # type: ignore
+    wind_speed_10m = hourly_df.iloc[hourly_idx]["wind_speed_10m"]  # type: ignore
+    wind_speed_80m = hourly_df.iloc[hourly_idx]["wind_speed_80m"]  # type: ignore
+    wind_speed_120m = hourly_df.iloc[hourly_idx]["wind_speed_120m"]  # type: ignore
+    wind_speed_180m = hourly_df.iloc[hourly_idx]["wind_speed_180m"]  # type: ignore
+    wind_direction_10m = hourly_df.iloc[hourly_idx]["wind_direction_10m"]  # type: ignore
+    wind_direction_80m = hourly_df.iloc[hourly_idx]["wind_direction_80m"]  # type: ignore
+    wind_direction_120m = hourly_df.iloc[hourly_idx]["wind_direction_120m"]  # type: ignore
+    wind_direction_180m = hourly_df.iloc[hourly_idx]["wind_direction_180m"]  # type: ignore
+    wind_gusts = hourly_df.iloc[hourly_idx]["wind_gusts"]  # type: ignore
+    temperature_80m = hourly_df.iloc[hourly_idx]["temperature_80m"]  # type: ignore
+    temperature_120m = hourly_df.iloc[hourly_idx]["temperature_120m"]  # type: ignore
+    temperature_180m = hourly_df.iloc[hourly_idx]["temperature_180m"]  # type: ignore
+    soil_temperature = hourly_df.iloc[hourly_idx]["soil_temperature"]  # type: ignore
+    soil_temperature_6cm = hourly_df.iloc[hourly_idx]["soil_temperature_6cm"]  # type: ignore
+    soil_temperature_18cm = hourly_df.iloc[hourly_idx]["soil_temperature_18cm"]  # type: ignore
+    soil_temperature_54cm = hourly_df.iloc[hourly_idx]["soil_temperature_54cm"]  # type: ignore
+    soil_moisture = hourly_df.iloc[hourly_idx]["soil_moisture"]  # type: ignore
+    soil_moisture_1cm = hourly_df.iloc[hourly_idx]["soil_moisture_1cm"]  # type: ignore
+    soil_moisture_3cm = hourly_df.iloc[hourly_idx]["soil_moisture_3cm"]  # type: ignore
+    soil_moisture_9cm = hourly_df.iloc[hourly_idx]["soil_moisture_9cm"]  # type: ignore
+    soil_moisture_27cm = hourly_df.iloc[hourly_idx]["soil_moisture_27cm"]  # type: ignore
+
+    # The daily rows sit at local midnight, so the game's day is the last row at
+    # or before the midnight it starts after.
+    daily_idx = max(
+        daily_df.index.get_indexer([pd.Timestamp(dt).normalize()], method="pad")[0], 0
+    )
+    daily_weather_code = daily_df.iloc[daily_idx]["weather_code"]  # type: ignore
+    temperature_2m_max = daily_df.iloc[daily_idx]["temperature_2m_max"]  # type: ignore
+    temperature_2m_min = daily_df.iloc[daily_idx]["temperature_2m_min"]  # type: ignore
+    apparent_temperature_max = daily_df.iloc[daily_idx]["apparent_temperature_max"]  # type: ignore
+    apparent_temperature_min = daily_df.iloc[daily_idx]["apparent_temperature_min"]  # type: ignore
+    sunrise = daily_df.iloc[daily_idx]["sunrise"]  # type: ignore
+    sunset = daily_df.iloc[daily_idx]["sunset"]  # type: ignore
+    daylight_duration = daily_df.iloc[daily_idx]["daylight_duration"]  # type: ignore
+    sunshine_duration = daily_df.iloc[daily_idx]["sunshine_duration"]  # type: ignore
+    uv_index_max = daily_df.iloc[daily_idx]["uv_index_max"]  # type: ignore
+    uv_index_clear_sky_max = daily_df.iloc[daily_idx]["uv_index_clear_sky_max"]  # type: ignore
+    rain_sum = daily_df.iloc[daily_idx]["rain_sum"]  # type: ignore
+    showers_sum = daily_df.iloc[daily_idx]["showers_sum"]  # type: ignore
+    snowfall_sum = daily_df.iloc[daily_idx]["snowfall_sum"]  # type: ignore
+    precipitation_sum = daily_df.iloc[daily_idx]["precipitation_sum"]  # type: ignore
+    precipitation_hours = daily_df.iloc[daily_idx]["precipitation_hours"]  # type: ignore
+    precipitation_probability_max = daily_df.iloc[daily_idx][
+        "precipitation_probability_max"
+    ]  # type: ignore
+    wind_speed_10m_max = daily_df.iloc[daily_idx]["wind_speed_10m_max"]  # type: ignore
+    wind_gusts_10m_max = daily_df.iloc[daily_idx]["wind_gusts_10m_max"]  # type: ignore
+    wind_direction_10m_dominant = daily_df.iloc[daily_idx][
+        "wind_direction_10m_dominant"
+    ]  # type: ignore
+    shortwave_radiation_sum = daily_df.iloc[daily_idx]["shortwave_radiation_sum"]  # type: ignore
+    et0_fao_evapotranspiration = daily_df.iloc[daily_idx]["et0_fao_evapotranspiration"]  # type: ignore
+
+    return WeatherModel(
+        temperature=temperature,
+        relative_humidity=relative_humidity,
+        dew_point=dew_point_2m,
+        apparent_temperature=apparent_temperature,
+        precipitation_probability=precipitation_probability,
+        precipitation=precipitation,
+        rain=rain,
+        showers=showers,
+        snowfall=snowfall,
+        snow_depth=snow_depth,
+        weather_code=weather_code,
+        sealevel_pressure=pressure_msl,
+        surface_pressure=surface_pressure,
+        cloud_cover_total=cloud_cover,
+        cloud_cover_low=cloud_cover_low,
+        cloud_cover_mid=cloud_cover_mid,
+        cloud_cover_high=cloud_cover_high,
+        visibility=visibility,
+        evapotranspiration=evapotranspiration,
+        reference_evapotranspiration=reference_evapotranspiration,
+        vapour_pressure_deficit=vapour_pressure_deficit,
+        wind_speed_10m=wind_speed_10m,
+        wind_speed_80m=wind_speed_80m,
+        wind_speed_120m=wind_speed_120m,
+        wind_speed_180m=wind_speed_180m,
+        wind_direction_10m=wind_direction_10m,
+        wind_direction_80m=wind_direction_80m,
+        wind_direction_120m=wind_direction_120m,
+        wind_direction_180m=wind_direction_180m,
+        wind_gusts=wind_gusts,
+        temperature_80m=temperature_80m,
+        temperature_120m=temperature_120m,
+        temperature_180m=temperature_180m,
+        soil_temperature_0cm=soil_temperature,
+        soil_temperature_6cm=soil_temperature_6cm,
+        soil_temperature_18cm=soil_temperature_18cm,
+        soil_temperature_54cm=soil_temperature_54cm,
+        soil_moisture_0cm=soil_moisture,
+        soil_moisture_1cm=soil_moisture_1cm,
+        soil_moisture_3cm=soil_moisture_3cm,
+        soil_moisture_9cm=soil_moisture_9cm,
+        soil_moisture_27cm=soil_moisture_27cm,
+        daily_weather_code=daily_weather_code,
+        daily_maximum_temperature_2m=temperature_2m_max,
+        daily_minimum_temperature_2m=temperature_2m_min,
+        daily_maximum_apparent_temperature_2m=apparent_temperature_max,
+        daily_minimum_apparent_temperature_2m=apparent_temperature_min,
+        sunrise=sunrise,
+        sunset=sunset,
+        daylight_duration=daylight_duration,
+        sunshine_duration=sunshine_duration,
+        uv_index=uv_index_max,
+        uv_index_clear_sky=uv_index_clear_sky_max,
+        rain_sum=rain_sum,
+        showers_sum=showers_sum,
+        snowfall_sum=snowfall_sum,
+        precipitation_sum=precipitation_sum,
+        precipitation_hours=precipitation_hours,
+        precipitation_probability_max=precipitation_probability_max,
+        maximum_wind_speed_10m=wind_speed_10m_max,
+        maximum_wind_gusts_10m=wind_gusts_10m_max,
+        dominant_wind_direction=wind_direction_10m_dominant,
+        shortwave_radiation_sum=shortwave_radiation_sum,
+        daily_reference_evapotranspiration=et0_fao_evapotranspiration,
+        version=version,
+    )
+
+
+def _parse_openmeteo(
+    responses: list[WeatherApiResponse], tz: str, dt: datetime.datetime, version: str
+) -> WeatherModel | None:
+    frames = _parse_openmeteo_frames(responses, tz)
+    if frames is None:
+        return None
+    hourly_df, daily_df = frames
+    return _slice_openmeteo(hourly_df, daily_df, tz, dt, version)
+
+
+def _openmeteo_params(latitude: float, longitude: float, tz: str) -> dict[str, Any]:
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "hourly": [
+            "temperature_2m",
+            "relative_humidity_2m",
+            "dew_point_2m",
+            "apparent_temperature",
+            "precipitation",
+            "rain",
+            "snowfall",
+            "snow_depth",
+            "weather_code",
+            "pressure_msl",
+            "surface_pressure",
+            "cloud_cover",
+            "cloud_cover_low",
+            "cloud_cover_mid",
+            "cloud_cover_high",
+            "et0_fao_evapotranspiration",
+            "vapour_pressure_deficit",
+            "wind_speed_10m",
+            "wind_speed_100m",
+            "wind_direction_10m",
+            "wind_direction_100m",
+            "wind_gusts_10m",
+            "soil_temperature_0_to_7cm",
+            "soil_temperature_7_to_28cm",
+            "soil_temperature_28_to_100cm",
+            "soil_temperature_100_to_255cm",
+            "soil_moisture_0_to_7cm",
+            "soil_moisture_7_to_28cm",
+            "soil_moisture_28_to_100cm",
+            "soil_moisture_100_to_255cm",
+        ],
+        "daily": [
+            "weather_code",
+            "temperature_2m_max",
+            "temperature_2m_min",
+            "temperature_2m_mean",
+            "apparent_temperature_max",
+            "apparent_temperature_min",
+            "apparent_temperature_mean",
+            "sunrise",
+            "sunset",
+            "daylight_duration",
+            "sunshine_duration",
+            "precipitation_sum",
+            "rain_sum",
+            "snowfall_sum",
+            "precipitation_hours",
+            "wind_speed_10m_max",
+            "wind_gusts_10m_max",
+            "wind_direction_10m_dominant",
+            "shortwave_radiation_sum",
+            "et0_fao_evapotranspiration",
+        ],
+        "timezone": tz,
+    }
+
+
 def _create_openmeteo_weather_model(
     session: requests_cache.CachedSession,
     latitude: float,
@@ -388,65 +482,7 @@ def _create_openmeteo_weather_model(
     # pylint: disable=broad-exception-caught
     client = openmeteo_requests.Client(session=session)
     try:
-        params = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "hourly": [
-                "temperature_2m",
-                "relative_humidity_2m",
-                "dew_point_2m",
-                "apparent_temperature",
-                "precipitation",
-                "rain",
-                "snowfall",
-                "snow_depth",
-                "weather_code",
-                "pressure_msl",
-                "surface_pressure",
-                "cloud_cover",
-                "cloud_cover_low",
-                "cloud_cover_mid",
-                "cloud_cover_high",
-                "et0_fao_evapotranspiration",
-                "vapour_pressure_deficit",
-                "wind_speed_10m",
-                "wind_speed_100m",
-                "wind_direction_10m",
-                "wind_direction_100m",
-                "wind_gusts_10m",
-                "soil_temperature_0_to_7cm",
-                "soil_temperature_7_to_28cm",
-                "soil_temperature_28_to_100cm",
-                "soil_temperature_100_to_255cm",
-                "soil_moisture_0_to_7cm",
-                "soil_moisture_7_to_28cm",
-                "soil_moisture_28_to_100cm",
-                "soil_moisture_100_to_255cm",
-            ],
-            "daily": [
-                "weather_code",
-                "temperature_2m_max",
-                "temperature_2m_min",
-                "temperature_2m_mean",
-                "apparent_temperature_max",
-                "apparent_temperature_min",
-                "apparent_temperature_mean",
-                "sunrise",
-                "sunset",
-                "daylight_duration",
-                "sunshine_duration",
-                "precipitation_sum",
-                "rain_sum",
-                "snowfall_sum",
-                "precipitation_hours",
-                "wind_speed_10m_max",
-                "wind_gusts_10m_max",
-                "wind_direction_10m_dominant",
-                "shortwave_radiation_sum",
-                "et0_fao_evapotranspiration",
-            ],
-            "timezone": tz,
-        }
+        params = _openmeteo_params(latitude, longitude, tz)
         url = "https://historical-forecast-api.open-meteo.com/v1/forecast"
         if dt.date() > datetime.datetime.today().date():
             url = "https://api.open-meteo.com/v1/forecast"
@@ -490,6 +526,100 @@ def _cached_create_openmeteo_weather_model(
     )
 
 
+def _season_range(date: datetime.date) -> tuple[datetime.date, datetime.date]:
+    start = date.replace(
+        month=(date.month - 1) // _SEASON_MONTHS * _SEASON_MONTHS + 1, day=1
+    )
+    end_month = start.month + _SEASON_MONTHS
+    end = datetime.date(start.year + (end_month - 1) // 12, (end_month - 1) % 12 + 1, 1)
+    return start, end - datetime.timedelta(days=1)
+
+
+def _fetch_openmeteo_season(
+    session: requests_cache.CachedSession,
+    latitude: float,
+    longitude: float,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    tz: str,
+) -> tuple[pd.DataFrame, pd.DataFrame] | None:
+    # pylint: disable=broad-exception-caught
+    client = openmeteo_requests.Client(session=session)
+    try:
+        params = _openmeteo_params(latitude, longitude, tz)
+        params["start_date"] = str(start_date)
+        params["end_date"] = str(end_date)
+        responses = client.weather_api(
+            "https://historical-forecast-api.open-meteo.com/v1/forecast",
+            params=params,
+        )
+        return _parse_openmeteo_frames(responses, tz)
+    except (
+        requests.exceptions.RetryError,
+        OpenMeteoRequestsError,
+        requests.exceptions.ReadTimeout,
+        requests.exceptions.HTTPError,
+        requests.exceptions.ConnectionError,
+    ):
+        return None
+    except Exception as e:
+        e_text = str(e)
+        if "Parameter 'start_date' is out of allowed range from" in e_text:
+            return None
+        raise e
+
+
+@MEMORY.cache(ignore=["session"])
+def _cached_fetch_openmeteo_season(
+    session: requests_cache.CachedSession,
+    latitude: float,
+    longitude: float,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    tz: str,
+    version: str,
+) -> tuple[pd.DataFrame, pd.DataFrame] | None:
+    # pylint: disable=unused-argument
+    return _fetch_openmeteo_season(
+        session, latitude, longitude, start_date, end_date, tz
+    )
+
+
+def _openmeteo_season(
+    session: requests_cache.CachedSession,
+    latitude: float,
+    longitude: float,
+    dt: datetime.datetime,
+    tz: str,
+) -> tuple[pd.DataFrame, pd.DataFrame] | None:
+    start_date, end_date = _season_range(dt.date())
+    key = (
+        round(latitude, _COORDINATE_PRECISION),
+        round(longitude, _COORDINATE_PRECISION),
+        start_date,
+        tz,
+    )
+    with _SEASONS_LOCK:
+        if key in _SEASONS:
+            _SEASONS.move_to_end(key)
+            return _SEASONS[key]
+    frames = _cached_fetch_openmeteo_season(
+        session, key[0], key[1], start_date, end_date, tz, VERSION
+    )
+    with _SEASONS_LOCK:
+        _SEASONS[key] = frames
+        while len(_SEASONS) > _MAX_SEASONS:
+            _SEASONS.popitem(last=False)
+    return frames
+
+
+def _season_covers(hourly_df: pd.DataFrame, tz: str, dt: datetime.datetime) -> bool:
+    if hourly_df.empty:
+        return False
+    dt = pytz.timezone(tz).localize(dt.replace(tzinfo=None))
+    return bool(hourly_df.index[0] <= dt <= hourly_df.index[-1] + pd.Timedelta(hours=1))
+
+
 def create_openmeteo_weather_model(
     session: requests_cache.CachedSession,
     latitude: float,
@@ -497,10 +627,20 @@ def create_openmeteo_weather_model(
     dt: datetime.datetime,
     tz: str,
 ) -> WeatherModel | None:
-    """Create a weather model from openmeteo."""
-    if not pytest_is_running.is_running() and dt < datetime.datetime.now().replace(
-        tzinfo=dt.tzinfo
-    ) - datetime.timedelta(days=3):
+    """Create a weather model from openmeteo.
+
+    Historical games are sliced out of a season of weather fetched once per
+    venue, so a stadium costs one request a season rather than one a game.
+    """
+    settled = datetime.datetime.now().replace(tzinfo=dt.tzinfo) - datetime.timedelta(
+        days=3
+    )
+    if not pytest_is_running.is_running() and dt < settled:
+        if _season_range(dt.date())[1] < settled.date():
+            frames = _openmeteo_season(session, latitude, longitude, dt, tz)
+            if frames is not None and _season_covers(frames[0], tz, dt):
+                hourly_df, daily_df = frames
+                return _slice_openmeteo(hourly_df, daily_df, tz, dt, VERSION)
         return _cached_create_openmeteo_weather_model(
             session, latitude, longitude, dt, tz, VERSION
         )
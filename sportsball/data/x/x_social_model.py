@@ -7,7 +7,6 @@ import os
 import pytest_is_running
 import requests
 import requests_cache
-import tweepy  # type: ignore
 from dateutil import parser
 
 from ...cache import MEMORY
@@ -134,6 +133,9 @@ def _create_x_social_model(
     if not username:
         return []
 
+    # pylint: disable=import-outside-toplevel
+    import tweepy  # type: ignore
+
     auth = tweepy.OAuth1UserHandler(
         api_key, api_secret_key, access_token, access_token_secret
     )
@@ -0,0 +1,120 @@
+"""Incremental exports that only refresh the newest games."""
+
+import datetime
+import os
+
+import pandas as pd
+
+from .data.game_model import GAME_DT_COLUMN
+from .parquet_writer import partition_path
+
+DEFAULT_LOOKBACK_DAYS = 7
+
+
+def _utc_dates(df: pd.DataFrame) -> pd.Series:
+    return pd.to_datetime(df[GAME_DT_COLUMN], utc=True).dt.date
+
+
+def read_previous(path: str) -> pd.DataFrame | None:
+    """Read the output of a previous run if there is one."""
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def since_date(
+    df: pd.DataFrame,
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+    today: datetime.date | None = None,
+) -> datetime.date | None:
+    """The first date to crawl again after a previous export.
+
+    This is the newest game already exported, capped at today as the previous
+    run also holds upcoming fixtures, less a lookback to pick up games that
+    were still live or had not settled.
+    """
+    if df.empty or GAME_DT_COLUMN not in df.columns:
+        return None
+    high_water = _utc_dates(df).max()
+    if pd.isnull(high_water):
+        return None
+    if today is None:
+        today = datetime.datetime.now().date()
+    return min(high_water, today) - datetime.timedelta(days=lookback_days)
+
+
+def _replaced(
+    previous: pd.DataFrame, df: pd.DataFrame, since: datetime.date
+) -> pd.Series:
+    # Only the dates the crawl covered are replaced, so an empty or cut short
+    # crawl keeps the games it did not reach.
+    if df.empty or GAME_DT_COLUMN not in df.columns or previous.empty:
+        return pd.Series(False, index=previous.index)
+    dates = _utc_dates(previous)
+    return (dates >= since) & (dates <= _utc_dates(df).max())
+
+
+def merge_frames(
+    previous: pd.DataFrame, df: pd.DataFrame, since: datetime.date
+) -> pd.DataFrame:
+    """Replace the games in the previous export the new crawl covered.
+
+    These are the games from the since date up to the newest game crawled.
+    The cut is made on the UTC date of each game, so the new frame should be
+    crawled from a day earlier to cover games whose local date falls the day
+    before. If the crawl found no games the previous export is kept as it is.
+    """
+    if df.empty or GAME_DT_COLUMN not in df.columns:
+        return previous
+    frames = [
+        previous[~_replaced(previous, df, since)],
+        df[_utc_dates(df) >= since],
+    ]
+    merged = pd.concat(frames, ignore_index=True)
+    merged = merged.sort_values(
+        by=GAME_DT_COLUMN,
+        key=lambda x: pd.to_datetime(x, utc=True),
+        kind="stable",
+        ignore_index=True,
+    )
+    merged = merged[sorted(merged.columns.values.tolist())]
+    for attrs in (previous.attrs, df.attrs):
+        for k, v in attrs.items():
+            if isinstance(v, list):
+                merged.attrs[k] = sorted(
+                    (set(merged.attrs.get(k, [])) | set(v)) & set(merged.columns)
+                )
+    return merged
+
+
+def _partition_paths(df: pd.DataFrame, partition_cols: list[str]) -> pd.Series:
+    return pd.Series(
+        [
+            partition_path(partition_cols, tuple(x))
+            for x in df[partition_cols].itertuples(index=False)
+        ],
+        index=df.index,
+        dtype=object,
+    )
+
+
+def changed_partitions(
+    merged: pd.DataFrame,
+    previous: pd.DataFrame,
+    df: pd.DataFrame,
+    since: datetime.date,
+    partition_cols: list[str],
+) -> tuple[pd.DataFrame, set[str]]:
+    """The partitions that gained or lost games since the date.
+
+    These are the merged rows in those partitions, and the paths of the
+    partitions, which include those that lost all of their games.
+    """
+    partition_cols = [x for x in partition_cols if x in merged.columns]
+    if not partition_cols:
+        return merged, set()
+    paths = set()
+    for frame in (previous[_replaced(previous, df, since)], df):
+        if not frame.empty and set(partition_cols) <= set(frame.columns):
+            paths |= set(_partition_paths(frame, partition_cols))
+    return merged[_partition_paths(merged, partition_cols).isin(paths)], paths
@@ -0,0 +1,182 @@
+"""Write league frames out to parquet without buffering the whole file."""
+
+import json
+import os
+from typing import IO, Any
+
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import pyarrow.parquet as pq  # type: ignore
+
+from .data.game_model import SEASON_TYPE_COLUMN, SEASON_YEAR_COLUMN
+
+DEFAULT_ROW_GROUP_SIZE = 1024
+DEFAULT_COMPRESSION = "zstd"
+DEFAULT_PARTITION_COLS = [SEASON_YEAR_COLUMN, SEASON_TYPE_COLUMN]
+_PANDAS_ATTRS = "PANDAS_ATTRS"
+_THREADS = os.cpu_count()
+_HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+
+def partition_value(value: Any) -> str:
+    """The directory name a partition value is written under."""
+    if pd.isnull(value):
+        return _HIVE_NULL
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def partition_path(partition_cols: list[str], values: tuple[Any, ...]) -> str:
+    """The path of a partition relative to the root of its dataset."""
+    return "/".join(
+        f"{col}={partition_value(value)}" for col, value in zip(partition_cols, values)
+    )
+
+
+def _schema(df: pd.DataFrame) -> pa.Schema:
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    if df.attrs:
+        # Stored the same way pandas does so read_parquet restores the attrs.
+        schema = schema.with_metadata(
+            {**(schema.metadata or {}), _PANDAS_ATTRS: json.dumps(df.attrs)}
+        )
+    return schema
+
+
+def _write_row_groups(
+    writer: pq.ParquetWriter, df: pd.DataFrame, schema: pa.Schema, row_group_size: int
+) -> None:
+    for start in range(0, len(df), row_group_size):
+        table = pa.Table.from_pandas(
+            df.iloc[start : start + row_group_size],
+            schema=schema,
+            preserve_index=False,
+            nthreads=_THREADS,
+        )
+        writer.write_table(table, row_group_size=row_group_size)
+
+
+def write_parquet(
+    df: pd.DataFrame,
+    where: str | IO[Any],
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+) -> None:
+    """Write the frame to a single parquet file a row group at a time.
+
+    Only one row group is converted to arrow at once, so the file is never
+    held in memory and `where` can be a non seekable stream such as stdout.
+    """
+    schema = _schema(df)
+    with pq.ParquetWriter(where, schema, compression=compression) as writer:
+        _write_row_groups(writer, df, schema, row_group_size)
+
+
+def _dataset_files(root: str) -> list[str]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Files and directories starting with these are skipped by readers too.
+        dirnames[:] = [x for x in dirnames if not x.startswith(("_", "."))]
+        files.extend(
+            os.path.join(dirpath, x)
+            for x in filenames
+            if x.endswith(".parquet") and not x.startswith(("_", "."))
+        )
+    return sorted(files)
+
+
+def _clear_partition(root: str, path: str) -> None:
+    for name in os.listdir(path):
+        if name.endswith(".parquet"):
+            os.remove(os.path.join(path, name))
+    # Remove the directories left empty, up to the root.
+    while os.path.abspath(path) != os.path.abspath(root) and not os.listdir(path):
+        os.rmdir(path)
+        path = os.path.dirname(path)
+
+
+def _same_schema(left: pa.Schema, right: pa.Schema) -> bool:
+    return left.equals(right, check_metadata=False) and (
+        (left.metadata or {}).get(_PANDAS_ATTRS.encode())
+        == (right.metadata or {}).get(_PANDAS_ATTRS.encode())
+    )
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    return pa.Table.from_arrays(
+        [
+            table.column(x.name).cast(x.type)
+            if x.name in table.column_names
+            else pa.nulls(len(table), x.type)
+            for x in schema
+        ],
+        schema=schema,
+    )
+
+
+def write_dataset(
+    df: pd.DataFrame,
+    root: str,
+    partition_cols: list[str] | None = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+    clear_partitions: set[str] | None = None,
+) -> None:
+    """Write the frame to a Hive partitioned parquet dataset.
+
+    Every partition present in the frame is replaced, and every partition in
+    `clear_partitions` that is not is removed, while the other partitions are
+    left as they are. Readers take the schema of a dataset from one of its
+    files, so every file is written with the schema of the frame unified with
+    that of the files already there, and the files left as they are are
+    rewritten if their schema differs from it.
+    """
+    if partition_cols is None:
+        partition_cols = DEFAULT_PARTITION_COLS
+    partition_cols = [x for x in partition_cols if x in df.columns]
+    if not partition_cols:
+        os.makedirs(root, exist_ok=True)
+        write_parquet(
+            df, os.path.join(root, "part-0.parquet"), row_group_size, compression
+        )
+        return
+    paths = {
+        partition_path(partition_cols, tuple(x))
+        for x in df[partition_cols].drop_duplicates().itertuples(index=False)
+    }
+    for path in (clear_partitions or set()) | paths:
+        path = os.path.join(root, *path.split("/"))
+        if os.path.isdir(path):
+            _clear_partition(root, path)
+
+    existing = {x: pq.read_schema(x) for x in _dataset_files(root)}
+    schema = pa.unify_schemas(
+        [_schema(df.drop(columns=partition_cols)), *existing.values()],
+        promote_options="permissive",
+    )
+    for filename, file_schema in existing.items():
+        if not _same_schema(file_schema, schema):
+            table = _conform(pq.ParquetFile(filename).read(), schema)
+            pq.write_table(
+                table, filename, row_group_size=row_group_size, compression=compression
+            )
+    for values, partition in df.groupby(
+        partition_cols, sort=False, dropna=False, observed=True
+    ):
+        if not isinstance(values, tuple):
+            values = (values,)
+        partition = partition.drop(columns=partition_cols)
+        partition = partition.assign(
+            **{
+                x: pd.Series(None, index=partition.index, dtype=object)
+                for x in schema.names
+                if x not in partition.columns
+            }
+        )[schema.names]
+        path = os.path.join(root, *partition_path(partition_cols, values).split("/"))
+        os.makedirs(path, exist_ok=True)
+        with pq.ParquetWriter(
+            os.path.join(path, "part-0.parquet"), schema, compression=compression
+        ) as writer:
+            _write_row_groups(writer, partition, schema, row_group_size)
@@ -1,9 +1,17 @@
 """Utility for providing and installing playwright."""
 
 # pylint: disable=subprocess-run-check,global-statement
+import atexit
+import contextlib
+import logging
 import subprocess
+import sys
+import threading
+from typing import TYPE_CHECKING, Iterator
 
-from playwright._impl._driver import compute_driver_executable, get_driver_env
+if TYPE_CHECKING:
+    from playwright.sync_api import (Browser, BrowserContext, Page, Playwright,
+                                     Route)
 
 _INSTALLED = False
 
@@ -12,9 +20,180 @@ def ensure_install():
     """Provides a playwright instance guaranteeing an install."""
     global _INSTALLED
     if not _INSTALLED:
-        driver_executable, driver_cli = compute_driver_executable()
+        # The playwright CLI rather than its private driver module.
         completed_process = subprocess.run(
-            [driver_executable, driver_cli, "install"], env=get_driver_env()
+            [sys.executable, "-m", "playwright", "install"]
         )
         assert completed_process.returncode == 0
         _INSTALLED = True
+
+
+DEFAULT_MAX_NAVIGATIONS = 50
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+def _block_resources(route: "Route") -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+class BrowserPoolStats:
+    """Statistics on how often the browser pool avoided launching chromium."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.pages = 0
+        self.launches = 0
+        self.contexts = 0
+
+    @property
+    def launches_avoided(self) -> int:
+        """The browser launches saved over launching one per page."""
+        return self.pages - self.launches
+
+
+class _PooledPage:
+    """A page with its own context, and how many times it has been navigated."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, context: "BrowserContext", page: "Page") -> None:
+        self.context = context
+        self.page = page
+        self.navigations = 0
+
+
+class _ThreadBrowser:
+    """The playwright driver, browser and idle pages of a single thread."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.playwright: "Playwright | None" = None
+        self.browser: "Browser | None" = None
+        self.idle: list[_PooledPage] = []
+
+
+class BrowserPool:
+    """Keeps chromium warm and reuses its contexts across page loads.
+
+    Playwright's sync API is bound to the thread that started it, so each
+    thread gets its own browser, which that thread has to close once its work
+    is done. Pages are handed out from an idle list, their context is recycled
+    after `max_navigations` uses and images, fonts and media are never
+    downloaded.
+    """
+
+    def __init__(
+        self,
+        max_navigations: int = DEFAULT_MAX_NAVIGATIONS,
+        block_resources: bool = True,
+    ) -> None:
+        self._max_navigations = max_navigations
+        self._block_resources = block_resources
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._thread_browsers: dict[int, _ThreadBrowser] = {}
+        self.stats = BrowserPoolStats()
+
+    @property
+    def open_threads(self) -> int:
+        """The number of threads holding a browser that has not been closed."""
+        with self._lock:
+            return len(self._thread_browsers)
+
+    def _thread_browser(self) -> _ThreadBrowser:
+        thread_browser = getattr(self._local, "browser", None)
+        if thread_browser is None:
+            thread_browser = _ThreadBrowser()
+            self._local.browser = thread_browser
+            with self._lock:
+                self._thread_browsers[threading.get_ident()] = thread_browser
+        return thread_browser
+
+    def _browser(self, thread_browser: _ThreadBrowser) -> "Browser":
+        browser = thread_browser.browser
+        if browser is not None and browser.is_connected():
+            return browser
+        # Playwright is slow to import, so it is only loaded once a page is needed.
+        # pylint: disable=import-outside-toplevel
+        from playwright.sync_api import sync_playwright
+
+        ensure_install()
+        if thread_browser.playwright is None:
+            thread_browser.playwright = sync_playwright().start()
+        browser = thread_browser.playwright.chromium.launch()
+        thread_browser.browser = browser
+        thread_browser.idle = []
+        with self._lock:
+            self.stats.launches += 1
+        return browser
+
+    def _new_page(self, thread_browser: _ThreadBrowser) -> _PooledPage:
+        context = self._browser(thread_browser).new_context()
+        if self._block_resources:
+            context.route("**/*", _block_resources)
+        with self._lock:
+            self.stats.contexts += 1
+        return _PooledPage(context, context.new_page())
+
+    @contextlib.contextmanager
+    def page(self) -> Iterator["Page"]:
+        """Borrow a page, returning it to the pool when done."""
+        thread_browser = self._thread_browser()
+        browser = thread_browser.browser
+        if thread_browser.idle and browser is not None and browser.is_connected():
+            pooled_page = thread_browser.idle.pop()
+        else:
+            pooled_page = self._new_page(thread_browser)
+        with self._lock:
+            self.stats.pages += 1
+        reusable = False
+        try:
+            yield pooled_page.page
+            pooled_page.navigations += 1
+            reusable = pooled_page.navigations < self._max_navigations
+        finally:
+            if reusable:
+                thread_browser.idle.append(pooled_page)
+            else:
+                # A page that errored may be left mid navigation.
+                with contextlib.suppress(Exception):
+                    pooled_page.context.close()
+
+    def close(self) -> None:
+        """Close the browser of the calling thread."""
+        thread_browser = getattr(self._local, "browser", None)
+        if thread_browser is None:
+            return
+        self._local.browser = None
+        with self._lock:
+            self._thread_browsers.pop(threading.get_ident(), None)
+        try:
+            if thread_browser.browser is not None:
+                thread_browser.browser.close()
+        finally:
+            if thread_browser.playwright is not None:
+                thread_browser.playwright.stop()
+
+
+BROWSER_POOL = BrowserPool()
+# The worker threads close their own browsers, this closes the main thread's.
+atexit.register(BROWSER_POOL.close)
+
+
+def log_browser_pool_stats() -> None:
+    """Log the browser launches the pool has avoided."""
+    stats = BROWSER_POOL.stats
+    if not stats.pages:
+        return
+    logging.info(
+        "Browser pool: %d pages, %d launches, %d contexts, %d launches avoided.",
+        stats.pages,
+        stats.launches,
+        stats.contexts,
+        stats.launches_avoided,
+    )
@@ -0,0 +1,201 @@
+"""Bounded concurrent prefetching of URLs through a scrape session."""
+
+import collections
+import copy
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from scrapesession.scrapesession import ScrapeSession  # type: ignore
+
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+# Set by the CLI for the models that are not given their own limits.
+MAX_IN_FLIGHT = DEFAULT_MAX_IN_FLIGHT
+REQUESTS_PER_SECOND: float | None = DEFAULT_REQUESTS_PER_SECOND
+
+
+class _HostRateLimiter:
+    """Spaces out requests to the same host."""
+
+    def __init__(self, requests_per_second: float | None) -> None:
+        self._interval = (
+            1.0 / requests_per_second
+            if requests_per_second is not None and requests_per_second > 0.0
+            else 0.0
+        )
+        self._lock = threading.Lock()
+        self._next_slot: dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        """Block until a request to the URLs host is allowed."""
+        if self._interval <= 0.0:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+        delay = slot - now
+        if delay > 0.0:
+            time.sleep(delay)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """Waits on the rate limiter before each request that goes over the network."""
+
+    def __init__(self, limiter: _HostRateLimiter) -> None:
+        super().__init__()
+        self._limiter = limiter
+
+    def send(self, request, *args, **kwargs):  # type: ignore
+        if request.url is not None:
+            self._limiter.wait(request.url)
+        return super().send(request, *args, **kwargs)
+
+
+def _rebind(session: requests.Session, backend: Any, adapter: HTTPAdapter) -> Any:
+    # A cached session refuses to be copied, as it refuses to be pickled.
+    rebound = object.__new__(type(session))
+    rebound.__dict__.update(session.__dict__)
+    rebound.cache = backend  # type: ignore
+    rebound.adapters = collections.OrderedDict()
+    rebound.mount("http://", adapter)
+    rebound.mount("https://", adapter)
+    return rebound
+
+
+def _limited_session(
+    session: ScrapeSession, limiter: _HostRateLimiter
+) -> ScrapeSession:
+    """A copy of `session` sharing its cache, with its own cache and wayback toggles.
+
+    The cache settings, the disabled toggle among them, are held by the cache
+    backend, so the copy gets a shallow copy of the backend that keeps the
+    stored responses. Cached responses are served before the transport adapters
+    are reached, so only the requests that go over the network wait on the
+    limiter.
+    """
+    backend = copy.copy(session.cache)
+    backend._settings = copy.copy(session.settings)  # pylint: disable=protected-access
+    backend._settings.disabled = False  # pylint: disable=protected-access
+    adapter = _RateLimitedAdapter(limiter)
+    limited = _rebind(session, backend, adapter)
+    # A scrape session sends over the network through a session of its own.
+    inner = getattr(session, "_session", None)
+    if inner is not None:
+        limited._session = _rebind(inner, backend, adapter)  # pylint: disable=protected-access
+    return limited
+
+
+class Prefetcher:
+    """Fetches URLs ahead of time on a bounded pool of threads.
+
+    Responses are handed back through `get` in whatever order the caller asks
+    for them, so a crawl can stay sequential while its sibling requests are
+    already in flight. The caller makes its own requests through `session`,
+    and the workers through a session of their own, so toggling the cache or
+    the wayback machine on one cannot change a request in flight on another.
+    Both share the cache of the given session and the per-host rate limit.
+    """
+
+    def __init__(
+        self,
+        session: ScrapeSession,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        requests_per_second: float | None = DEFAULT_REQUESTS_PER_SECOND,
+    ) -> None:
+        limiter = _HostRateLimiter(requests_per_second)
+        self.session = _limited_session(session, limiter)
+        self._worker_session = _limited_session(session, limiter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_in_flight), thread_name_prefix="prefetch"
+        )
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future[requests.Response]] = {}
+        self._closed = False
+
+    def __enter__(self) -> "Prefetcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _fetch(
+        self,
+        url: str,
+        follow: Callable[[requests.Response], Iterable[str]] | None,
+    ) -> requests.Response:
+        response = self._worker_session.get(url)
+        if follow is not None and response.ok:
+            try:
+                self.prefetch(follow(response))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logging.debug("Failed to follow %s: %s", url, str(exc))
+        return response
+
+    def prefetch(
+        self,
+        urls: Iterable[str],
+        follow: Callable[[requests.Response], Iterable[str]] | None = None,
+    ) -> None:
+        """Start fetching the URLs in the background.
+
+        `follow` is run on each fetched response to find further URLs to
+        prefetch. Nothing is prefetched while the session cache is disabled,
+        as toggling the cache is not thread safe.
+        """
+        if self.session.settings.disabled:
+            return
+        with self._lock:
+            if self._closed:
+                return
+            for url in urls:
+                if url in self._futures:
+                    continue
+                self._futures[url] = self._executor.submit(self._fetch, url, follow)
+
+    def get(self, url: str) -> requests.Response:
+        """Fetch the URL, using the prefetched response if there is one."""
+        with self._lock:
+            future = self._futures.pop(url, None)
+        if future is not None:
+            return future.result()
+        return self.session.get(url)
+
+    def wait(self, urls: Iterable[str]) -> None:
+        """Wait for any prefetches of the URLs to land in the session cache."""
+        for url in urls:
+            with self._lock:
+                future = self._futures.pop(url, None)
+            if future is None:
+                continue
+            try:
+                future.result()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # The caller fetches the URL again and sees the error itself.
+                logging.debug("Prefetch of %s failed: %s", url, str(exc))
+
+    def discard(self, urls: Iterable[str]) -> None:
+        """Drop the prefetches of URLs that will not be asked for.
+
+        Fetches that have not started are cancelled, and any that have are
+        left to land in the session cache.
+        """
+        with self._lock:
+            futures = [self._futures.pop(x, None) for x in urls]
+        for future in futures:
+            if future is not None:
+                future.cancel()
+
+    def close(self) -> None:
+        """Stop the prefetcher, abandoning any queued fetches."""
+        with self._lock:
+            self._closed = True
+            self._futures = {}
+        self._executor.shutdown(wait=False, cancel_futures=True)
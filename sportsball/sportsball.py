@@ -1,7 +1,7 @@
 """The main sportsball class for accessing data."""
 
-# pylint: disable=too-many-branches
-from typing import Dict
+import importlib
+from typing import Callable, Dict
 from warnings import simplefilter
 
 import pandas as pd
@@ -9,26 +9,41 @@ from dotenv import load_dotenv
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 from scrapesession.scrapesession import create_scrape_session
 
-from .data.afl import AFLLeagueModel
-from .data.aflw import AFLWLeagueModel
-from .data.atp import ATPLeagueModel
-from .data.bundesliga import BundesligaLeagueModel
-from .data.epl import EPLLeagueModel
-from .data.fifa import FIFALeagueModel
-from .data.hkjc import HKJCLeagueModel
-from .data.ipl import IPLLeagueModel
-from .data.laliga import LaLigaLeagueModel
 from .data.league import League
 from .data.league_model import LeagueModel
-from .data.mlb import MLBLeagueModel
-from .data.nba import NBALeagueModel
-from .data.ncaab import NCAABLeagueModel
-from .data.ncaabw import NCAABWLeagueModel
-from .data.ncaaf import NCAAFLeagueModel
-from .data.nfl import NFLLeagueModel
-from .data.nhl import NHLLeagueModel
-from .data.wnba import WNBALeagueModel
-from .data.wta import WTALeagueModel
+
+# Each league is imported on first use, as between them they pull in most of the
+# dependencies of sportsball.
+_LEAGUE_MODELS: dict[League, tuple[str, str]] = {
+    League.AFL: (".data.afl", "AFLLeagueModel"),
+    League.AFLW: (".data.aflw", "AFLWLeagueModel"),
+    League.ATP: (".data.atp", "ATPLeagueModel"),
+    League.BUNDESLIGA: (".data.bundesliga", "BundesligaLeagueModel"),
+    League.EPL: (".data.epl", "EPLLeagueModel"),
+    League.FIFA: (".data.fifa", "FIFALeagueModel"),
+    League.HKJC: (".data.hkjc", "HKJCLeagueModel"),
+    League.IPL: (".data.ipl", "IPLLeagueModel"),
+    League.LALIGA: (".data.laliga", "LaLigaLeagueModel"),
+    League.MLB: (".data.mlb", "MLBLeagueModel"),
+    League.NBA: (".data.nba", "NBALeagueModel"),
+    League.NCAAB: (".data.ncaab", "NCAABLeagueModel"),
+    League.NCAABW: (".data.ncaabw", "NCAABWLeagueModel"),
+    League.NCAAF: (".data.ncaaf", "NCAAFLeagueModel"),
+    League.NFL: (".data.nfl", "NFLLeagueModel"),
+    League.NHL: (".data.nhl", "NHLLeagueModel"),
+    League.WNBA: (".data.wnba", "WNBALeagueModel"),
+    League.WTA: (".data.wta", "WTALeagueModel"),
+}
+_UNFILTERED_LEAGUES = {League.HKJC}
+
+
+def league_model_class(league: League) -> Callable[..., LeagueModel]:
+    """Import the model class of a league, and no other league."""
+    entry = _LEAGUE_MODELS.get(league)
+    if entry is None:
+        raise ValueError(f"Unrecognised league: {league}")
+    module_name, class_name = entry
+    return getattr(importlib.import_module(module_name, __package__), class_name)
 
 
 class SportsBall:
@@ -55,44 +70,9 @@ class SportsBall:
     def league(self, league: League, league_filter: str | None) -> LeagueModel:
         """Provide a league model for the given league."""
         if league not in self._leagues:
-            if league == League.NFL:
-                self._leagues[league] = NFLLeagueModel(self._session, league_filter)
-            elif league == League.AFL:
-                self._leagues[league] = AFLLeagueModel(self._session, league_filter)
-            elif league == League.NBA:
-                self._leagues[league] = NBALeagueModel(self._session, league_filter)
-            elif league == League.NCAAF:
-                self._leagues[league] = NCAAFLeagueModel(self._session, league_filter)
-            elif league == League.NCAAB:
-                self._leagues[league] = NCAABLeagueModel(self._session, league_filter)
-            elif league == League.HKJC:
-                self._leagues[league] = HKJCLeagueModel(self._session)
-            elif league == League.NHL:
-                self._leagues[league] = NHLLeagueModel(self._session, league_filter)
-            elif league == League.MLB:
-                self._leagues[league] = MLBLeagueModel(self._session, league_filter)
-            elif league == League.EPL:
-                self._leagues[league] = EPLLeagueModel(self._session, league_filter)
-            elif league == League.IPL:
-                self._leagues[league] = IPLLeagueModel(self._session, league_filter)
-            elif league == League.FIFA:
-                self._leagues[league] = FIFALeagueModel(self._session, league_filter)
-            elif league == League.ATP:
-                self._leagues[league] = ATPLeagueModel(self._session, league_filter)
-            elif league == League.WNBA:
-                self._leagues[league] = WNBALeagueModel(self._session, league_filter)
-            elif league == League.AFLW:
-                self._leagues[league] = AFLWLeagueModel(self._session, league_filter)
-            elif league == League.WTA:
-                self._leagues[league] = WTALeagueModel(self._session, league_filter)
-            elif league == League.NCAABW:
-                self._leagues[league] = NCAABWLeagueModel(self._session, league_filter)
-            elif league == League.LALIGA:
-                self._leagues[league] = LaLigaLeagueModel(self._session, league_filter)
-            elif league == League.BUNDESLIGA:
-                self._leagues[league] = BundesligaLeagueModel(
-                    self._session, league_filter
-                )
+            model_class = league_model_class(league)
+            if league in _UNFILTERED_LEAGUES:
+                self._leagues[league] = model_class(self._session)
             else:
-                raise ValueError(f"Unrecognised league: {league}")
+                self._leagues[league] = model_class(self._session, league_filter)
         return self._leagues[league]
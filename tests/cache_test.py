@@ -0,0 +1,35 @@
+"""Tests for the cache module."""
+import unittest
+import uuid
+
+from sportsball.cache import cache_key, keyed_cache, keyed_cache_stats
+
+
+class TestCache(unittest.TestCase):
+
+    def test_keyed_cache_ignores_payload(self):
+        calls = []
+
+        @keyed_cache("url", "version")
+        def _create(payload: dict, url: str, version: str) -> int:
+            calls.append(url)
+            return len(payload)
+
+        url = f"https://example.com/{uuid.uuid4()}"
+        self.assertEqual(_create({"a": 1}, url, "0.0.1"), 1)
+        self.assertEqual(_create({"a": 1, "b": 2}, url, "0.0.1"), 1)
+        self.assertEqual(calls, [url])
+        stats = keyed_cache_stats()[f"{_create.__module__}.{_create.__qualname__}"]
+        self.assertEqual(stats.calls, 2)
+        self.assertEqual(stats.sampled_calls, 1)
+
+    def test_keyed_cache_missing_key(self):
+        with self.assertRaises(ValueError):
+            @keyed_cache("url")
+            def _create(payload: dict) -> int:
+                return len(payload)
+
+    def test_cache_key(self):
+        self.assertEqual(cache_key("https://example.com/1", {"a": 1}), "https://example.com/1")
+        self.assertEqual(cache_key(None, {"a": 1}), cache_key(None, {"a": 1}))
+        self.assertNotEqual(cache_key(None, {"a": 1}), cache_key(None, {"a": 2}))
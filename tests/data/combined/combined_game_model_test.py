@@ -6,6 +6,7 @@ import unittest
 import requests_mock
 import requests_cache
 from sportsball.data.combined.combined_game_model import create_combined_game_model
+from sportsball.data.combined.identity_table import IdentityTable
 from sportsball.data.league import League
 from sportsball.data.season_type import SeasonType
 from sportsball.data.game_model import GameModel, VERSION
@@ -50,9 +51,9 @@ class TestCombinedGameModel(unittest.TestCase):
             venues_ffill = {}
             combined_game_model = create_combined_game_model(
                 game_models=[game_model],
-                venue_identity_map={},
-                team_identity_map={},
-                player_identity_map={},
+                venue_identities=IdentityTable("venue", {}),
+                team_identities=IdentityTable("team", {}),
+                player_identities=IdentityTable("player", {}),
                 session=self._session,
                 names=names,
                 coach_names=coach_names,
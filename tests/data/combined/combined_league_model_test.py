@@ -0,0 +1,135 @@
+"""Tests for the combined league model class."""
+
+import datetime
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sportsball.data.combined.combined_league_model import stream_game_groups
+from sportsball.data.combined.game_match_index import GameMatchIndex
+from sportsball.data.combined.identity_table import IdentityTable
+from sportsball.playwright import BrowserPool
+
+
+class _FakeLeagueModel:
+
+    def __init__(self, days, disorder=None, block_after=None):
+        self._days = days
+        self._disorder = disorder
+        self._block_after = block_after
+        self.release = threading.Event()
+
+    def name(self):
+        return "fake"
+
+    def date_disorder(self):
+        return self._disorder
+
+    @property
+    def games(self):
+        for count, day in enumerate(self._days):
+            if count == self._block_after:
+                self.release.wait(10.0)
+            yield SimpleNamespace(dt=datetime.datetime(2024, 1, day, 12), teams=[])
+
+
+class _BrowsingLeagueModel(_FakeLeagueModel):
+
+    def __init__(self, days, pool):
+        super().__init__(days, disorder=datetime.timedelta(days=0))
+        self._pool = pool
+
+    @property
+    def games(self):
+        for game in super().games:
+            with self._pool.page():
+                pass
+            yield game
+
+
+class _FakeBrowser:
+
+    def __init__(self):
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def new_context(self):
+        return SimpleNamespace(route=lambda *args: None, new_page=object, close=lambda: None)
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeBrowserPool(BrowserPool):
+
+    def __init__(self):
+        super().__init__()
+        self.browsers = []
+
+    def _browser(self, thread_browser):
+        if thread_browser.browser is None:
+            thread_browser.browser = _FakeBrowser()
+            self.browsers.append(thread_browser.browser)
+        return thread_browser.browser
+
+
+class TestStreamGameGroups(unittest.TestCase):
+
+    def test_groups_in_date_order(self):
+        league_models = [
+            _FakeLeagueModel([5, 1, 3]),
+            _FakeLeagueModel([1, 3, 5, 7], disorder=datetime.timedelta(days=0)),
+        ]
+        groups = list(
+            stream_game_groups(league_models, GameMatchIndex(IdentityTable("team", {})))
+        )
+        self.assertEqual(
+            [(x[0].dt.day, len(x)) for x in groups], [(1, 2), (3, 2), (5, 2), (7, 1)]
+        )
+
+    def test_streams_before_finishing(self):
+        blocked = _FakeLeagueModel(
+            [1, 10, 20], disorder=datetime.timedelta(days=0), block_after=2
+        )
+        league_models = [
+            blocked,
+            _FakeLeagueModel([1, 10, 20], disorder=datetime.timedelta(days=0)),
+        ]
+        groups = stream_game_groups(
+            league_models, GameMatchIndex(IdentityTable("team", {}))
+        )
+        first = next(groups)
+        self.assertEqual((first[0].dt.day, len(first)), (1, 2))
+        self.assertFalse(blocked.release.is_set())
+        blocked.release.set()
+        self.assertEqual([(x[0].dt.day, len(x)) for x in groups], [(10, 2), (20, 2)])
+
+    def test_groups_within_tolerance(self):
+        league_models = [
+            _FakeLeagueModel([1, 5], disorder=datetime.timedelta(days=0)),
+            _FakeLeagueModel([2, 5], disorder=datetime.timedelta(days=0)),
+        ]
+        groups = list(
+            stream_game_groups(league_models, GameMatchIndex(IdentityTable("team", {})))
+        )
+        self.assertEqual(
+            [sorted(y.dt.day for y in x) for x in groups], [[1, 2], [5, 5]]
+        )
+
+    def test_closes_worker_browsers(self):
+        pool = _FakeBrowserPool()
+        league_models = [
+            _BrowsingLeagueModel([1, 3], pool),
+            _BrowsingLeagueModel([1, 3], pool),
+        ]
+        with patch("sportsball.data.combined.combined_league_model.BROWSER_POOL", pool):
+            groups = list(
+                stream_game_groups(league_models, GameMatchIndex(IdentityTable("team", {})))
+            )
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(len(pool.browsers), 2)
+        self.assertTrue(all(x.closed for x in pool.browsers))
+        self.assertEqual(pool.open_threads, 0)
@@ -6,6 +6,7 @@ import unittest
 import requests_mock
 import requests_cache
 from sportsball.data.combined.combined_team_model import create_combined_team_model
+from sportsball.data.combined.identity_table import IdentityTable
 from sportsball.data.team_model import TeamModel, VERSION
 from sportsball.data.player_model import PlayerModel, VERSION as PLAYER_VERSION
 from sportsball.data.species import Species
@@ -1554,7 +1555,7 @@ class TestCombinedTeamModel(unittest.TestCase):
             team_model = create_combined_team_model(
                 team_models=team_models,
                 identifier="a",
-                player_identity_map={},
+                player_identities=IdentityTable("player", {}),
                 names=names,
                 coach_names=coach_names,
                 player_ffill=player_ffill,
@@ -3090,7 +3091,7 @@ class TestCombinedTeamModel(unittest.TestCase):
             team_model_2 = create_combined_team_model(
                 team_models=team_models_2,
                 identifier="a",
-                player_identity_map={},
+                player_identities=IdentityTable("player", {}),
                 names=names,
                 coach_names=coach_names,
                 player_ffill=player_ffill,
@@ -4635,7 +4636,7 @@ class TestCombinedTeamModel(unittest.TestCase):
             team_model = create_combined_team_model(
                 team_models=team_models,
                 identifier="a",
-                player_identity_map={},
+                player_identities=IdentityTable("player", {}),
                 names=names,
                 coach_names=coach_names,
                 player_ffill=player_ffill,
@@ -6171,7 +6172,7 @@ class TestCombinedTeamModel(unittest.TestCase):
             team_model_2 = create_combined_team_model(
                 team_models=team_models_2,
                 identifier="a",
-                player_identity_map={},
+                player_identities=IdentityTable("player", {}),
                 names=names,
                 coach_names=coach_names,
                 player_ffill=player_ffill,
@@ -6842,7 +6843,7 @@ class TestCombinedTeamModel(unittest.TestCase):
         team_model = create_combined_team_model(
             team_models=team_models,
             identifier="a",
-            player_identity_map={},
+            player_identities=IdentityTable("player", {}),
             names=names,
             coach_names=coach_names,
             player_ffill=player_ffill,
@@ -7498,7 +7499,7 @@ class TestCombinedTeamModel(unittest.TestCase):
         next_team_model = create_combined_team_model(
             team_models=next_team_models,
             identifier="a",
-            player_identity_map={},
+            player_identities=IdentityTable("player", {}),
             names=names,
             coach_names=coach_names,
             player_ffill=player_ffill,
@@ -0,0 +1,65 @@
+"""Tests for the game match index class."""
+
+import datetime
+import unittest
+from types import SimpleNamespace
+
+from sportsball.data.combined.game_match_index import GameMatchIndex
+from sportsball.data.combined.identity_table import IdentityTable
+
+
+def _game(day, *teams):
+    return SimpleNamespace(
+        dt=datetime.datetime(2024, 1, day, 12),
+        teams=[SimpleNamespace(identifier=x, name=x) for x in teams],
+    )
+
+
+class TestGameMatchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self._index = GameMatchIndex(
+            IdentityTable("team", {"a": "A", "b": "B", "espn-a": "A", "espn-b": "B"})
+        )
+
+    def test_matches_within_tolerance(self):
+        group = self._index.add(_game(5, "a", "b"), 0)
+        later = self._index.add(_game(6, "espn-b", "espn-a"), 1)
+        apart = self._index.add(_game(8, "espn-a", "espn-b"), 2)
+        self.assertEqual(self._index.flush(group), [group, later])
+        self.assertEqual(self._index.flush(apart), [apart])
+        self.assertEqual(self._index.stats.tolerance_matches, 1)
+        self.assertEqual(self._index.stats.groups, 2)
+
+    def test_series_stay_apart(self):
+        monday = self._index.add(_game(1, "a", "b"), 0)
+        tuesday = self._index.add(_game(2, "a", "b"), 0)
+        self.assertNotEqual(monday, tuesday)
+        self.assertEqual(self._index.add(_game(2, "espn-a", "espn-b"), 1), tuesday)
+        self.assertEqual(self._index.add(_game(1, "espn-a", "espn-b"), 1), monday)
+        self.assertEqual(self._index.stats.exact_matches, 2)
+        self.assertEqual(self._index.flush(monday), [monday])
+        self.assertEqual(self._index.flush(tuesday), [tuesday])
+
+    def test_series_in_reversed_order(self):
+        tuesday = self._index.add(_game(2, "a", "b"), 0)
+        monday = self._index.add(_game(1, "espn-a", "espn-b"), 1)
+        self.assertNotEqual(monday, tuesday)
+        self.assertEqual(self._index.add(_game(1, "a", "b"), 0), monday)
+        self.assertEqual(self._index.add(_game(2, "espn-a", "espn-b"), 1), tuesday)
+        self.assertEqual(self._index.flush(monday), [monday])
+        self.assertEqual(self._index.flush(tuesday), [tuesday])
+        self.assertEqual(self._index.stats.tolerance_matches, 0)
+
+    def test_same_source_duplicates(self):
+        group = self._index.add(_game(5, "a", "b"), 0)
+        self.assertEqual(self._index.add(_game(5, "a", "b"), 0), group)
+
+    def test_flush(self):
+        group = self._index.add(_game(5, "a", "b"), 0)
+        self._index.flush(group)
+        self.assertNotEqual(self._index.add(_game(5, "espn-a", "espn-b"), 1), group)
+
+    def test_unresolved_teams(self):
+        self._index.add(_game(5, "a", "c"), 0)
+        self.assertEqual(self._index.stats.unresolved_teams, 1)
@@ -0,0 +1,23 @@
+"""Tests for the identity table class."""
+import unittest
+
+from sportsball.data.combined.identity_table import IdentityTable
+
+
+class TestIdentityTable(unittest.TestCase):
+
+    def setUp(self):
+        self._identities = IdentityTable("team", {"espn-1": "1", "nba-1": "1"})
+
+    def test_resolve(self):
+        self.assertEqual(self._identities.resolve("espn-1"), "1")
+        self.assertIsNone(self._identities.resolve("espn-2", "Team 2"))
+        self._identities.resolve("espn-2", "Team 2")
+        self.assertEqual(self._identities.lookups, 3)
+        self.assertEqual(dict(self._identities.misses), {"espn-2": 2})
+
+    def test_log_stats(self):
+        self._identities.resolve("espn-2", "Team 2")
+        with self.assertLogs(level="WARNING") as logs:
+            self._identities.log_stats()
+        self.assertIn("espn-2 for team Team 2", logs.output[0])
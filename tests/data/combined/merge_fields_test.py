@@ -0,0 +1,56 @@
+"""Tests for the merge fields function."""
+import datetime
+import unittest
+
+from sportsball.data.combined.merge_fields import merge_fields
+from sportsball.data.combined.most_interesting import more_interesting
+from sportsball.data.game_model import GameModel
+from sportsball.data.player_model import PlayerModel
+
+
+def _game(**kwargs):
+    values = dict.fromkeys(GameModel.model_fields)
+    values.update(kwargs)
+    return GameModel.model_construct(**values)
+
+
+def _player(**kwargs):
+    values = dict.fromkeys(PlayerModel.model_fields)
+    values.update(kwargs)
+    return PlayerModel.model_construct(**values)
+
+
+class TestMergeFields(unittest.TestCase):
+
+    def test_matches_more_interesting(self):
+        games = [
+            _game(attendance=0, distance=float("nan"), postponed=False, year=2024),
+            _game(attendance=100, distance=1.5, postponed=True, week=3),
+            _game(
+                attendance=200,
+                end_dt=datetime.datetime(2024, 1, 1),
+                pot=2.0,
+            ),
+            _game(end_dt=datetime.datetime(2024, 1, 1, 14, 30), pot=0.0),
+        ]
+        fields = merge_fields(games, GameModel, frozenset({"dt", "version"}))
+        for name, value in fields.items():
+            expected = None
+            for game in games:
+                expected = more_interesting(expected, getattr(game, name))
+            self.assertEqual(value, expected, name)
+        self.assertEqual(fields["attendance"], 100)
+        self.assertEqual(fields["end_dt"], datetime.datetime(2024, 1, 1, 14, 30))
+
+    def test_exclude(self):
+        fields = merge_fields([_game(year=2024)], GameModel, frozenset({"year"}))
+        self.assertNotIn("year", fields)
+        self.assertIn("week", fields)
+
+    def test_default_factory(self):
+        players = [_player(name="Winx", sex=None), _player(name="Winx", sex="female")]
+        fields = merge_fields(players, PlayerModel, frozenset({"total_rebounds"}))
+        self.assertEqual(fields["sex"], "female")
+        self.assertNotIn("total_rebounds", fields)
+        fields = merge_fields(players[:1], PlayerModel)
+        self.assertNotIn("sex", fields)
@@ -0,0 +1,41 @@
+"""Tests for the null check function."""
+import datetime
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from sportsball.data.combined.null_check import is_null
+from sportsball.data.season_type import SeasonType
+
+
+class TestNullCheck(unittest.TestCase):
+
+    def test_null(self):
+        for value in [
+            None,
+            float("nan"),
+            np.float32("nan"),
+            pd.NaT,
+            np.datetime64("NaT"),
+            np.timedelta64("NaT"),
+            [float("nan")],
+        ]:
+            self.assertTrue(is_null(value), repr(value))
+
+    def test_not_null(self):
+        for value in [
+            0,
+            False,
+            0.0,
+            np.int64(0),
+            "",
+            datetime.datetime(2024, 1, 1),
+            datetime.date(2024, 1, 1),
+            pd.Timestamp("2024-01-01"),
+            np.datetime64("2024-01-01"),
+            SeasonType.REGULAR,
+            [],
+            {},
+        ]:
+            self.assertFalse(is_null(value), repr(value))
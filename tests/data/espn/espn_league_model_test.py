@@ -0,0 +1,146 @@
+"""Tests for the ESPN league model class."""
+import datetime
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import requests_mock
+from scrapesession.scrapesession import ScrapeSession
+
+from sportsball.data.combined.combined_league_model import stream_game_groups
+from sportsball.data.combined.game_match_index import GameMatchIndex
+from sportsball.data.combined.identity_table import IdentityTable
+from sportsball.data.espn.espn_league_model import ESPNLeagueModel
+from sportsball.data.nba.espn.nba_espn_league_model import NBAESPNLeagueModel
+from sportsball.prefetch import Prefetcher
+
+_SEASONS_URL = "http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/seasons?limit=100"
+
+
+class _OtherLeagueModel:
+
+    def __init__(self, years):
+        self._years = years
+
+    def name(self):
+        return "other"
+
+    def date_disorder(self):
+        return datetime.timedelta(days=0)
+
+    @property
+    def games(self):
+        for year in self._years:
+            yield SimpleNamespace(dt=datetime.datetime(year, 1, 1, 12), teams=[])
+
+
+class TestESPNLeagueModel(unittest.TestCase):
+
+    def setUp(self):
+        self.session = ScrapeSession(backend="memory")
+        self.release = threading.Event()
+
+    def _mock_seasons(self, m):
+        for page, year in [(1, 2024), (2, 2023)]:
+            season_url = f"http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/seasons/{year}"
+            m.get(
+                _SEASONS_URL + f"&page={page}",
+                json={"items": [{"$ref": season_url}], "pageCount": 2},
+            )
+            m.get(season_url, json={"types": {"items": [{"$ref": season_url + "/types/2"}]}})
+            m.get(season_url + "/types/2", json={"year": year})
+
+    def _produce_week_games(self, season_type_json, page, pbar, cache_disabled):
+        year = season_type_json["year"]
+        if year == 2024:
+            self.release.wait(10.0)
+        yield SimpleNamespace(dt=datetime.datetime(year, 1, 1, 12), teams=[], page=page, cache_disabled=cache_disabled)
+
+    def test_games_in_date_order(self):
+        self.release.set()
+        league_model = NBAESPNLeagueModel(self.session)
+        with requests_mock.Mocker() as m, patch.object(
+            ESPNLeagueModel, "_produce_week_games", side_effect=self._produce_week_games
+        ):
+            self._mock_seasons(m)
+            games = list(league_model.games)
+        self.assertEqual(
+            [(x.dt.year, x.page, x.cache_disabled) for x in games],
+            [(2023, 2, False), (2024, 1, True)],
+        )
+
+    def test_prefetch_limits(self):
+        limits = []
+
+        class _Prefetcher(Prefetcher):
+
+            def __init__(self, session, max_in_flight, requests_per_second):
+                super().__init__(session, max_in_flight=max_in_flight, requests_per_second=requests_per_second)
+                limits.append((max_in_flight, requests_per_second))
+
+        self.release.set()
+        with requests_mock.Mocker() as m, patch.object(
+            ESPNLeagueModel, "_produce_week_games", side_effect=self._produce_week_games
+        ), patch("sportsball.prefetch.Prefetcher", _Prefetcher), patch("sportsball.prefetch.MAX_IN_FLIGHT", 3):
+            self._mock_seasons(m)
+            league_model = NBAESPNLeagueModel(self.session, requests_per_second=0.0)
+            list(league_model.games)
+            self.assertIs(league_model.session, self.session)
+        self.assertEqual(limits, [(3, 0.0)])
+
+    def test_date_disorder(self):
+        self.assertEqual(NBAESPNLeagueModel.date_disorder(), datetime.timedelta(days=7))
+
+    def test_streams_before_finishing(self):
+        league_models = [NBAESPNLeagueModel(self.session), _OtherLeagueModel([2023, 2024])]
+        with requests_mock.Mocker() as m, patch.object(
+            ESPNLeagueModel, "_produce_week_games", side_effect=self._produce_week_games
+        ):
+            self._mock_seasons(m)
+            groups = stream_game_groups(
+                league_models, GameMatchIndex(IdentityTable("team", {}))
+            )
+            first = next(groups)
+            self.assertEqual((first[0].dt.year, len(first)), (2023, 2))
+            self.assertFalse(self.release.is_set())
+            self.release.set()
+            self.assertEqual([(x[0].dt.year, len(x)) for x in groups], [(2024, 2)])
+
+    def test_skipped_competitions_discard_prefetches(self):
+        league_model = NBAESPNLeagueModel(self.session)
+        competition_url = "http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/events/1/competitions/1"
+        competitions = [
+            {
+                "$ref": competition_url,
+                "status": {"$ref": competition_url + "/status"},
+                "odds": {"$ref": competition_url + "/odds"},
+                "officials": {"$ref": competition_url + "/officials"},
+            },
+            {
+                "$ref": competition_url.replace("/1/competitions/1", "/2/competitions/2"),
+                "odds": {"$ref": competition_url.replace("/1/competitions/1", "/2/competitions/2") + "/odds"},
+            },
+        ]
+        league_model._found_games = {competitions[1]["$ref"]}
+        with self.session.wayback_disabled(), requests_mock.Mocker() as m, Prefetcher(self.session, requests_per_second=None) as prefetcher:
+            m.get(competition_url + "/status", json={"type": {"completed": False}})
+            m.get(competition_url + "/odds", json={})
+            m.get(competition_url + "/officials", json={})
+            m.get(competitions[1]["odds"]["$ref"], json={})
+            league_model._prefetcher = prefetcher
+            try:
+                games = list(
+                    league_model._produce_game(
+                        cache_disabled=False,
+                        event_item={"competitions": competitions},
+                        week_count=0,
+                        game_number=0,
+                        season_type_json={},
+                        pbar=MagicMock(),
+                    )
+                )
+                self.assertFalse(games)
+                self.assertFalse(prefetcher._futures)
+            finally:
+                prefetcher._executor.shutdown(wait=True)
@@ -0,0 +1,51 @@
+"""Tests for the ESPN statistics table."""
+import unittest
+
+from sportsball.data.espn.espn_statistics import (StatisticsTable, stat_clock,
+                                                  stat_int, stat_optional,
+                                                  stat_value)
+
+
+class TestStatisticsTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = StatisticsTable(
+            {
+                "points": ("points", stat_value),
+                "score": ("points", stat_value),
+                "hits": ("hits", stat_int),
+                "shutouts": ("shutouts", stat_optional),
+                "timeBetweenFights": ("time_between_fights", stat_clock),
+                "ignored": None,
+            }
+        )
+
+    def test_empty(self):
+        self.assertEqual(
+            self.table.empty(),
+            {"points": None, "hits": None, "shutouts": None, "time_between_fights": None},
+        )
+
+    def test_decode(self):
+        values = self.table.empty()
+        self.table.decode(
+            values,
+            [
+                {"stats": [{"name": "points", "value": 0.0}, {"name": "hits", "displayValue": "3"}]},
+                {"stats": [{"name": "score", "value": 12.0}, {"name": "shutouts"}]},
+                {"stats": [{"name": "timeBetweenFights", "displayValue": "2:30"}, {"name": "ignored"}]},
+            ],
+            "http://espn",
+        )
+        self.assertEqual(
+            values,
+            {"points": 12.0, "hits": 3, "shutouts": None, "time_between_fights": 150.0},
+        )
+
+    def test_decode_unknown(self):
+        with self.assertRaises(ValueError):
+            self.table.decode(self.table.empty(), [{"stats": [{"name": "unknown"}]}], "http://espn")
+
+    def test_decode_missing_value(self):
+        with self.assertRaises(KeyError):
+            self.table.decode(self.table.empty(), [{"stats": [{"name": "points"}]}], "http://espn")
@@ -0,0 +1,33 @@
+"""Tests for the footballdata league model class."""
+import datetime
+import unittest
+
+import requests_cache
+from sportsball.data.epl.footballdata.epl_footballdata_league_model import EPLFootballDataLeagueModel
+
+
+class TestFootballDataLeagueModel(unittest.TestCase):
+
+    def setUp(self):
+        self.session = requests_cache.CachedSession(backend="memory")
+        self.league_model = EPLFootballDataLeagueModel(self.session)
+
+    def test_games_frame(self):
+        df = self.league_model._games_frame(
+            "\ufeffDiv,Date,Time,HomeTeam,AwayTeam,FTHG,FTAG,Referee,HS,B365H\n"
+            "E0,08/10/2024,20:00, Man United ,Fulham,1,0,,14,1.6\n"
+            "E1,08/10/2024,20:00,Leeds,Portsmouth,3,3,S Barrott,20,1.3\n"
+            "E0,,,,,,,,,\n"
+            "E0,08/17/2024,12:30,Ipswich,Liverpool,0,2,S Attwell,7,8.5,extra\n"
+        )
+        games = df.to_dict("records")
+        self.assertEqual(len(games), 2)
+        self.assertEqual(games[0]["dt"], datetime.datetime(2024, 8, 10, 20, 0))
+        self.assertEqual(games[0]["home_team"], "Man United")
+        self.assertIsNone(games[0]["referee"])
+        self.assertIsNone(games[0]["away_shots"])
+        self.assertEqual(games[1]["home_odds"], "8.5")
+
+    def test_games_frame_no_division(self):
+        df = self.league_model._games_frame("Date,HomeTeam\n08/10/2024,Fulham\n")
+        self.assertTrue(df.empty)
@@ -0,0 +1,40 @@
+"""Tests for the frame builder class."""
+import unittest
+
+import pandas as pd
+
+from sportsball.data.frame_builder import FrameBuilder
+
+
+class TestFrameBuilder(unittest.TestCase):
+
+    def test_build(self):
+        rows = [
+            {"a": 1, "b": "x"},
+            {"a": 2, "c": 1.5},
+            {"a": 3, "b": "y", "d": True},
+            {"a": 4, "c": 2, "e": 10},
+            {"a": 5, "f": None},
+        ]
+        builder = FrameBuilder(chunk_size=2)
+        for row in rows:
+            builder.append(row)
+        self.assertEqual(builder.columns, {"a", "b", "c", "d", "e", "f"})
+        df = pd.DataFrame(builder.build())
+        expected = pd.DataFrame(
+            {col: [row.get(col) for row in rows] for col in "abcdef"}
+        )
+        self.assertEqual(df["a"].dtype, expected["a"].dtype)
+        self.assertEqual(df["c"].dtype, expected["c"].dtype)
+        self.assertEqual(df["e"].dtype, expected["e"].dtype)
+        self.assertEqual(df["b"].tolist(), expected["b"].tolist())
+        self.assertEqual(df["d"].tolist(), expected["d"].tolist())
+        pd.testing.assert_frame_equal(
+            df[["a", "c", "e"]], expected[["a", "c", "e"]]
+        )
+
+    def test_mixed_column(self):
+        builder = FrameBuilder(chunk_size=1)
+        builder.append({"a": 1})
+        builder.append({"a": "x"})
+        self.assertEqual(builder.build()["a"].tolist(), [1, "x"])
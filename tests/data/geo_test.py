@@ -0,0 +1,100 @@
+"""Tests for the geo service."""
+import os
+import tempfile
+import threading
+import unittest
+
+import requests
+import requests_mock
+
+from sportsball.data.geo import GEO_SERVICE, GeoService
+
+
+class TestGeoService(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, "geo.sqlite")
+        self._session = requests.Session()
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_timezone(self):
+        geo_service = GeoService(self._path)
+        self.assertEqual(geo_service.timezone(-33.8915, 151.2767), "Australia/Sydney")
+        self.assertEqual(
+            GeoService(self._path).timezone(-33.8915, 151.2767), "Australia/Sydney"
+        )
+
+    def test_altitude_batches(self):
+        geo_service = GeoService(self._path)
+        geo_service.queue_altitudes([(40.0, -105.0)])
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m?locations=39.7392,-104.9903|40.0,-105.0",
+                json={"results": [{"elevation": 1609.0}, {"elevation": 1655.0}]},
+            )
+            self.assertEqual(geo_service.altitude(self._session, 39.7392, -104.9903), 1609.0)
+            self.assertEqual(geo_service.altitude(self._session, 40.0, -105.0), 1655.0)
+            self.assertEqual(m.call_count, 1)
+        self.assertEqual(
+            GeoService(self._path).altitude(self._session, 40.0, -105.0), 1655.0
+        )
+
+    def test_altitude_failed_batch(self):
+        geo_service = GeoService(self._path)
+        geo_service.queue_altitudes([(91.0, -105.0)])
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m?locations=39.7392,-104.9903|91.0,-105.0",
+                status_code=400,
+            )
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m?locations=39.7392,-104.9903",
+                json={"results": [{"elevation": 1609.0}]},
+            )
+            self.assertEqual(geo_service.altitude(self._session, 39.7392, -104.9903), 1609.0)
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m?locations=40.0,-105.0|91.0,-105.0",
+                status_code=400,
+            )
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m?locations=40.0,-105.0",
+                json={"results": [{"elevation": 1655.0}]},
+            )
+            self.assertEqual(geo_service.altitude(self._session, 40.0, -105.0), 1655.0)
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m?locations=41.0,-105.0",
+                json={"results": [{"elevation": 1700.0}]},
+            )
+            self.assertEqual(geo_service.altitude(self._session, 41.0, -105.0), 1700.0)
+            self.assertEqual(m.call_count, 5)
+
+    def test_altitude_request_outside_lock(self):
+        geo_service = GeoService(self._path)
+        started = threading.Event()
+        release = threading.Event()
+
+        def elevation(request, context):
+            started.set()
+            release.wait(10.0)
+            return {"results": [{"elevation": 1609.0}]}
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m?locations=39.7392,-104.9903",
+                json=elevation,
+            )
+            thread = threading.Thread(
+                target=geo_service.altitude, args=(self._session, 39.7392, -104.9903)
+            )
+            thread.start()
+            self.assertTrue(started.wait(10.0))
+            self.assertEqual(geo_service.timezone(-33.8915, 151.2767), "Australia/Sydney")
+            release.set()
+            thread.join()
+        self.assertEqual(geo_service.altitude(self._session, 39.7392, -104.9903), 1609.0)
+
+    def test_in_memory_under_test(self):
+        self.assertIsNone(GEO_SERVICE._path)
@@ -1,8 +1,10 @@
 """Tests for the google address model class."""
 import datetime
 import unittest
+from unittest.mock import patch
 
 from scrapesession.scrapesession import ScrapeSession
+from sportsball.data.geo import GeoService, location_key
 from sportsball.data.google.google_address_model import create_google_address_model
 
 
@@ -15,3 +17,12 @@ class TestGoogleAddressModel(unittest.TestCase):
         dt = datetime.datetime(2010, 10, 10, 10, 10, 00)
         address_model = create_google_address_model("Imperial Arena at Atlantis Resort, Nassau", self.session, dt)
         self.assertEqual(address_model.city, "Nassau")
+
+    def test_queues_only_resolved_altitude(self):
+        geo_service = GeoService(None)
+        with patch("sportsball.data.google.google_address_model.GEO_SERVICE", geo_service):
+            address_model = create_google_address_model("Imperial Arena at Atlantis Resort, Nassau", self.session, None)
+        self.assertEqual(
+            list(geo_service._queued),
+            [location_key(address_model.latitude, address_model.longitude)],
+        )
@@ -0,0 +1,29 @@
+"""Tests for the venue index."""
+import hashlib
+import unittest
+
+from sportsball.data.google.venue_index import VENUE_INDEX, VENUE_JSON
+
+
+class TestVenueIndex(unittest.TestCase):
+
+    def test_index_is_current(self):
+        with open(VENUE_JSON, "rb") as handle:
+            source_hash = hashlib.sha256(handle.read()).hexdigest()
+        self.assertEqual(VENUE_INDEX.source_hash(), source_hash)
+
+    def test_search(self):
+        geocode = VENUE_INDEX.search("S.C.G. -&nbsp;Australia\n")
+        self.assertEqual(geocode.city, "Moore Park")
+        self.assertEqual(VENUE_INDEX.search("scg"), geocode)
+        self.assertIsNone(VENUE_INDEX.search("Not a venue anywhere"))
+
+    def test_venue_at(self):
+        venue = VENUE_INDEX.venue_at(-33.8915316, 151.2248515)
+        self.assertEqual(venue["city"], "Moore Park")
+        self.assertIsNone(VENUE_INDEX.venue_at(-33.8915, 151.2248))
+
+    def test_nearest(self):
+        venue = VENUE_INDEX.nearest(-33.8915, 151.2248)
+        self.assertEqual(venue["lat"], -33.8915316)
+        self.assertIsNone(VENUE_INDEX.nearest(0.0, -140.0, max_distance_km=10.0))
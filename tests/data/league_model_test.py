@@ -0,0 +1,55 @@
+"""Tests for the league model class."""
+import unittest
+
+import pandas as pd
+
+from sportsball.data.league_model import _normalize_tz
+
+
+class TestLeagueModel(unittest.TestCase):
+
+    def test_normalize_tz(self):
+        df = pd.DataFrame(
+            {
+                "dt": pd.to_datetime(
+                    ["2023-01-01 15:00", "2023-01-01 15:00", "2023-01-01 15:00"],
+                    utc=True,
+                ),
+                "venue/address/timezone": [
+                    "America/New_York",
+                    "Australia/Sydney",
+                    None,
+                ],
+                "points": [1, 2, 3],
+            }
+        )
+        df = _normalize_tz(df)
+        self.assertEqual(len(df), 2)
+        self.assertEqual(
+            df["dt"].tolist(),
+            [
+                pd.Timestamp("2023-01-01 10:00", tz="America/New_York"),
+                pd.Timestamp("2023-01-02 02:00", tz="Australia/Sydney"),
+            ],
+        )
+        self.assertEqual(df["points"].tolist(), [1, 2])
+
+    def test_normalize_tz_mixed_timezones(self):
+        df = pd.DataFrame(
+            {
+                "dt": pd.to_datetime(["2023-01-01 15:00", "2023-01-01 15:00"], utc=True),
+                "kickoff": pd.Series(
+                    [
+                        pd.Timestamp("2023-01-01 10:00", tz="America/New_York"),
+                        pd.Timestamp("2023-01-01 15:00", tz="Europe/London"),
+                    ],
+                    dtype=object,
+                ),
+                "venue/address/timezone": ["America/New_York", "Australia/Sydney"],
+            }
+        )
+        df = _normalize_tz(df)
+        self.assertEqual(
+            [str(x) for x in df["kickoff"]],
+            ["2023-01-01 10:00:00-05:00", "2023-01-02 02:00:00+11:00"],
+        )
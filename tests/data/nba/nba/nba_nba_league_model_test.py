@@ -1,8 +1,10 @@
 """Tests for the NBA NBA league model class."""
+import datetime
 import unittest
 
+import pandas as pd
 import requests_cache
-from sportsball.data.nba.nba.nba_nba_league_model import NBANBALeagueModel
+from sportsball.data.nba.nba.nba_nba_league_model import NBANBALeagueModel, _combine_team_games, _game_records
 from sportsball.data.league import League
 
 
@@ -14,3 +16,21 @@ class TestNBANBATeamModel(unittest.TestCase):
 
     def test_league(self):
         self.assertEqual(self.league_model.league, League.NBA)
+
+    def test_game_records(self):
+        df = pd.DataFrame({
+            "SEASON_ID": ["22024", "22024", "22024", "22024"],
+            "TEAM_ID": [1, 2, 1, 3],
+            "GAME_ID": ["1", "1", "2", "2"],
+            "GAME_DATE": ["2024-10-22", "2024-10-22", "2024-11-05", "2024-11-05"],
+            "MATCHUP": ["A vs. B", "B @ A", "A @ C", "C vs. A"],
+            "PTS": [100.0, 90.0, 95.0, 105.0],
+        })
+        seasons = {"22024": {"start": datetime.datetime(2024, 10, 15), "games": 3}}
+        records = list(_game_records(_combine_team_games(df), seasons))
+        self.assertEqual([x[0]["TEAM_ID_A"] for x in records], [1, 3])
+        self.assertEqual([x[0]["TEAM_ID_B"] for x in records], [2, 1])
+        self.assertEqual(records[1][1], datetime.datetime(2024, 11, 5))
+        self.assertEqual([x[2] for x in records], [1, 3])
+        self.assertEqual([x[3] for x in records], [3, 4])
+        self.assertEqual(seasons["22024"]["games"], 5)
@@ -0,0 +1,53 @@
+"""Tests for the sportsreference document class."""
+import os
+import unittest
+from unittest.mock import patch
+
+import requests
+import requests_mock
+from sportsball.data.sportsreference import sportsreference_document
+from sportsball.data.sportsreference.sportsreference_document import parse_sportsreference_document
+
+
+class TestSportsReferenceDocument(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = os.path.dirname(__file__)
+        self.url = "https://www.basketball-reference.com/teams/TOR/2025.html"
+        with requests_mock.Mocker() as m:
+            with open(os.path.join(self.dir, "TOR_2025.html"), "rb") as f:
+                m.get(self.url, content=f.read())
+            self.response = requests.get(self.url)
+
+    def test_shared(self):
+        document = parse_sportsreference_document(self.response)
+        self.assertIs(parse_sportsreference_document(self.response), document)
+        self.assertIs(document.soup, document.soup)
+
+    def test_tables(self):
+        document = parse_sportsreference_document(self.response)
+        tables = document.tables
+        self.assertEqual(len(tables), 3)
+        columns = tables[0].columns
+        tables[0].columns = range(len(columns))
+        self.assertTrue(document.tables[0].columns.equals(columns))
+
+    def test_changed_page(self):
+        document = parse_sportsreference_document(self.response)
+        with requests_mock.Mocker() as m:
+            m.get(self.url, text="<html><body></body></html>")
+            response = requests.get(self.url)
+        changed = parse_sportsreference_document(response)
+        self.assertIsNot(changed, document)
+        self.assertIs(parse_sportsreference_document(response), changed)
+
+    def test_bounded_by_text(self):
+        document = parse_sportsreference_document(self.response)
+        other_url = "https://www.basketball-reference.com/teams/ATL/2025.html"
+        with requests_mock.Mocker() as m:
+            m.get(other_url, text="<html><body></body></html>")
+            other_response = requests.get(other_url)
+        with patch.object(sportsreference_document, "_MAX_CACHED_TEXT", len(document.text)):
+            other = parse_sportsreference_document(other_response)
+            self.assertIs(parse_sportsreference_document(other_response), other)
+            self.assertIsNot(parse_sportsreference_document(self.response), document)
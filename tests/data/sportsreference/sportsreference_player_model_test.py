@@ -5,7 +5,7 @@ import unittest
 
 import requests_mock
 from scrapesession.scrapesession import ScrapeSession
-from sportsball.data.sportsreference.sportsreference_player_model import create_sportsreference_player_model
+from sportsball.data.sportsreference.sportsreference_player_model import create_sportsreference_player_model, _parse_sportsreference_player_bio
 from sportsball.data.sex import Sex
 
 
@@ -227,3 +227,13 @@ class TestSportsReferencePlayerModel(unittest.TestCase):
                 box_plus_minus={},
             )
             self.assertEqual(player_model.field_goals, 8)
+
+    def test_bio(self):
+        url = "https://www.basketball-reference.com/players/b/barnesc01.html"
+        with requests_mock.Mocker() as m:
+            with open(os.path.join(self.dir, "barnesc01.html"), "rb") as f:
+                m.get(url, content=f.read())
+            with self.session.cache_disabled():
+                bio = _parse_sportsreference_player_bio(self.session, url, "0.0.1")
+            self.assertEqual(bio.name, "Scottie Barnes")
+            self.assertIsNotNone(bio.birth_date)
@@ -0,0 +1,50 @@
+"""Tests for the spreadsheet functions."""
+import datetime
+import io
+import re
+import unittest
+import zipfile
+
+from openpyxl import Workbook
+
+from sportsball.data.spreadsheet import iter_spreadsheet_rows
+
+
+class TestSpreadsheet(unittest.TestCase):
+
+    def test_iter_spreadsheet_rows(self):
+        workbook = Workbook()
+        ws = workbook.active
+        ws.append(["ATP", "Location", "Date", "Best of"])
+        ws.append([1, "Brisbane", datetime.datetime(2024, 1, 1), 3])
+        ws.append([2, "Doha"])
+        handle = io.BytesIO()
+        workbook.save(handle)
+        self.assertEqual(
+            list(iter_spreadsheet_rows(handle.getvalue())),
+            [
+                ("ATP", "Location", "Date", "Best of"),
+                (1, "Brisbane", datetime.datetime(2024, 1, 1), 3),
+                (2, "Doha", None, None),
+            ],
+        )
+
+    def test_stale_dimensions(self):
+        workbook = Workbook()
+        ws = workbook.active
+        ws.append(["a", "b", "c"])
+        ws.append([1, None, 3])
+        ws.append([2])
+        handle = io.BytesIO()
+        workbook.save(handle)
+        stale = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(handle.getvalue())) as source, zipfile.ZipFile(stale, "w") as target:
+            for name in source.namelist():
+                data = source.read(name)
+                if name == "xl/worksheets/sheet1.xml":
+                    data = re.sub(rb'<dimension ref="[^"]*"/>', b'<dimension ref="A1"/>', data)
+                target.writestr(name, data)
+        self.assertEqual(
+            list(iter_spreadsheet_rows(stale.getvalue())),
+            [("a", "b", "c"), (1, None, 3), (2, None, None)],
+        )
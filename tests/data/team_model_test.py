@@ -1,7 +1,8 @@
 """Tests for the team model class."""
 import unittest
 
-from sportsball.data.team_model import TeamModel, VERSION
+from sportsball.data.player_model import PlayerModel
+from sportsball.data.team_model import TeamModel, VERSION, sum_roster
 
 
 class TestTeamModel(unittest.TestCase):
@@ -658,3 +659,15 @@ class TestTeamModel(unittest.TestCase):
 
     def test_notnull(self):
         self.assertIsNotNone(self._team_model)
+
+    def test_sum_roster(self):
+        fields = dict.fromkeys(PlayerModel.model_fields)
+        players = [
+            PlayerModel.model_construct(**{**fields, "kicks": 3, "forced_fumbles": 1}),
+            PlayerModel.model_construct(**{**fields, "kicks": 4}),
+        ]
+        totals = sum_roster(players)
+        self.assertEqual(totals["kicks"], 7)
+        self.assertIsNone(totals["assists"])
+        self.assertIsInstance(totals["forced_fumbles"], float)
+        self.assertIsNone(sum_roster([])["kicks"])
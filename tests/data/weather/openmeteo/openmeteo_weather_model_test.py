@@ -0,0 +1,85 @@
+"""Tests for the openmeteo weather model class."""
+import datetime
+import unittest
+
+import pandas as pd
+
+from sportsball.data.weather.openmeteo.openmeteo_weather_model import (
+    _season_covers, _season_range, _slice_openmeteo)
+
+_HOURLY_COLUMNS = [
+    "temperature_2m", "relative_humidity_2m", "dew_point_2m", "apparent_temperature",
+    "precipitation_probability", "precipitation", "rain", "showers", "snowfall",
+    "snow_depth", "weather_code", "pressure_msl", "surface_pressure", "cloud_cover",
+    "cloud_cover_low", "cloud_cover_mid", "cloud_cover_high", "visibility",
+    "evapotranspiration", "reference_evapotranspiration", "vapour_pressure_deficit",
+    "wind_speed_10m", "wind_speed_80m", "wind_speed_120m", "wind_speed_180m",
+    "wind_direction_10m", "wind_direction_80m", "wind_direction_120m",
+    "wind_direction_180m", "wind_gusts", "temperature_80m", "temperature_120m",
+    "temperature_180m", "soil_temperature", "soil_temperature_6cm",
+    "soil_temperature_18cm", "soil_temperature_54cm", "soil_moisture",
+    "soil_moisture_1cm", "soil_moisture_3cm", "soil_moisture_9cm", "soil_moisture_27cm",
+]
+_DAILY_COLUMNS = [
+    "weather_code", "temperature_2m_max", "temperature_2m_min",
+    "apparent_temperature_max", "apparent_temperature_min", "sunrise", "sunset",
+    "daylight_duration", "sunshine_duration", "uv_index_max", "uv_index_clear_sky_max",
+    "rain_sum", "showers_sum", "snowfall_sum", "precipitation_sum",
+    "precipitation_hours", "precipitation_probability_max", "wind_speed_10m_max",
+    "wind_gusts_10m_max", "wind_direction_10m_dominant", "shortwave_radiation_sum",
+    "et0_fao_evapotranspiration",
+]
+
+
+class TestOpenmeteoWeatherModel(unittest.TestCase):
+
+    def test_season_range(self):
+        self.assertEqual(
+            _season_range(datetime.date(2023, 11, 15)),
+            (datetime.date(2023, 10, 1), datetime.date(2023, 12, 31)),
+        )
+        self.assertEqual(
+            _season_range(datetime.date(2024, 2, 29)),
+            (datetime.date(2024, 1, 1), datetime.date(2024, 3, 31)),
+        )
+
+    def test_season_covers(self):
+        hourly_df = pd.DataFrame(
+            index=pd.date_range(
+                "2023-10-01", "2023-12-31 23:00", freq="h", tz="America/New_York"
+            ),
+            data={"temperature_2m": 1.0},
+        )
+        self.assertTrue(
+            _season_covers(
+                hourly_df, "America/New_York", datetime.datetime(2023, 11, 15, 19)
+            )
+        )
+        self.assertFalse(
+            _season_covers(
+                hourly_df, "America/New_York", datetime.datetime(2024, 1, 2, 19)
+            )
+        )
+
+    def test_slice_evening_game(self):
+        hourly_index = pd.date_range(
+            "2023-11-01", "2023-11-04 23:00", freq="h", tz="America/New_York"
+        )
+        hourly_df = pd.DataFrame(
+            index=hourly_index, data={x: 1.0 for x in _HOURLY_COLUMNS}
+        )
+        hourly_df["temperature_2m"] = [float(x) for x in range(len(hourly_index))]
+        daily_index = pd.date_range(
+            "2023-11-01", "2023-11-04", freq="D", tz="America/New_York"
+        )
+        daily_df = pd.DataFrame(index=daily_index, data={x: 1.0 for x in _DAILY_COLUMNS})
+        daily_df["temperature_2m_max"] = [float(x.day) for x in daily_index]
+        weather = _slice_openmeteo(
+            hourly_df,
+            daily_df,
+            "America/New_York",
+            datetime.datetime(2023, 11, 2, 19, 30),
+            "0.0.1",
+        )
+        self.assertEqual(weather.daily_maximum_temperature_2m, 2.0)
+        self.assertEqual(weather.temperature, 44.0)
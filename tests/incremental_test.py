@@ -0,0 +1,74 @@
+"""Tests for the incremental module."""
+import datetime
+import unittest
+
+import pandas as pd
+
+from sportsball.incremental import changed_partitions, merge_frames, since_date
+
+
+class TestIncremental(unittest.TestCase):
+
+    def setUp(self):
+        self._previous = pd.DataFrame(
+            {
+                "dt": [
+                    pd.Timestamp("2024-01-01 19:00", tz="America/New_York"),
+                    pd.Timestamp("2024-01-09 19:00", tz="America/New_York"),
+                    pd.Timestamp("2024-01-10 19:00", tz="Australia/Sydney"),
+                ],
+                "points": [1.0, 2.0, None],
+            }
+        )
+
+    def test_since_date(self):
+        self.assertEqual(
+            since_date(self._previous, 7, today=datetime.date(2024, 1, 20)),
+            datetime.date(2024, 1, 3),
+        )
+        self.assertEqual(
+            since_date(self._previous, 7, today=datetime.date(2024, 1, 5)),
+            datetime.date(2023, 12, 29),
+        )
+
+    def test_merge_frames(self):
+        df = pd.DataFrame(
+            {
+                "dt": [
+                    pd.Timestamp("2024-01-08 12:00", tz="America/New_York"),
+                    pd.Timestamp("2024-01-09 19:00", tz="America/New_York"),
+                    pd.Timestamp("2024-01-10 19:00", tz="Australia/Sydney"),
+                ],
+                "points": [5.0, 2.0, 3.0],
+                "attendance": [100, 200, 300],
+            }
+        )
+        merged = merge_frames(self._previous, df, datetime.date(2024, 1, 9))
+        self.assertEqual(merged["points"].tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(merged.columns.tolist(), ["attendance", "dt", "points"])
+
+    def test_merge_frames_empty(self):
+        merged = merge_frames(self._previous, pd.DataFrame(), datetime.date(2024, 1, 9))
+        self.assertEqual(merged["points"].tolist()[:2], [1.0, 2.0])
+        self.assertEqual(len(merged), 3)
+
+    def test_merge_frames_covered(self):
+        df = pd.DataFrame(
+            {
+                "dt": [pd.Timestamp("2024-01-09 12:00", tz="America/New_York")],
+                "points": [5.0],
+            }
+        )
+        merged = merge_frames(self._previous, df, datetime.date(2024, 1, 9))
+        self.assertEqual(merged["points"].tolist()[:3], [1.0, 5.0, 2.0])
+        self.assertEqual(len(merged), 4)
+
+    def test_changed_partitions(self):
+        previous = self._previous.assign(year=[2023.0, 2024.0, 2024.0])
+        df = previous.iloc[2:].assign(points=3.0)
+        merged = merge_frames(previous, df, datetime.date(2024, 1, 9))
+        changed, paths = changed_partitions(
+            merged, previous, df, datetime.date(2024, 1, 9), ["year"]
+        )
+        self.assertEqual(changed["year"].tolist(), [2024.0])
+        self.assertEqual(paths, {"year=2024"})
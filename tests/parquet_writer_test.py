@@ -0,0 +1,70 @@
+"""Tests for the parquet writer module."""
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from sportsball.parquet_writer import write_dataset, write_parquet
+
+
+class TestParquetWriter(unittest.TestCase):
+
+    def setUp(self):
+        self._df = pd.DataFrame(
+            {
+                "dt": pd.to_datetime(
+                    ["2023-01-01", "2023-06-01", "2024-01-01"], utc=True
+                ),
+                "year": [2023, 2023, 2024],
+                "season_type": pd.Categorical(["REGULAR", "POSTSEASON", "REGULAR"]),
+                "points": [1.0, None, 3.0],
+            }
+        )
+        self._df.attrs["points"] = ["points"]
+
+    def test_write_parquet(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "out.parquet")
+            write_parquet(self._df, path, row_group_size=2)
+            self.assertEqual(pq.ParquetFile(path).num_row_groups, 2)
+            df = pd.read_parquet(path)
+            self.assertEqual(df["points"].tolist()[0], 1.0)
+            self.assertEqual(df["season_type"].tolist(), ["REGULAR", "POSTSEASON", "REGULAR"])
+            self.assertEqual(df.attrs, {"points": ["points"]})
+
+    def test_write_dataset(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_dataset(self._df, tmpdir)
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(tmpdir, "year=2023"))),
+                ["season_type=POSTSEASON", "season_type=REGULAR"],
+            )
+            write_dataset(self._df[self._df["year"] == 2024].assign(points=4.0), tmpdir)
+            df = pd.read_parquet(tmpdir)
+            self.assertEqual(len(df), 3)
+            self.assertEqual(sorted(df["points"].dropna().tolist()), [1.0, 4.0])
+
+    def test_write_dataset_new_column(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_dataset(self._df, tmpdir)
+            write_dataset(
+                self._df[self._df["year"] == 2024].assign(attendance=[100]), tmpdir
+            )
+            df = pd.read_parquet(tmpdir)
+            self.assertEqual(len(df), 3)
+            self.assertEqual(df["attendance"].dropna().tolist(), [100])
+
+    def test_write_dataset_clear_partitions(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_dataset(self._df, tmpdir)
+            write_dataset(
+                self._df[self._df["season_type"] == "REGULAR"],
+                tmpdir,
+                clear_partitions={"year=2023/season_type=POSTSEASON"},
+            )
+            self.assertEqual(
+                os.listdir(os.path.join(tmpdir, "year=2023")), ["season_type=REGULAR"]
+            )
+            self.assertEqual(len(pd.read_parquet(tmpdir)), 2)
@@ -0,0 +1,117 @@
+"""Tests for the playwright module."""
+import subprocess
+import sys
+import threading
+import unittest
+
+from sportsball.playwright import BrowserPool
+
+
+class _FakeContext:
+
+    def __init__(self):
+        self.closed = False
+        self.routes = []
+
+    def route(self, url, handler):
+        self.routes.append(url)
+
+    def new_page(self):
+        return object()
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+    def new_context(self):
+        context = _FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+class _FakeBrowserPool(BrowserPool):
+
+    def _browser(self, thread_browser):
+        if thread_browser.browser is None:
+            thread_browser.browser = _FakeBrowser()
+            self.stats.launches += 1
+        return thread_browser.browser
+
+
+class TestBrowserPool(unittest.TestCase):
+
+    def test_reuses_pages(self):
+        pool = _FakeBrowserPool(max_navigations=2)
+        with pool.page() as first_page:
+            pass
+        with pool.page() as second_page:
+            pass
+        with pool.page() as third_page:
+            pass
+        self.assertIs(first_page, second_page)
+        self.assertIsNot(second_page, third_page)
+        self.assertEqual(pool.stats.launches, 1)
+        self.assertEqual(pool.stats.contexts, 2)
+        self.assertEqual(pool.stats.launches_avoided, 2)
+
+    def test_nested_pages(self):
+        pool = _FakeBrowserPool()
+        with pool.page() as outer_page:
+            with pool.page() as inner_page:
+                self.assertIsNot(outer_page, inner_page)
+        self.assertEqual(pool.stats.contexts, 2)
+
+    def test_error_closes_context(self):
+        pool = _FakeBrowserPool()
+        with self.assertRaises(ValueError):
+            with pool.page():
+                raise ValueError("navigation failed")
+        with pool.page():
+            pass
+        self.assertEqual(pool.stats.contexts, 2)
+
+    def test_imports_playwright_lazily(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, sportsball.playwright; print('playwright' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_threads_close_their_own_browsers(self):
+        pool = _FakeBrowserPool()
+        browsers = []
+
+        def work():
+            with pool.page():
+                browsers.append(pool._thread_browser().browser)
+            pool.close()
+
+        with pool.page():
+            pass
+        threads = [threading.Thread(target=work) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(pool.open_threads, 1)
+        self.assertTrue(all(x.closed for x in browsers))
+        pool.close()
+        self.assertEqual(pool.open_threads, 0)
@@ -0,0 +1,119 @@
+"""Tests for the prefetch class."""
+import http.server
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import requests_cache
+import requests_mock
+
+from scrapesession.scrapesession import ScrapeSession
+from sportsball.prefetch import Prefetcher, _HostRateLimiter, _limited_session
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPrefetcher(unittest.TestCase):
+
+    def setUp(self):
+        self._session = requests_cache.CachedSession(backend="memory")
+
+    def test_get(self):
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/1", json={"id": 1})
+            m.get("https://example.com/2", json={"id": 2})
+            with Prefetcher(self._session, requests_per_second=None) as prefetcher:
+                prefetcher.prefetch(["https://example.com/1", "https://example.com/2"])
+                self.assertEqual(prefetcher.get("https://example.com/2").json(), {"id": 2})
+                self.assertEqual(prefetcher.get("https://example.com/1").json(), {"id": 1})
+            self.assertEqual(m.call_count, 2)
+
+    def test_follow(self):
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/event", json={"status": "https://example.com/status"})
+            m.get("https://example.com/status", json={"completed": True})
+            with Prefetcher(self._session, requests_per_second=None) as prefetcher:
+                prefetcher.prefetch(
+                    ["https://example.com/event"],
+                    follow=lambda x: [x.json()["status"]],
+                )
+                prefetcher.get("https://example.com/event")
+                prefetcher.wait(["https://example.com/status"])
+                self.assertEqual(m.call_count, 2)
+                self.assertTrue(self._session.get("https://example.com/status").from_cache)
+
+    def test_cache_disabled(self):
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/1", json={"id": 1})
+            with Prefetcher(self._session, requests_per_second=None) as prefetcher:
+                with prefetcher.session.cache_disabled():
+                    prefetcher.prefetch(["https://example.com/1"])
+                self.assertEqual(m.call_count, 0)
+
+    def test_own_sessions(self):
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/1", json={"id": 1})
+            with Prefetcher(self._session, requests_per_second=None) as prefetcher:
+                with self._session.cache_disabled():
+                    prefetcher.prefetch(["https://example.com/1"])
+                    prefetcher.wait(["https://example.com/1"])
+                self.assertFalse(prefetcher.session.settings.disabled)
+                self.assertTrue(prefetcher.session.get("https://example.com/1").from_cache)
+            self.assertEqual(m.call_count, 1)
+
+    def test_discard(self):
+        release = threading.Event()
+
+        def blocked(request, context):
+            release.wait(10.0)
+            return {"id": 1}
+
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/1", json=blocked)
+            m.get("https://example.com/2", json={"id": 2})
+            with Prefetcher(self._session, max_in_flight=1, requests_per_second=None) as prefetcher:
+                prefetcher.prefetch(["https://example.com/1", "https://example.com/2"])
+                prefetcher.discard(["https://example.com/1", "https://example.com/2"])
+                self.assertFalse(prefetcher._futures)
+                release.set()
+                prefetcher._executor.shutdown(wait=True)
+            self.assertEqual(m.call_count, 1)
+
+    def test_rate_limit(self):
+        limiter = _HostRateLimiter(20.0)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait("https://example.com/1")
+        limiter.wait("https://other.com/1")
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_limited_session(self):
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/1"
+            scrape_session = ScrapeSession(backend="memory")
+            scrape_session._wayback_disabled = True
+            for session in [self._session, scrape_session]:
+                with self.subTest(session=type(session).__name__):
+                    limiter = MagicMock()
+                    limited = _limited_session(session, limiter)
+                    limited.get(url)
+                    limited.get(url)
+                    self.assertEqual(limiter.wait.call_count, 1)
+                    self.assertTrue(session.get(url).from_cache)
+        finally:
+            server.shutdown()
+            thread.join()
@@ -1,8 +1,9 @@
 """Tests for the sportsball class."""
 import unittest
 
-from sportsball.sportsball import SportsBall
+from sportsball.sportsball import SportsBall, league_model_class
 from sportsball.data.league import League
+from sportsball.data.league_model import LeagueModel
 
 
 class TestSportsball(unittest.TestCase):
@@ -13,3 +14,7 @@ class TestSportsball(unittest.TestCase):
     def test_league(self):
         league = self.sportsball.league(League.NFL, None)
         self.assertIsNotNone(league)
+
+    def test_league_model_class(self):
+        for league in League:
+            self.assertTrue(issubclass(league_model_class(league), LeagueModel))